@@ -0,0 +1,41 @@
+import time
+
+import kss
+from kss._utils import multiprocessing
+
+
+def measure(module, texts, repeat, num_workers):
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        module(texts, num_workers=num_workers)
+        elapsed.append(time.perf_counter() - start)
+    elapsed.sort()
+    return elapsed[len(elapsed) // 2] * 1000
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", default="split_sentences,correct_spacing,is_unsafe")
+    parser.add_argument("--batch_sizes", default="2,32,512")
+    parser.add_argument("--num_workers", default=4, type=int)
+    parser.add_argument("--repeat", default=5, type=int)
+    args = parser.parse_args()
+
+    text = "회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요 다만, 강남 토끼정이 강남 쉑쉑버거 골목길로 쭉 올라가야 하는데 다들 쉑쉑버거의 유혹에 넘어갈 뻔 했답니다 강남역 맛집 토끼정의 외부 모습."
+
+    print(f"{'module':<20}{'batch':>8}{'serial (ms)':>14}{f'{args.num_workers} workers (ms)':>18}{'auto (ms)':>14}")
+    for module_name in args.modules.split(","):
+        module = kss.Kss(module_name)
+        module([text, text], num_workers="auto")  # calibration
+        for batch_size in [int(b) for b in args.batch_sizes.split(",")]:
+            texts = [text] * batch_size
+            serial = measure(module, texts, args.repeat, 1)
+            measure(module, texts, 1, args.num_workers)  # warm-up
+            fixed = measure(module, texts, args.repeat, args.num_workers)
+            multiprocessing.close_pool()
+            auto = measure(module, texts, args.repeat, "auto")
+            print(f"{module_name:<20}{batch_size:>8}{serial:>14.1f}{fixed:>18.1f}{auto:>14.1f}")
+    multiprocessing.close_pool()
@@ -0,0 +1,45 @@
+import time
+
+import kss
+from kss._utils.multiprocessing import close_pool
+from kss._utils.sanity_checks import _check_analyzer_backend
+
+
+def measure(texts, backend, num_workers, executor, repeat):
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        kss.split_sentences(texts, backend=backend, num_workers=num_workers, executor=executor)
+        elapsed.append(time.perf_counter() - start)
+    elapsed.sort()
+    return elapsed[len(elapsed) // 2] * 1000
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", default="mecab,pecab,fast")
+    parser.add_argument("--batch_size", default=256, type=int)
+    parser.add_argument("--num_workers", default=4, type=int)
+    parser.add_argument("--repeat", default=5, type=int)
+    args = parser.parse_args()
+
+    text = "회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요 다만, 강남 토끼정이 강남 쉑쉑버거 골목길로 쭉 올라가야 하는데 다들 쉑쉑버거의 유혹에 넘어갈 뻔 했답니다 강남역 맛집 토끼정의 외부 모습."
+    # different texts to avoid the cache of analyzers
+    texts = [f"{i}번째 리뷰입니다. {text}" for i in range(args.batch_size)]
+
+    print(f"{'backend':<10}{'serial (ms)':>14}{'thread (ms)':>14}{'process (ms)':>14}")
+    for backend in args.backends.split(","):
+        try:
+            _check_analyzer_backend(backend)
+        except Exception:
+            print(f"{backend:<10}{'not installed':>14}")
+            continue
+
+        results = []
+        for executor in ["serial", "thread", "process"]:
+            measure(texts[:args.num_workers * 2], backend, args.num_workers, executor, 1)  # warm-up
+            results.append(measure(texts, backend, args.num_workers, executor, args.repeat))
+        print(f"{backend:<10}" + "".join(f"{r:>14.1f}" for r in results))
+    close_pool()
@@ -0,0 +1,41 @@
+import time
+
+import kss
+from kss._utils.multiprocessing import close_pool
+
+
+def measure(module, texts, repeat, fresh_pool):
+    elapsed = []
+    for _ in range(repeat):
+        if fresh_pool:
+            close_pool()
+        start = time.perf_counter()
+        module(texts, num_workers=num_workers)
+        elapsed.append(time.perf_counter() - start)
+    elapsed.sort()
+    return elapsed[len(elapsed) // 2] * 1000
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", default="split_sentences,correct_spacing,is_unsafe")
+    parser.add_argument("--batch_sizes", default="2,8,32")
+    parser.add_argument("--num_workers", default=4, type=int)
+    parser.add_argument("--repeat", default=10, type=int)
+    args = parser.parse_args()
+
+    num_workers = args.num_workers
+    text = "회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요 다만, 강남 토끼정이 강남 쉑쉑버거 골목길로 쭉 올라가야 하는데 다들 쉑쉑버거의 유혹에 넘어갈 뻔 했답니다 강남역 맛집 토끼정의 외부 모습."
+
+    print(f"{'module':<20}{'batch':>8}{'fresh pool (ms)':>18}{'shared pool (ms)':>18}")
+    for module_name in args.modules.split(","):
+        module = kss.Kss(module_name)
+        for batch_size in [int(b) for b in args.batch_sizes.split(",")]:
+            texts = [text] * batch_size
+            fresh = measure(module, texts, args.repeat, fresh_pool=True)
+            measure(module, texts, 1, fresh_pool=False)  # warm-up
+            shared = measure(module, texts, args.repeat, fresh_pool=False)
+            print(f"{module_name:<20}{batch_size:>8}{fresh:>18.1f}{shared:>18.1f}")
+    close_pool()
@@ -0,0 +1,43 @@
+import time
+
+import kss
+from kss._utils import multiprocessing
+
+
+def measure(module, texts, num_workers, repeat):
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        module(texts, num_workers=num_workers)
+        elapsed.append(time.perf_counter() - start)
+    elapsed.sort()
+    return elapsed[len(elapsed) // 2] * 1000
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", default="is_unsafe,preprocess")
+    parser.add_argument("--num_docs", default=1000, type=int)
+    parser.add_argument("--doc_length", default=10000, type=int)
+    parser.add_argument("--num_workers", default=4, type=int)
+    parser.add_argument("--repeat", default=3, type=int)
+    args = parser.parse_args()
+
+    text = "회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요 다만, 강남 토끼정이 강남 쉑쉑버거 골목길로 쭉 올라가야 하는데 다들 쉑쉑버거의 유혹에 넘어갈 뻔 했답니다 강남역 맛집 토끼정의 외부 모습. "
+    doc = (text * (args.doc_length // len(text) + 1))[: args.doc_length]
+    texts = [f"{i} {doc}" for i in range(args.num_docs)]
+    print(f"{args.num_docs} docs, {sum(len(t) for t in texts) / 1e6:.1f}M chars, {args.num_workers} workers")
+
+    print(f"{'module':<20}{'pickle (ms)':>14}{'shared memory (ms)':>20}")
+    for module_name in args.modules.split(","):
+        module = kss.Kss(module_name)
+        module(texts[:args.num_workers * 2], num_workers=args.num_workers)  # warm-up
+
+        multiprocessing._SHARED_MEMORY_MIN_CHARS = float("inf")
+        pickled = measure(module, texts, args.num_workers, args.repeat)
+        multiprocessing._SHARED_MEMORY_MIN_CHARS = 0
+        shared = measure(module, texts, args.num_workers, args.repeat)
+        print(f"{module_name:<20}{pickled:>14.1f}{shared:>20.1f}")
+    multiprocessing.close_pool()
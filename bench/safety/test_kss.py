@@ -1,3 +1,5 @@
+import time
+
 import pandas as pd
 
 from kss._modules.safety.check_safety import is_unsafe
@@ -7,8 +9,14 @@ data = [d for d in data if d[-1] != "규칙 기반 생성"]
 unsafe_data = [d[1] for d in data if d[-3] != "Clean"]
 safe_data = [d[1] for d in data if d[-3] == "Clean"]
 
+start = time.perf_counter()
 positive_output = [is_unsafe(d) for d in unsafe_data]
 negative_output = [is_unsafe(d) for d in safe_data]
+elapsed = time.perf_counter() - start
+
+start = time.perf_counter()
+matches = [is_unsafe(d, return_matches=True) for d in unsafe_data + safe_data]
+elapsed_matches = time.perf_counter() - start
 positive_accuracy = sum(positive_output) / len(positive_output)
 negative_accuracy = (1 - sum(negative_output) / len(negative_output))
 
@@ -16,3 +24,7 @@ print("<Test KSS safety module>")
 print("Accuracy: ", round((positive_accuracy + negative_accuracy) / 2, 2))
 print("Positive Accuracy: ", round(positive_accuracy, 2))
 print("Negative Accuracy: ", round(negative_accuracy, 2))
+
+num_docs = len(unsafe_data) + len(safe_data)
+print("Docs/sec: ", round(num_docs / elapsed))
+print("Docs/sec (return_matches=True): ", round(num_docs / elapsed_matches))
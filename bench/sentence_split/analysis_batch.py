@@ -0,0 +1,73 @@
+import glob
+import os
+import time
+
+from kss._modules.morphemes.utils import _preserve_space
+from kss._utils.sanity_checks import _check_analyzer_backend_mecab_pecab_only
+from sentence_split import load_dataset
+
+
+def load_texts(unit):
+    testset = os.path.join(os.path.dirname(os.path.abspath(__file__)), "testset", "*.txt")
+    documents = [text for path in sorted(glob.glob(testset)) for text, _ in load_dataset(path)]
+    if unit == "document":
+        return documents
+    return [sentence for document in documents for sentence in document.split(". ") if sentence]
+
+
+def analyze_joined(analyzer, texts, separator):
+    # the texts are analyzed in one call, and the tokens are split back at the separator tokens.
+    joined = separator.join(texts)
+    tokens = _preserve_space(joined, analyzer.pos(joined), spaces=" \n\r\t\v\f")
+    outputs, output = [], []
+    for token in tokens:
+        if token[0] == separator.strip():
+            outputs.append(output)
+            output = []
+        else:
+            output.append(token)
+    outputs.append(output)
+
+    # the spaces around the separator belong to it.
+    num_left = len(separator) - len(separator.lstrip())
+    num_right = len(separator) - len(separator.rstrip())
+    for i in range(len(outputs)):
+        if i != 0:
+            outputs[i] = outputs[i][num_right:]
+        if i != len(outputs) - 1:
+            outputs[i] = outputs[i][: len(outputs[i]) - num_left]
+    return outputs
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="mecab", choices=["mecab", "pecab"])
+    parser.add_argument("--unit", default="sentence", choices=["document", "sentence"])
+    parser.add_argument("--batch_size", default=16, type=int)
+    parser.add_argument("--separator", default=" ␞ ")
+    parser.add_argument("--num_texts", default=800, type=int)
+    args = parser.parse_args()
+
+    backend = _check_analyzer_backend_mecab_pecab_only(args.backend)
+    analyzer = backend._get_analyzer()
+    texts = load_texts(args.unit)[: args.num_texts]
+    batches = [texts[i: i + args.batch_size] for i in range(0, len(texts), args.batch_size)]
+
+    start = time.perf_counter()
+    expected = [backend._analyze(text) for text in texts]
+    per_text = time.perf_counter() - start
+
+    # pecab caches the analysis of the same input.
+    if hasattr(analyzer, "_tokenize"):
+        analyzer._tokenize.cache_clear()
+
+    start = time.perf_counter()
+    outputs = [output for batch in batches for output in analyze_joined(analyzer, batch, args.separator)]
+    joined = time.perf_counter() - start
+
+    changed = sum(output != e for output, e in zip(outputs, expected))
+    print(f"backend: {args.backend}, texts: {len(texts)} {args.unit}s, batch size: {args.batch_size}")
+    print(f"per text: {per_text * 1000:.1f} ms, joined: {joined * 1000:.1f} ms ({per_text / joined:.2f}x)")
+    print(f"texts whose analysis changed by joining: {changed} ({changed / len(texts):.1%})")
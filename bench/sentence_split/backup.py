@@ -0,0 +1,41 @@
+import random
+import time
+
+from kss._modules.sentences.sentence_postprocessor import SentencePostprocessor
+from kss._modules.sentences.sentence_preprocessor import SentencePreprocessor
+from syllables import make_document
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_chars", default=1000000, type=int)
+    parser.add_argument("--num_ignores", default=0, type=int)
+    parser.add_argument("--repeat", default=3, type=int)
+    args = parser.parse_args()
+
+    document = make_document(args.num_chars)
+    words = sorted(set(document.split()))
+    ignores = random.Random(0).sample(words, min(args.num_ignores, len(words)))
+
+    preprocessor = SentencePreprocessor(ignores)
+    postprocessor = SentencePostprocessor(ignores)
+
+    backup_elapsed, restore_elapsed = [], []
+    for i in range(args.repeat):
+        # a different text for each run, so that the caches are not used.
+        text = document + str(i)
+
+        start = time.perf_counter()
+        backup = preprocessor.backup(text)
+        backup_elapsed.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        restored = postprocessor.restore(backup, text)
+        restore_elapsed.append(time.perf_counter() - start)
+        assert restored == text
+
+    print(f"document: {len(document):,} chars, ignores: {len(ignores):,}")
+    print(f"backup: {len(document) / min(backup_elapsed):,.0f} chars/s")
+    print(f"restore: {len(document) / min(restore_elapsed):,.0f} chars/s")
@@ -0,0 +1,39 @@
+import glob
+import os
+import time
+
+import kss_cython
+from sentence_split import load_dataset
+
+
+def measure(func, repeat):
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_copies", default=100, type=int)
+    parser.add_argument("--max_threads", default=os.cpu_count(), type=int)
+    parser.add_argument("--repeat", default=3, type=int)
+    args = parser.parse_args()
+
+    testset = os.path.join(os.path.dirname(os.path.abspath(__file__)), "testset", "*.txt")
+    texts = [text for path in sorted(glob.glob(testset)) for text, _ in load_dataset(path)] * args.num_copies
+    num_chars = sum(len(text) for text in texts)
+    print(f"texts: {len(texts):,}, chars: {num_chars:,}, cpus: {os.cpu_count()}")
+
+    elapsed = measure(lambda: [kss_cython.split_sentences_fast(text) for text in texts], args.repeat)
+    print(f"{'per text':<16}{num_chars / elapsed:>16,.0f} chars/s")
+
+    num_threads = 1
+    while num_threads <= args.max_threads:
+        elapsed = measure(lambda: kss_cython.split_sentences_fast_batch(texts, num_threads=num_threads), args.repeat)
+        print(f"{f'batch x{num_threads}':<16}{num_chars / elapsed:>16,.0f} chars/s")
+        num_threads *= 2
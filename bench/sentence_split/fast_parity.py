@@ -0,0 +1,51 @@
+import random
+import time
+
+import kss_cython
+from kss._modules.sentences.sentence_splitter_fast import Table, _split_sentences_fast
+
+EXTRA_CHARS = list("가나 ㅋㅎ😀👍 .!?~…\"'’”)」] \n\t살")
+IGNORES = ["다.", "요", "ㅋㅋ", "!?", "😀"]
+
+
+def make_texts(rng, num_texts, max_chars):
+    chars = sorted({char for table in Table.values() for char in table} - {""}) + EXTRA_CHARS
+    return ["".join(rng.choices(chars, k=rng.randint(0, max_chars))) for _ in range(num_texts)]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_rounds", default=100, type=int)
+    parser.add_argument("--num_texts", default=1000, type=int)
+    parser.add_argument("--max_chars", default=80, type=int)
+    parser.add_argument("--seed", default=0, type=int)
+    args = parser.parse_args()
+
+    # differential fuzzing of the C++ rules (kss_cython) and the Python rules.
+    rng = random.Random(args.seed)
+    elapsed = {True: 0.0, False: 0.0}
+    num_chars, num_mismatches = 0, 0
+
+    for i in range(args.num_rounds):
+        texts = make_texts(rng, args.num_texts, args.max_chars)
+        strip = i % 2 == 0
+        ignores = rng.sample(IGNORES, rng.randint(0, 2))
+        num_chars += sum(len(text) for text in texts)
+
+        start = time.perf_counter()
+        native = kss_cython.split_sentences_fast_batch(texts, strip=strip, ignores=ignores)
+        elapsed[True] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        python = [_split_sentences_fast(text, strip=strip, ignores=tuple(ignores)) for text in texts]
+        elapsed[False] += time.perf_counter() - start
+
+        for text, n, p in zip(texts, native, python):
+            if n != p:
+                num_mismatches += 1
+                print(f"mismatch: {text!r} (strip={strip}, ignores={ignores})\n  native: {n}\n  python: {p}")
+
+    print(f"texts: {args.num_rounds * args.num_texts:,}, mismatches: {num_mismatches:,}")
+    print(f"native: {num_chars / elapsed[True]:,.0f} chars/s, python: {num_chars / elapsed[False]:,.0f} chars/s")
@@ -0,0 +1,38 @@
+import time
+import tracemalloc
+
+from kss import split_sentences
+
+TEMPLATE = (
+    "자세한 내용은 https://www.example{i}.com/posts/{i} 에서 확인하세요. "
+    "문의는 user{i}@example.com 으로 보내 주세요 :) "
+    "I'm sure it'll be fine. 감사합니다."
+)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="punct", choices=["mecab", "pecab", "punct", "fast"])
+    parser.add_argument("--num_docs", default=50000, type=int)
+    parser.add_argument("--report_every", default=10000, type=int)
+    args = parser.parse_args()
+
+    # every document has urls and emails which are not seen before.
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    for i in range(args.num_docs):
+        split_sentences(TEMPLATE.format(i=i), backend=args.backend, num_workers=1)
+
+        if (i + 1) % args.report_every == 0:
+            elapsed = time.perf_counter() - start
+            current, _ = tracemalloc.get_traced_memory()
+            print(
+                f"docs: {i + 1:,}, throughput: {args.report_every / elapsed:,.0f} docs/s, "
+                f"traced memory: {current / 2 ** 20:.1f} MiB"
+            )
+            start = time.perf_counter()
+
+    tracemalloc.stop()
@@ -0,0 +1,49 @@
+import glob
+import os
+import time
+import tracemalloc
+
+from kss import split_sentences
+from sentence_split import load_dataset
+
+
+def make_document(num_chars):
+    testset = os.path.join(os.path.dirname(os.path.abspath(__file__)), "testset", "*.txt")
+    texts = [text for path in sorted(glob.glob(testset)) for text, _ in load_dataset(path)]
+
+    document = ""
+    while len(document) < num_chars:
+        document += " ".join(texts)
+    return document[:num_chars]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="punct", choices=["mecab", "pecab", "punct", "fast"])
+    parser.add_argument("--num_chars", default=100000, type=int)
+    parser.add_argument("--repeat", default=3, type=int)
+    args = parser.parse_args()
+
+    document = make_document(args.num_chars)
+    split_sentences(document, backend=args.backend, num_workers=1)  # warm-up
+
+    elapsed = []
+    for i in range(args.repeat):
+        # a different text for each run, so that the cache of splitter is not used.
+        text = document + str(i)
+        start = time.perf_counter()
+        split_sentences(text, backend=args.backend, num_workers=1)
+        elapsed.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    split_sentences(document + "!", backend=args.backend, num_workers=1)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # every character of the document is a syllable.
+    best = min(elapsed)
+    print(f"backend: {args.backend}, document: {len(document)} syllables")
+    print(f"time: {best:.3f} s, throughput: {len(document) / best:,.0f} syllables/s")
+    print(f"peak memory: {peak / 2 ** 20:.1f} MiB")
@@ -0,0 +1,67 @@
+import time
+
+import numpy as np
+
+import kss
+from kss._modules.morphemes.split_morphemes import split_morphemes
+
+
+def load_texts(dataset_path):
+    texts = []
+    for line in open(dataset_path, encoding='utf-8'):
+        data = line.rstrip()
+        texts.append(data.replace('▁', ' ').replace('▔', ''))
+    return texts
+
+
+def measure(func, texts):
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        func(text)
+        latencies.append(time.perf_counter() - start)
+    return np.array(latencies) * 1000
+
+
+def report(name, latencies):
+    print(f'{name:<24}', *(f'{x:.3f}' for x in [
+        latencies.mean(),
+        np.percentile(latencies, 50),
+        np.percentile(latencies, 90),
+        np.percentile(latencies, 99),
+        latencies.max(),
+    ]), sep='\t')
+
+
+def main(args):
+    texts = [text for dataset in args.datasets for text in load_texts(dataset)]
+    morphs = {text: split_morphemes(text, backend=args.backend, drop_space=False) for text in texts}
+    print(f'texts: {len(texts)}, backend: {args.backend}')
+    print(f'\nLatency per text (ms)')
+    print(f'{"":<24}', 'mean', 'p50', 'p90', 'p99', 'max', sep='\t')
+
+    start = time.perf_counter()
+    pack = kss.RulePack()
+    print(f'rule pack: {len(pack)} rules, made in {time.perf_counter() - start:.3f} s')
+
+    # `use_index=False` evaluates all the rules like before the rule index.
+    report('rules (all)', measure(lambda x: pack.postprocess(x, morphs[x], use_index=False), texts))
+    report('rules (index)', measure(lambda x: pack.postprocess(x, morphs[x]), texts))
+
+    if not args.rules_only:
+        kss.set_analysis_cache(max_entries=0)  # the texts were analyzed above.
+        kss.correct_spacing(texts[0], backend=args.backend, num_workers=1)  # warm-up
+        report('correct_spacing', measure(lambda x: kss.correct_spacing(x, backend=args.backend, num_workers=1), texts))
+        report('  w/o split_sentences', measure(
+            lambda x: kss.correct_spacing(x, backend=args.backend, num_workers=1, split_sentences=False), texts
+        ))
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('datasets', nargs='+')
+    parser.add_argument('--backend', default='pecab', choices=['mecab', 'pecab'])
+    parser.add_argument('--rules_only', action='store_true', help='measure the spacing rules only')
+    main(parser.parse_args())
@@ -107,6 +107,9 @@ def main(args):
     models = [Model.from_name(n, **{k: v for k, v in args._get_kwargs() if k.startswith('kiwi_')}) for n in model_names]
     elapsed_times = []
 
+    if args.profile:
+        kss.enable_spacing_profile()
+
     print('              ', 'Baseline', *model_names, sep='\t')
     for dataset in args.datasets:
         scores = []
@@ -131,6 +134,21 @@ def main(args):
     for dataset, elapsed in zip(args.datasets, elapsed_times):
         print(os.path.basename(dataset), *((f'{s * 1000:.3f}' if s is not None else '-') for s in elapsed), sep='\t')
 
+    if args.profile:
+        print_profile(args.profile, args.profile_sort_by)
+
+
+def print_profile(top, sort_by):
+    profile = kss.spacing_profile(sort_by=sort_by)
+    print(f'\nSpacing Rules (top {top} by {sort_by})')
+    print('evaluations', 'matches', 'skips', 'time (ms)', 'rule', sep='\t')
+    for name, stats in list(profile.items())[:top]:
+        print(stats['evaluations'], stats['matches'], stats['skips'], f"{stats['time'] * 1000:.3f}", name, sep='\t')
+
+    never_matched = [stats for stats in profile.values() if stats['matches'] == 0]
+    print(f'\n{len(never_matched)} of {len(profile)} rules never matched, '
+          f"and they took {sum(stats['time'] for stats in never_matched) * 1000:.3f} ms.")
+
 
 if __name__ == '__main__':
     import argparse
@@ -142,4 +160,6 @@ if __name__ == '__main__':
     parser.add_argument('--kiwi_model_type', default='knlm', choices=['knlm', 'sbg'])
     parser.add_argument('--kiwi_space_tolerance', default=2, type=int)
     parser.add_argument('--kiwi_space_penalty', default=7., type=float)
+    parser.add_argument('--profile', default=0, type=int, help='print the top N spacing rules of kss')
+    parser.add_argument('--profile_sort_by', default='time', choices=['evaluations', 'matches', 'skips', 'time'])
     main(parser.parse_args())
@@ -1,19 +1,56 @@
 # Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang-Kil Park <skpark1224@hyundai.com>
 # All rights reserved.
 
+from libcpp cimport bool
 from libcpp.string cimport string
 from libcpp.vector cimport vector
 
 from typing import List
 
 cdef extern from "csrc/sentence_splitter.h":
-    vector[string] splitSentences(string)
+    vector[string] splitSentences(const string &, const vector[string] &, bool) except +
+    vector[vector[string]] splitSentencesBatch(
+        const string &, const vector[size_t] &, const vector[string] &, bool, int
+    ) except + nogil
 
-def split_sentences_fast(str, **kwargs) -> List[str]:
+def split_sentences_fast(str, strip=True, ignores=None, **kwargs) -> List[str]:
     results = []
+    cdef vector[string] c_ignores = [i.encode('utf-8') for i in ignores or []]
     # Convert Python's `bytes` to C++'s `std::string`.
-    res = splitSentences(str.encode('utf-8'))
+    res = splitSentences(str.encode('utf-8'), c_ignores, strip)
     for r in res:
         results.append(r.decode('utf-8'))
 
-    return results
\ No newline at end of file
+    return results
+
+def split_sentences_fast_batch(texts, strip=True, ignores=None, num_threads=1, **kwargs) -> List[List[str]]:
+    """
+    Split a batch of texts without holding the GIL.
+
+    Args:
+        texts (List[str]): list of texts
+        strip (bool): strip all sentences or not
+        ignores (List[str]): list of strings to ignore
+        num_threads (int): the number of C++ threads
+
+    Returns:
+        List[List[str]]: sentences of each text
+    """
+    cdef string buffer
+    cdef vector[size_t] offsets
+    cdef vector[string] c_ignores = [i.encode('utf-8') for i in ignores or []]
+    cdef vector[vector[string]] res
+    cdef bool c_strip = strip
+    cdef int c_num_threads = num_threads
+
+    # All texts are encoded into one buffer, and `offsets` has the boundaries of them.
+    encoded = [text.encode('utf-8') for text in texts]
+    buffer = b''.join(encoded)
+    offsets.push_back(0)
+    for e in encoded:
+        offsets.push_back(offsets.back() + len(e))
+
+    with nogil:
+        res = splitSentencesBatch(buffer, offsets, c_ignores, c_strip, c_num_threads)
+
+    return [[r.decode('utf-8') for r in sentences] for sentences in res]
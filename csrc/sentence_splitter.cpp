@@ -11,8 +11,10 @@
 #include <vector>
 
 #include <algorithm>
+#include <atomic>
 #include <cctype>
 #include <stack>
+#include <thread>
 #include "sentence_splitter.h"
 
 /**
@@ -31,6 +33,16 @@ namespace kss {
         return len;
     }
 
+    // Return ID of a character in the pattern mapping table.
+    // It doesn't insert missing characters into the table, so it is safe to call from multiple threads.
+    int getID(Stats stat, const std::string &chr) {
+        auto table = map.find(stat);
+        if (table == map.end()) return ID::NONE;
+
+        auto it = table->second.find(chr);
+        return it == table->second.end() ? ID::NONE : it->second;
+    }
+
     // Be careful using only this function to test for string equality because there's a hash collision exists.
     // https://stackoverflow.com/a/16388610
     constexpr unsigned int str2hash(const char *str, int h = 0) {
@@ -55,15 +67,24 @@ namespace kss {
         rtrim(s);
     }
 
-    // Trim sentence and adds to result vector.
-    void doTrimSentPushResults(std::string &curSentence, std::vector<std::string> &results) {
-        trim(curSentence);
+    // Trim sentence if `strip` is true and adds to result vector.
+    void doTrimSentPushResults(std::string &curSentence, std::vector<std::string> &results, bool strip) {
+        if (strip) trim(curSentence);
         results.push_back(curSentence);
         curSentence.clear();
     }
+
+    // Return length of the longest string in `ignores` which starts at text[i], or 0 if there's no such string.
+    size_t getIgnoreLength(const std::string &text, size_t i, const std::vector<std::string> &ignores) {
+        size_t len = 0;
+        for (const std::string &ignore : ignores) {
+            if (ignore.length() > len && text.compare(i, ignore.length(), ignore) == 0) len = ignore.length();
+        }
+        return len;
+    }
 } // kss
 
-std::vector<std::string> splitSentences(const std::string &text) {
+std::vector<std::string> splitSentences(const std::string &text, const std::vector<std::string> &ignores, bool strip) {
     using namespace kss;
 
     std::string prevChr;
@@ -75,35 +96,45 @@ std::vector<std::string> splitSentences(const std::string &text) {
     Stats curStat = Stats::DEFAULT;
 
     for (size_t i = 0; i < text.length();) {
-        int len = getUTF8ChrLength(text, i);
+        size_t len = getIgnoreLength(text, i, ignores);
+        // The strings in `ignores` are kept in a sentence as they are.
+        // They are looked up as an empty string, which isn't in the table and isn't a space.
+        const bool ignored = len != 0;
+        if (!ignored) len = getUTF8ChrLength(text, i);
+
         // Due to Cython's `const char *` unexpected operation, use `std::string` instead of  `*chr`.
-        const std::string chrString = text.substr(i, len);
+        const std::string chrText = text.substr(i, len);
+        const std::string chrString = ignored ? std::string() : chrText;
 
         if (curStat == Stats::DEFAULT) {
+            // `str2hash` has collisions (e.g. "살" and "죵"), so the character is compared again.
             switch (str2hash(chrString.c_str())) {
                 case str2hash("다"):
-                    if (map[Stats::DA][prevChr] & ID::PREV) curStat = Stats::DA;
+                    if (chrString == "다" && getID(Stats::DA, prevChr) & ID::PREV) curStat = Stats::DA;
                     break;
                 case str2hash("요"):
-                    if (map[Stats::YO][prevChr] & ID::PREV) curStat = Stats::YO;
+                    if (chrString == "요" && getID(Stats::YO, prevChr) & ID::PREV) curStat = Stats::YO;
                     break;
                 case str2hash("죠"):
                 case str2hash("죵"):
-                    if (map[Stats::JYO][prevChr] & ID::PREV) curStat = Stats::JYO;
+                    if ((chrString == "죠" || chrString == "죵") &&
+                        getID(Stats::JYO, prevChr) & ID::PREV) curStat = Stats::JYO;
                     break;
                 case str2hash("."):
                 case str2hash("!"):
                 case str2hash("?"):
                 case str2hash("…"):
                 case str2hash("~"):
-                    if (map[Stats::SB][prevChr] & ID::PREV) curStat = Stats::SB;
+                    if ((chrString == "." || chrString == "!" || chrString == "?" ||
+                         chrString == "…" || chrString == "~") &&
+                        getID(Stats::SB, prevChr) & ID::PREV) curStat = Stats::SB;
                     break;
             }
         } else {
             if (isspace(*chrString.c_str()) || // Space
-                map[Stats::COMMON][chrString] & ID::CONT) {
-                if (map[curStat][prevChr] & ID::NEXT1) {
-                    doTrimSentPushResults(curSentence, results);
+                getID(Stats::COMMON, chrString) & ID::CONT) {
+                if (getID(curStat, prevChr) & ID::NEXT1) {
+                    doTrimSentPushResults(curSentence, results, strip);
                     curSentence.append(prevChr);
                     curStat = Stats::DEFAULT;
                 }
@@ -111,40 +142,40 @@ std::vector<std::string> splitSentences(const std::string &text) {
                 goto endif;
             }
 
-            if (map[curStat][chrString] & ID::NEXT) {
-                if (map[curStat][prevChr] & ID::NEXT1) {
+            if (getID(curStat, chrString) & ID::NEXT) {
+                if (getID(curStat, prevChr) & ID::NEXT1) {
                     curSentence.append(prevChr);
                 }
-                else if (map[Stats::COMMON][prevCharSkipSpace] & ID::CONT) {
-                    doTrimSentPushResults(curSentence, results);
+                else if (getID(Stats::COMMON, prevCharSkipSpace) & ID::CONT) {
+                    doTrimSentPushResults(curSentence, results, strip);
                 }
                 curStat = Stats::DEFAULT;
                 goto endif;
             }
 
-            if (map[curStat][chrString] & ID::NEXT1) {
-                if (map[curStat][prevChr] & ID::NEXT1) {
-                    doTrimSentPushResults(curSentence, results);
+            if (getID(curStat, chrString) & ID::NEXT1) {
+                if (getID(curStat, prevChr) & ID::NEXT1) {
+                    doTrimSentPushResults(curSentence, results, strip);
                     curSentence.append(prevChr);
                     curStat = Stats::DEFAULT;
                 }
                 goto endif;
             }
 
-            if (map[curStat][chrString] & ID::NEXT2) {
-                if (map[curStat][prevChr] & ID::NEXT1) {
+            if (getID(curStat, chrString) & ID::NEXT2) {
+                if (getID(curStat, prevChr) & ID::NEXT1) {
                     curSentence.append(prevChr);
                 } else {
-                    doTrimSentPushResults(curSentence, results);
+                    doTrimSentPushResults(curSentence, results, strip);
                 }
                 curStat = Stats::DEFAULT;
                 goto endif;
             }
 
-            if (!map[curStat][chrString] || // NOT exists.
-                map[curStat][chrString] & ID::PREV) {
-                    doTrimSentPushResults(curSentence, results);
-                    if (map[curStat][prevChr] & ID::NEXT1) {
+            if (!getID(curStat, chrString) || // NOT exists.
+                getID(curStat, chrString) & ID::PREV) {
+                    doTrimSentPushResults(curSentence, results, strip);
+                    if (getID(curStat, prevChr) & ID::NEXT1) {
                         curSentence.append(prevChr);
                     }
                 curStat = Stats::DEFAULT;
@@ -154,8 +185,8 @@ std::vector<std::string> splitSentences(const std::string &text) {
         }
 
         endif:
-        if (curStat == Stats::DEFAULT || !(map[curStat][chrString] & ID::NEXT1)) {
-            curSentence.append(chrString);
+        if (curStat == Stats::DEFAULT || !(getID(curStat, chrString) & ID::NEXT1)) {
+            curSentence.append(chrText);
         }
         prevPrevChr = prevChr;
         prevChr = chrString;
@@ -168,12 +199,43 @@ std::vector<std::string> splitSentences(const std::string &text) {
     }
 
     if (!curSentence.empty()) {
-        doTrimSentPushResults(curSentence, results);
+        doTrimSentPushResults(curSentence, results, strip);
     }
-    if (map[curStat][prevChr] & ID::NEXT1) {
+    if (getID(curStat, prevChr) & ID::NEXT1) {
         curSentence.append(prevChr);
-        doTrimSentPushResults(curSentence, results);
+        doTrimSentPushResults(curSentence, results, strip);
+    }
+
+    return results;
+}
+
+std::vector<std::vector<std::string>> splitSentencesBatch(
+    const std::string &buffer,
+    const std::vector<size_t> &offsets,
+    const std::vector<std::string> &ignores,
+    bool strip,
+    int numThreads
+) {
+    // Texts are stored in one buffer, and the i-th text is buffer[offsets[i]:offsets[i + 1]].
+    size_t numTexts = offsets.empty() ? 0 : offsets.size() - 1;
+    std::vector<std::vector<std::string>> results(numTexts);
+    std::atomic<size_t> nextText(0);
+
+    auto worker = [&]() {
+        for (size_t i = nextText++; i < numTexts; i = nextText++) {
+            results[i] = splitSentences(buffer.substr(offsets[i], offsets[i + 1] - offsets[i]), ignores, strip);
+        }
+    };
+
+    size_t numWorkers = std::min(static_cast<size_t>(std::max(numThreads, 1)), std::max(numTexts, static_cast<size_t>(1)));
+    std::vector<std::thread> threads;
+    for (size_t t = 1; t < numWorkers; t++) {
+        threads.emplace_back(worker);
+    }
+    worker();
+    for (auto &thread : threads) {
+        thread.join();
     }
 
     return results;
-}
\ No newline at end of file
+}
@@ -210,15 +210,33 @@ namespace kss {
 
     int getUTF8ChrLength(const std::string &text, size_t i);
 
+    int getID(Stats stat, const std::string &chr);
+
     constexpr unsigned int str2hash(const char *str, int h);
 
     void ltrim(std::string &s);
     void rtrim(std::string &s);
     void trim(std::string &s);
 
-    void doTrimSentPushResults(std::string &curSentence, std::vector<std::string> &results);
+    void doTrimSentPushResults(std::string &curSentence, std::vector<std::string> &results, bool strip);
+
+    size_t getIgnoreLength(const std::string &text, size_t i, const std::vector<std::string> &ignores);
 }
 
-std::vector<std::string> splitSentences(const std::string &text);
+// Split a text into sentences.
+// The strings in `ignores` are never split, and sentences are trimmed if `strip` is true.
+std::vector<std::string> splitSentences(
+    const std::string &text,
+    const std::vector<std::string> &ignores = std::vector<std::string>(),
+    bool strip = true
+);
+
+std::vector<std::vector<std::string>> splitSentencesBatch(
+    const std::string &buffer,
+    const std::vector<size_t> &offsets,
+    const std::vector<std::string> &ignores,
+    bool strip,
+    int numThreads
+);
 
 #endif // __SENTENCE_SPLITTER_H
\ No newline at end of file
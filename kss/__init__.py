@@ -1,6 +1,7 @@
 # Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
 # All rights reserved.
 
+from typing import Iterable, Iterator, Optional, Union, Any
 
 from kss._modules.augmentation.augment import augment
 from kss._modules.collocation.collocate import collocate
@@ -11,6 +12,8 @@ from kss._modules.jamo._jamo import h2j, h2hcj, j2h, j2hcj, hcj2h, hcj2j, is_jam
     is_hcj_modern, is_hangul_char
 from kss._modules.josa.josa import select_josa, combine_josa
 from kss._modules.keywords.extract_keywords import extract_keywords
+from kss._modules.morphemes.cache import set_analysis_cache, clear_analysis_cache, analysis_cache_info, \
+    enable_disk_cache, disable_disk_cache, disk_cache_info
 from kss._modules.morphemes.split_morphemes import split_morphemes
 from kss._modules.paradigm.paradigm import paradigm
 from kss._modules.preprocessing.anonymize import anonymize
@@ -27,8 +30,13 @@ from kss._modules.qwerty.qwerty import qwerty
 from kss._modules.romanization.romanize import romanize
 from kss._modules.safety.check_safety import is_unsafe
 from kss._modules.sentences.split_sentences import split_sentences
+from kss._modules.sentences.sentence_stream import SentenceStream
 from kss._modules.spacing.correct_spacing import correct_spacing
+from kss._modules.spacing.rule_pack import RulePack
+from kss._modules.spacing.profile import enable_spacing_profile, disable_spacing_profile, clear_spacing_profile, \
+    spacing_profile
 from kss._modules.summarization.summarize_sentences import summarize_sentences
+from kss._utils.multiprocessing import set_pool, close_pool, pool, warmup
 
 supported_modules = {
     "augment": augment,
@@ -150,6 +158,20 @@ class Kss(object):
     def __call__(self, *args, **kwargs):
         return self.module(*args, **kwargs)
 
+    def stream(
+        self,
+        inputs: Iterable[str],
+        num_workers: Union[int, str] = "auto",
+        chunksize: int = 64,
+        max_in_flight: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """
+        Run the module lazily over an iterable of texts.
+        Refer to `kss.stream()` for details.
+        """
+        return _stream_module(self.module, inputs, num_workers, chunksize, max_in_flight, **kwargs)
+
     def help(self):
         print(self.module.__doc__.strip())
 
@@ -201,5 +223,82 @@ class Kss(object):
             return closest_module
 
 
-__ALL__ = list(supported_modules.keys()) + ["Kss"]
+def stream(
+    module: str,
+    inputs: Iterable[str],
+    num_workers: Union[int, str] = "auto",
+    chunksize: int = 64,
+    max_in_flight: Optional[int] = None,
+    **kwargs,
+) -> Iterator[Any]:
+    """
+    Run a module lazily over an iterable of texts and yield outputs in input order.
+
+    Args:
+        module (str): module name or alias
+        inputs (Iterable[str]): iterable of texts, e.g. a file object or a generator
+        num_workers (Union[int, str]): the number of multiprocessing workers
+        chunksize (int): the number of texts sent to a worker at once
+        max_in_flight (Optional[int]): the maximum number of chunks being processed at the same time.
+            `None` means twice the number of workers.
+        **kwargs: arguments of the module
+
+    Returns:
+        Iterator[Any]: one output per input text
+
+    Examples:
+        >>> import kss
+        >>> with open("corpus.txt") as f:
+        ...     for sentences in kss.stream("split_sentences", f, backend="fast"):
+        ...         print(sentences)
+
+    Notes:
+        Texts are read only when there is room for a new chunk,
+        so memory usage stays flat regardless of the size of inputs.
+    """
+    return _stream_module(Kss(module).module, inputs, num_workers, chunksize, max_in_flight, **kwargs)
+
+
+def _stream_module(module, inputs, num_workers, chunksize, max_in_flight, **kwargs):
+    from functools import partial
+    from inspect import signature
+    from kss._utils.multiprocessing import _run_module, _stream_job
+    from kss._utils.sanity_checks import _check_num_workers, _check_type
+
+    if list(signature(module).parameters)[0] != "text":
+        raise ValueError(
+            f"Oops! '{module.__name__}' module doesn't support streaming.\n"
+            f"Streaming is only supported for modules which take `text` as the first argument.\n"
+        )
+
+    if isinstance(inputs, str):
+        raise TypeError(
+            "Oops! `inputs` must be an iterable of texts, but you input a single text.\n"
+            "Please check `inputs` parameter again ;)\n"
+        )
+
+    chunksize = _check_type(chunksize, "chunksize", int)
+    if chunksize < 1:
+        raise ValueError(
+            f"Oops! `chunksize` must be same or greater than 1, but you input {chunksize}.\n"
+            "Please check `chunksize` parameter again ;)"
+        )
+
+    return _stream_job(
+        chunk_func=partial(_run_module, module=module, kwargs=kwargs),
+        inputs=inputs,
+        num_workers=_check_num_workers(inputs, num_workers),
+        chunksize=chunksize,
+        max_in_flight=max_in_flight,
+    )
+
+
+from kss import aio
+from kss._utils.pipeline import Pipeline
+
+__ALL__ = list(supported_modules.keys()) + ["Kss", "stream", "set_pool", "close_pool", "pool", "warmup", "aio", "Pipeline",
+           "set_analysis_cache", "clear_analysis_cache", "analysis_cache_info",
+           "enable_disk_cache", "disable_disk_cache", "disk_cache_info", "SentenceStream",
+           "enable_spacing_profile", "disable_spacing_profile", "clear_spacing_profile", "spacing_profile",
+           "RulePack"]
 __version__ = "6.0.5"
@@ -0,0 +1,290 @@
+# Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
+# All rights reserved.
+
+"""
+Command line interface of Kss.
+
+Examples:
+    $ kss run split_sentences --in corpus.jsonl.gz --field text --out out.jsonl --workers 32
+    $ kss run correct_spacing --in texts.txt --out - --arg backend=pecab
+    $ cat texts.txt | kss run normalize --format txt
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import sys
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+_formats = ["jsonl", "tsv", "txt"]
+
+
+def _open(path: str, mode: str) -> TextIO:
+    """
+    Open a text file, decompressing or compressing it by its extension.
+
+    Args:
+        path (str): file path. '-' means stdin or stdout.
+        mode (str): one of 'r', 'w' and 'a'
+
+    Returns:
+        TextIO: text file object
+    """
+    if path == "-":
+        return sys.stdin if mode == "r" else sys.stdout
+
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "Oops! You need to install `zstandard` to read or write '.zst' files.\n"
+                "Please run `pip install zstandard` ;)"
+            )
+
+        if mode == "r":
+            stream = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        else:
+            stream = zstandard.ZstdCompressor().stream_writer(open(path, mode + "b"), closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+
+    return open(path, mode, encoding="utf-8")
+
+
+def _infer_format(path: str) -> str:
+    for extension in [".gz", ".zst"]:
+        if path.endswith(extension):
+            path = path[: -len(extension)]
+
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    if extension in ["jsonl", "json", "ndjson"]:
+        return "jsonl"
+    elif extension == "tsv":
+        return "tsv"
+    return "txt"
+
+
+def _parse_kwargs(args: List[str]) -> Dict[str, Any]:
+    kwargs = {}
+    for arg in args:
+        if "=" not in arg:
+            raise ValueError(
+                f"Oops! '{arg}' is not a valid module argument.\n"
+                f"Module arguments must be like `--arg key=value`, e.g. `--arg backend=fast`.\n"
+                f"Please check `--arg` option again ;)"
+            )
+
+        key, value = arg.split("=", 1)
+        try:
+            kwargs[key] = json.loads(value)
+        except json.JSONDecodeError:
+            kwargs[key] = value
+    return kwargs
+
+
+def _process_lines(
+    lines: List[str],
+    module: Any,
+    kwargs: Dict[str, Any],
+    input_format: str,
+    output_format: str,
+    field: str,
+    output_field: str,
+) -> List[Optional[str]]:
+    """
+    Parse input lines, run the module and format output lines. This runs in the workers.
+
+    Args:
+        lines (List[str]): input lines without line breaks
+        module (Any): kss module
+        kwargs (Dict[str, Any]): arguments of the module
+        input_format (str): one of 'jsonl', 'tsv' and 'txt'
+        output_format (str): one of 'jsonl', 'tsv' and 'txt'
+        field (str): field of jsonl or column index of tsv which has the text
+        output_field (str): field of jsonl to write the output
+
+    Returns:
+        List[Optional[str]]: one output line per input line. `None` means that nothing is written.
+    """
+    from kss._utils.multiprocessing import _run_module
+
+    records, texts = [], []
+    for line in lines:
+        if input_format == "jsonl":
+            record = json.loads(line) if line.strip() else None
+            text = record[field] if record is not None else None
+        elif input_format == "tsv":
+            record = line.split("\t")
+            text = record[int(field)]
+        else:
+            record = text = line
+        records.append(record)
+        texts.append(text)
+
+    valid = [text for text in texts if text is not None]
+    outputs = iter(_run_module(valid, module, kwargs) if len(valid) != 0 else [])
+
+    output_lines = []
+    for record, text in zip(records, texts):
+        if text is None:
+            output_lines.append(None)
+            continue
+
+        output = next(outputs)
+        if output_format == "jsonl":
+            if not isinstance(record, dict):
+                record = {field: text}
+            record[output_field] = output
+            output_lines.append(json.dumps(record, ensure_ascii=False))
+        else:
+            output = output if isinstance(output, str) else json.dumps(output, ensure_ascii=False)
+            if output_format == "tsv":
+                output_lines.append("\t".join((record if isinstance(record, list) else [text]) + [output]))
+            else:
+                output_lines.append(output.replace("\n", "\\n"))
+    return output_lines
+
+
+def _read_lines(file: TextIO, skip: int) -> Iterator[str]:
+    for i, line in enumerate(file):
+        if i >= skip:
+            yield line.rstrip("\r\n")
+
+
+def _load_checkpoint(path: str) -> Tuple[int, int]:
+    if not os.path.exists(path):
+        return 0, 0
+
+    with open(path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    return checkpoint["lines"], checkpoint["bytes"]
+
+
+def _save_checkpoint(path: str, lines: int, num_bytes: int):
+    # write and rename it, so the checkpoint is never broken even if the process is killed.
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"lines": lines, "bytes": num_bytes}, f)
+    os.replace(path + ".tmp", path)
+
+
+def run(args: argparse.Namespace) -> None:
+    """
+    Run a module over a file and write the outputs to another file.
+
+    Args:
+        args (argparse.Namespace): arguments of `kss run`
+    """
+    from kss import Kss
+    from kss._utils.multiprocessing import _stream_job, close_pool
+    from kss._utils.sanity_checks import _check_num_workers
+
+    module = Kss(args.module).module
+    kwargs = _parse_kwargs(args.arg)
+    input_format = args.format or _infer_format(args.input)
+    output_format = args.output_format or (input_format if args.output == "-" else _infer_format(args.output))
+    field = args.field if args.field is not None else ("text" if input_format == "jsonl" else "0")
+    checkpoint = args.checkpoint or f"{args.output}.ckpt"
+
+    if input_format == "tsv" and not field.isdigit():
+        raise ValueError(
+            f"Oops! `--field` must be a column index for tsv files, but you input '{field}'.\n"
+            "Please check `--field` option again ;)"
+        )
+
+    if args.resume:
+        if args.unordered:
+            raise ValueError(
+                "Oops! `--resume` is not supported with `--unordered`, "
+                "because the finished lines are not contiguous in unordered mode.\n"
+                "Please check `--resume` option again ;)"
+            )
+        if args.output == "-" or args.output.endswith((".gz", ".zst")):
+            raise ValueError(
+                "Oops! `--resume` is only supported for uncompressed output files.\n"
+                "Please check `--out` option again ;)"
+            )
+
+    skip, num_bytes = _load_checkpoint(checkpoint) if args.resume else (0, 0)
+    if skip != 0:
+        # drop the lines which were written after the last checkpoint.
+        with open(args.output, "r+b") as f:
+            f.truncate(num_bytes)
+
+    source = _open(args.input, "r")
+    target = _open(args.output, "a" if skip != 0 else "w")
+    num_workers = args.workers if args.workers == "auto" else int(args.workers)
+
+    try:
+        outputs = _stream_job(
+            chunk_func=partial(
+                _process_lines,
+                module=module,
+                kwargs=kwargs,
+                input_format=input_format,
+                output_format=output_format,
+                field=field,
+                output_field=args.output_field or module.__name__,
+            ),
+            inputs=_read_lines(source, skip),
+            num_workers=_check_num_workers(source, num_workers),
+            chunksize=args.chunksize,
+            ordered=not args.unordered,
+        )
+
+        lines = skip
+        for output in outputs:
+            if output is not None:
+                target.write(output + "\n")
+            lines += 1
+
+            if args.output != "-" and lines % args.chunksize == 0:
+                target.flush()
+                if not args.unordered:
+                    _save_checkpoint(checkpoint, lines, target.tell())
+
+        target.flush()
+        if args.output != "-" and not args.unordered:
+            _save_checkpoint(checkpoint, lines, target.tell())
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+        close_pool()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from kss import __version__
+
+    parser = argparse.ArgumentParser(prog="kss", description="Kss: A Toolkit for Korean sentence segmentation")
+    parser.add_argument("--version", action="version", version=f"kss {__version__}")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run a module over a file")
+    run_parser.add_argument("module", help="module name or alias, e.g. split_sentences")
+    run_parser.add_argument("--in", dest="input", default="-", help="input file (.gz, .zst are supported), '-' means stdin")
+    run_parser.add_argument("--out", dest="output", default="-", help="output file, '-' means stdout")
+    run_parser.add_argument("--format", choices=_formats, default=None, help="input format, inferred from the extension by default")
+    run_parser.add_argument("--output_format", choices=_formats, default=None, help="output format, same as the input by default")
+    run_parser.add_argument("--field", default=None, help="field of jsonl ('text' by default) or column index of tsv (0 by default)")
+    run_parser.add_argument("--output_field", default=None, help="field of jsonl to write outputs, the module name by default")
+    run_parser.add_argument("--workers", default="auto", help="the number of multiprocessing workers or 'auto'")
+    run_parser.add_argument("--chunksize", default=64, type=int, help="the number of lines sent to a worker at once")
+    run_parser.add_argument("--unordered", action="store_true", help="write outputs as soon as they are finished")
+    run_parser.add_argument("--resume", action="store_true", help="resume from the last checkpoint")
+    run_parser.add_argument("--checkpoint", default=None, help="checkpoint file, '{out}.ckpt' by default")
+    run_parser.add_argument("--arg", action="append", default=[], help="module argument like 'backend=fast', can be repeated")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
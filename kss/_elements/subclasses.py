@@ -4,13 +4,6 @@
 from kss._elements.element import Element
 
 
-class Syllable(Element):
-    def __init__(self, text, pos, idx):
-        if len(text) != 1:
-            raise ValueError("Length of syllable must be 1.")
-        super().__init__(text, pos, idx)
-
-
 class Token(Element):
     def __init__(self, text, pos, idx, start, end):
         super().__init__(text, pos, idx)
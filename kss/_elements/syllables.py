@@ -0,0 +1,262 @@
+# Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
+# All rights reserved.
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+# interned pos tags. the id 0 is the pos of empty syllable.
+_pos_names: List[str] = [""]
+_pos_ids: Dict[str, int] = {"": 0}
+_pos_flags: List[int] = [0]
+
+# pos conditions which are precomputed as flags. refer to `_add_flag`.
+# the flags of a syllable are stored in an unsigned 64-bit integer.
+_flag_conditions: List[Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]] = []
+_max_flags = 64
+
+
+def _check_pos(tag: str, poses: Tuple[str, ...], exclude: Optional[Tuple[str, ...]]) -> bool:
+    for target in poses:
+        if target in tag:
+            if exclude is not None:
+                for e in exclude:
+                    if e in tag:
+                        return False
+            return True
+    return False
+
+
+def _tag_flags(tag: str) -> int:
+    flags = 0
+    for i, (poses, exclude) in enumerate(_flag_conditions):
+        if _check_pos(tag, poses, exclude):
+            flags |= 1 << i
+    return flags
+
+
+def _intern_pos(tag: str) -> int:
+    """
+    Get the id of pos tag.
+
+    Args:
+        tag (str): pos tag
+
+    Returns:
+        int: interned id of the tag
+    """
+    pos_id = _pos_ids.get(tag)
+    if pos_id is None:
+        pos_id = _pos_ids[tag] = len(_pos_names)
+        _pos_names.append(tag)
+        _pos_flags.append(_tag_flags(tag))
+    return pos_id
+
+
+def _add_flag(*poses: str, exclude: Optional[Tuple[str, ...]] = None) -> int:
+    """
+    Add a flag which is set for syllables whose pos satisfies `check_pos(*poses, exclude=exclude)`.
+
+    Args:
+        poses (str): poses for check
+        exclude (Optional[Tuple[str, ...]]): excluded poses
+
+    Returns:
+        int: bit of the flag
+    """
+    if len(_flag_conditions) >= _max_flags:
+        raise ValueError(f"Oops! The number of flags can't be greater than {_max_flags}.")
+
+    _flag_conditions.append((poses, exclude))
+    for pos_id, tag in enumerate(_pos_names):
+        _pos_flags[pos_id] = _tag_flags(tag)
+    return 1 << (len(_flag_conditions) - 1)
+
+
+class Syllables(object):
+    """
+    Syllables of a text in struct-of-arrays layout.
+
+    Args:
+        text (str): characters of the syllables
+        pos (array): interned pos id of each syllable
+        next (array): index of the next syllable of each syllable
+        prev (array): index of the previous syllable of each syllable
+
+    Notes:
+        A syllable is an index of the arrays, and the index -1 is the empty syllable.
+        Every array has one more item at the end for the empty syllable,
+        so `pos[-1]`, `flags[-1]`, `next[-1]` and `prev[-1]` are the values of the empty syllable.
+        The links are same with `i + 1` and `i - 1` except the spaces appended before emojis in preprocessing.
+    """
+
+    __slots__ = ("text", "pos", "flags", "next", "prev")
+
+    def __init__(self, text: str, pos: array, next: array, prev: array):
+        self.text = text
+        self.pos = pos
+        self.next = next
+        self.prev = prev
+        self.pos.append(0)
+        self.next.append(-1)
+        self.prev.append(-1)
+        self.flags = array("Q", [_pos_flags[pos_id] for pos_id in self.pos])
+
+    def __len__(self):
+        return len(self.text)
+
+    def char(self, i: int) -> str:
+        return self.text[i] if i >= 0 else ""
+
+    def tag(self, i: int) -> str:
+        return _pos_names[self.pos[i]]
+
+    def set_tag(self, i: int, tag: str):
+        if i >= 0:
+            self.pos[i] = _intern_pos(tag)
+            self.flags[i] = _pos_flags[self.pos[i]]
+
+    def next_skip(self, i: int, *poses, exclude=None) -> int:
+        _next = self.next[i]
+        while _next >= 0 and _check_pos(_pos_names[self.pos[_next]], poses, exclude):
+            _next = self.next[_next]
+        return _next
+
+    def prev_skip(self, i: int, *poses, exclude=None) -> int:
+        _prev = self.prev[i]
+        while _prev >= 0 and _check_pos(_pos_names[self.pos[_prev]], poses, exclude):
+            _prev = self.prev[_prev]
+        return _prev
+
+    def next_skip_from_current(self, i: int, *poses, exclude=None) -> int:
+        _next = i
+        while _next >= 0 and _check_pos(_pos_names[self.pos[_next]], poses, exclude):
+            _next = self.next[_next]
+        return _next
+
+    def prev_skip_from_current(self, i: int, *poses, exclude=None) -> int:
+        _prev = i
+        while _prev >= 0 and _check_pos(_pos_names[self.pos[_prev]], poses, exclude):
+            _prev = self.prev[_prev]
+        return _prev
+
+    def next_skip_flags(self, i: int, flags: int) -> int:
+        """
+        Skip the next syllables which have any of the flags. It's same with `next_skip` of the flag condition.
+
+        Args:
+            i (int): index of syllable
+            flags (int): flags to skip
+
+        Returns:
+            int: index of the first syllable without the flags
+        """
+        _next = self.next[i]
+        while self.flags[_next] & flags:
+            _next = self.next[_next]
+        return _next
+
+    def prev_skip_flags(self, i: int, flags: int) -> int:
+        """
+        Skip the previous syllables which have any of the flags. It's same with `prev_skip` of the flag condition.
+
+        Args:
+            i (int): index of syllable
+            flags (int): flags to skip
+
+        Returns:
+            int: index of the first syllable without the flags
+        """
+        _prev = self.prev[i]
+        while self.flags[_prev] & flags:
+            _prev = self.prev[_prev]
+        return _prev
+
+    def check_pos(self, i: int, *poses, exclude: Optional[Tuple] = None) -> bool:
+        """
+        Check pos of given syllable.
+
+        Args:
+            i (int): index of syllable
+            poses (str): poses for check
+            exclude (Optional[Tuple]): excluded poses
+
+        Returns:
+            bool: whether pos of the syllable is contained in input poses or not.
+        """
+        return _check_pos(_pos_names[self.pos[i]], poses, exclude)
+
+    def check_text(self, i: int, *texts, exclude: Optional[Tuple] = None) -> bool:
+        """
+        Check text of given syllable.
+
+        Args:
+            i (int): index of syllable
+            texts (str): texts for check
+            exclude (Optional[Tuple]): excluded texts
+
+        Returns:
+            bool: whether text of the syllable is contained in input texts or not.
+        """
+        if i < 0:
+            return False
+
+        text = self.text[i]
+        for target in texts:
+            if target in text:
+                if exclude is not None:
+                    for e in exclude:
+                        if e in text:
+                            return False
+                return True
+        return False
+
+    def check_pos_and_text(
+        self,
+        i: int,
+        poses: Tuple,
+        texts: Tuple,
+        exclude_poses: Optional[Tuple] = None,
+        exclude_texts: Optional[Tuple] = None,
+    ) -> bool:
+        """
+        Check pos and text at the same time
+
+        Args:
+            i (int): index of syllable
+            poses: poses for check
+            texts (Tuple): texts for check
+            exclude_poses (Optional[Tuple]): excluded poses
+            exclude_texts (Optional[Tuple]): excluded texts
+
+        Returns:
+            bool: whether pos and text of the syllable are contained in input poses and texts.
+        """
+        if isinstance(poses, str):
+            poses = (poses,)
+        if isinstance(texts, str):
+            texts = (texts,)
+
+        return self.check_pos(i, *poses, exclude=exclude_poses) and self.check_text(
+            i, *texts, exclude=exclude_texts
+        )
+
+    def check_texts(self, i: int, text: str) -> bool:
+        """
+        Check texts of current and next syllables
+
+        Args:
+            i (int): index of syllable
+            text (str): texts for check
+
+        Returns:
+            bool: whether text of the current and next syllables re contained in input text or not.
+        """
+        if i < 0:
+            return False
+
+        _node = i
+        for char in text:
+            if _node < 0 or self.text[_node] != char:
+                return False
+            _node = self.next[_node]
+        return True
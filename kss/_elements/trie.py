@@ -0,0 +1,215 @@
+# Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
+# All rights reserved.
+
+import re
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple, Union
+
+_END = ""
+
+
+class Trie(object):
+    """
+    Trie of strings which is compiled into a regular expression for multi-pattern replacement.
+
+    Args:
+        words (Iterable[str]): strings in the trie. empty strings are ignored.
+
+    Examples:
+        >>> trie = Trie(["ab", "abc", "b"])
+        >>> trie.sub("*", "abcab b")
+        '** *'
+
+    Notes:
+        Strings which share a prefix share a branch of the pattern, so the regex engine follows
+        at most one branch for each character. The longest string at the leftmost position is replaced,
+        and the text is scanned once regardless of the number of strings.
+    """
+
+    __slots__ = ("root", "num_words", "_pattern")
+
+    def __init__(self, words: Iterable[str] = ()):
+        self.root: Dict[str, dict] = {}
+        self.num_words = 0
+        self._pattern = None
+
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        return self.num_words
+
+    def __contains__(self, word: str):
+        node = self.root
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                return False
+        return _END in node
+
+    def add(self, word: str):
+        """
+        Add a string to the trie.
+
+        Args:
+            word (str): string to add
+        """
+        if len(word) == 0 or word in self:
+            return
+
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_END] = {}
+        self.num_words += 1
+        self._pattern = None
+
+    @property
+    def pattern(self) -> re.Pattern:
+        """
+        Get the compiled pattern which matches the longest string of the trie.
+
+        Returns:
+            re.Pattern: compiled pattern. it never matches if the trie is empty.
+        """
+        if self._pattern is None:
+            self._pattern = re.compile(self._compile(self.root) if len(self.root) != 0 else "(?!)")
+        return self._pattern
+
+    def sub(self, repl: Union[str, Callable[[re.Match], str]], text: str) -> str:
+        """
+        Replace the strings of the trie in the text.
+
+        Args:
+            repl (Union[str, Callable[[re.Match], str]]): replacement string or function like `re.sub`
+            text (str): input text
+
+        Returns:
+            str: replaced text
+        """
+        if self.num_words == 0:
+            return text
+        return self.pattern.sub(repl, text)
+
+    @classmethod
+    def _compile(cls, node: Dict[str, dict]) -> str:
+        branches = []
+        for char in sorted(node):
+            if char == _END:
+                continue
+
+            # a chain of nodes which have only one child is a literal.
+            literal, child = char, node[char]
+            while len(child) == 1 and _END not in child:
+                (char, child), = child.items()
+                literal += char
+            branches.append(re.escape(literal) + cls._compile(child))
+
+        if len(branches) == 0:
+            return ""
+
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # the greedy quantifier tries the longer strings first.
+        return f"(?:{pattern})?" if _END in node else pattern
+
+
+class AhoCorasick(object):
+    """
+    Aho-Corasick automaton of strings which finds all of their occurrences in one scan.
+
+    Args:
+        words (Iterable[str]): strings to find. empty strings are ignored.
+
+    Examples:
+        >>> automaton = AhoCorasick(["he", "she", "his", "hers"])
+        >>> list(automaton.finditer("ushers"))
+        [(1, 'she'), (2, 'he'), (2, 'hers')]
+        >>> sorted(automaton.findall("ushers"))
+        ['he', 'hers', 'she']
+
+    Notes:
+        Unlike `Trie.sub`, overlapping occurrences are also found.
+        The text is scanned once, so the time doesn't depend on the number of strings.
+    """
+
+    __slots__ = ("goto", "fail", "outputs", "num_words")
+
+    def __init__(self, words: Iterable[str] = ()):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[Tuple[str, ...]] = [()]
+        self.num_words = 0
+
+        for word in words:
+            if len(word) == 0:
+                continue
+
+            state = 0
+            for char in word:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = self.goto[state][char] = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.outputs.append(())
+                state = next_state
+
+            if len(self.outputs[state]) == 0:
+                self.outputs[state] = (word,)
+                self.num_words += 1
+
+        # the outputs of a state include the outputs of its fail state which is a suffix of it.
+        queue = deque(self.goto[0].values())
+        while len(queue) != 0:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                fail = self.fail[state]
+                while fail != 0 and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                fail = self.goto[fail].get(char, 0)
+                self.fail[next_state] = fail
+                self.outputs[next_state] += self.outputs[fail]
+                queue.append(next_state)
+
+    def __len__(self):
+        return self.num_words
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Find all occurrences of the strings in the text.
+
+        Args:
+            text (str): input text
+
+        Returns:
+            Iterator[Tuple[int, str]]: start index and string of the occurrences in order of their end index
+        """
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        state = 0
+        for i, char in enumerate(text):
+            while state != 0 and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for word in outputs[state]:
+                yield i - len(word) + 1, word
+
+    def findall(self, text: str) -> Set[str]:
+        """
+        Find the strings which occur in the text.
+
+        Args:
+            text (str): input text
+
+        Returns:
+            Set[str]: strings which occur in the text at least once
+        """
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        found = set()
+        state = 0
+        for char in text:
+            while state != 0 and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
@@ -8,7 +8,7 @@ from kss._modules.augmentation.replacement import SynonymReplacement
 from kss._modules.augmentation.utils import correct_josa
 from kss._utils.logger import highlight_diffs, logger
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers, _check_analyzer_backend_mecab_pecab_only
+from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers, _check_analyzer_backend_mecab_pecab_only, _check_executor
 
 
 def augment(
@@ -18,6 +18,7 @@ def augment(
     num_workers: Union[int, str] = "auto",
     backend: str = "auto",
     verbose: bool = False,
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     Augments text with synonym replacement method and, 
@@ -31,6 +32,7 @@ def augment(
         num_workers (Union[int, str]): the number of multiprocessing workers
         backend (str): morpheme analyzer backend. 'mecab', 'pecab' are supported
         verbose (bool): whether to print verbose outputs or not
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: augmented text or list of augmented texts
@@ -55,6 +57,7 @@ def augment(
     josa_correction = _check_type(josa_correction, "josa_correction", bool)
     verbose = _check_type(verbose, "verbose", bool)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
     _check_analyzer_backend_mecab_pecab_only(backend)
 
     if num_workers is not False and verbose:
@@ -74,6 +77,7 @@ def augment(
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -8,7 +8,7 @@ from kollocate import Kollocate
 
 from kss._utils.logger import logger
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers
+from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers, _check_executor
 
 kollocate_obj = Kollocate()
 
@@ -17,6 +17,7 @@ def collocate(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
     verbose: bool = False,
+    executor: str = "process",
 ) -> Union[dict, List[dict]]:
     """
     This returns collocation (연어) of given words.
@@ -26,6 +27,7 @@ def collocate(
         text (Union[str, List[str], Tuple[str]]): single word or list of words
         num_workers (Union[int, str]): the number of multiprocessing workers
         verbose (bool): whether to print verbose outputs or not
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[dict, List[dict]]: collocations and frequencies of words in text or list of collocations and frequencies
@@ -48,6 +50,7 @@ def collocate(
 
     verbose = _check_type(verbose, "verbose", bool)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     if not isinstance(text, str):
         verbose = False
@@ -63,6 +66,7 @@ def collocate(
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -35,7 +35,7 @@ from kss._modules.g2p.utils import (
 )
 from kss._modules.jamo._jamo import h2j, j2h
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_num_workers, _check_type, _check_analyzer_backend_mecab_pecab_only
+from kss._utils.sanity_checks import _check_text, _check_num_workers, _check_type, _check_analyzer_backend_mecab_pecab_only, _check_executor
 
 
 def g2p(
@@ -48,6 +48,7 @@ def g2p(
     num_workers: Union[int, str] = "auto",
     backend: str = "auto",
     verbose: bool = False,
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This function provides a way to convert Korean graphemes to phonemes.
@@ -63,6 +64,7 @@ def g2p(
         num_workers (Union[int, str]): the number of multiprocessing workers
         backend (str): morpheme analyzer backend. 'mecab', 'pecab' are supported
         verbose (bool): whether to print verbose outputs or not
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: phoneme string or list of phoneme strings from the given text
@@ -92,6 +94,7 @@ def g2p(
                                                      "convert_numbers_to_hangul_phonemes", bool)
     verbose = _check_type(verbose, "verbose", bool)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
     _check_analyzer_backend_mecab_pecab_only(backend)
 
     return _run_job(
@@ -107,6 +110,7 @@ def g2p(
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -7,7 +7,7 @@ from typing import Union, List, Tuple
 import distance
 from kss._modules.hangulization.hangulize import hangulize as _hangulize
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers
+from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers, _check_executor
 
 supported_langs = languages = {
     "lat": "라틴어",
@@ -55,6 +55,7 @@ def hangulize(
     text: Union[str, List[str], Tuple[str]],
     lang: str,
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This converts the given text to Hangul pronunciation.
@@ -63,6 +64,7 @@ def hangulize(
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         lang (str): source language code
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: Hangul pronunciation of the given text
@@ -85,11 +87,13 @@ def hangulize(
 
     lang = _check_lang(lang)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=partial(_hangulize, code=lang),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -8,12 +8,13 @@ from kss._modules.hanja.utils import translate
 from kss._modules.hanja.utils import split_hanja as _split_hanja
 from kss._modules.hanja.utils import is_hanja as _is_hanja
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_num_workers, _check_char, _check_type
+from kss._utils.sanity_checks import _check_text, _check_num_workers, _check_char, _check_type, _check_executor
 
 
 def split_hanja(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[List[str], List[List[str]]]:
     """
     This splits the given text into hanja string and non-hanja string.
@@ -21,6 +22,7 @@ def split_hanja(
     Args:
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: hanja string and non-hanja string of the given text
@@ -42,17 +44,20 @@ def split_hanja(
         return text
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=_split_hanja,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
 def is_hanja(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[bool, List[bool]]:
     """
     This checks if the given character is a hanja character.
@@ -60,6 +65,7 @@ def is_hanja(
     Args:
         text (Union[str, List[str], Tuple[str]): single character or list of characters
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[bool, List[bool]]: whether the given character is a hanja character or not
@@ -87,11 +93,13 @@ def is_hanja(
 
     text = _check_char(text)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=_is_hanja,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -101,6 +109,7 @@ def hanja2hangul(
     reverse: bool = False,
     html: bool = False,
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This converts hanja to hangul.
@@ -111,6 +120,7 @@ def hanja2hangul(
         reverse (bool): whether to reverse the order of hanja and hangul or not
         html (bool): whether to return html format or not
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: hanja to hangul converted text or list of texts
@@ -132,6 +142,7 @@ def hanja2hangul(
         return text
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
     combination = _check_type(combination, "combination", bool)
     reverse = _check_type(reverse, "reverse", bool)
     html = _check_type(html, "html", bool)
@@ -150,6 +161,7 @@ def hanja2hangul(
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -9,12 +9,13 @@ import jamo
 
 from kss._modules.jamo.utils import _j2h
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_num_workers, _check_text, _check_type, _check_char
+from kss._utils.sanity_checks import _check_num_workers, _check_text, _check_type, _check_char, _check_executor
 
 
 def h2j(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This converts a string of Hangul to jamo.
@@ -22,6 +23,7 @@ def h2j(
     Args:
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: jamo string of the given text
@@ -44,17 +46,20 @@ def h2j(
         return text
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=jamo.h2j,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
 def h2hcj(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This converts a string of Hangul to Hangul Compatibility Jamo.
@@ -62,6 +67,7 @@ def h2hcj(
     Args:
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: Hangul Compatibility Jamo string of the given text
@@ -84,11 +90,13 @@ def h2hcj(
         return text
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=hangul_jamo.decompose,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -96,6 +104,7 @@ def j2h(
     text: Union[str, List[str], Tuple[str]],
     add_placeholder_for_leading_vowels: bool = False,
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This converts a string of jamo to Hangul.
@@ -104,6 +113,7 @@ def j2h(
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         add_placeholder_for_leading_vowels (bool): add 'ㅇ' for leading vowels (e.g. 'ㅐ플' -> '애플')
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: Hangul string of the given text
@@ -126,6 +136,7 @@ def j2h(
         return text
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
     add_placeholder_for_leading_vowels = _check_type(
         add_placeholder_for_leading_vowels, "add_placeholder_for_leading_vowels", bool
     )
@@ -134,12 +145,14 @@ def j2h(
         func=partial(_j2h, add_placeholder_for_leading_vowels=add_placeholder_for_leading_vowels),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
 def j2hcj(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This converts a string of jamo to Hangul Compatibility Jamo.
@@ -147,6 +160,7 @@ def j2hcj(
     Args:
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: Hangul Compatibility Jamo string of the given text
@@ -168,17 +182,20 @@ def j2hcj(
         return text
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=jamo.j2hcj,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
 def hcj2h(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This converts a string of Hangul Compatibility Jamo to Hangul.
@@ -186,6 +203,7 @@ def hcj2h(
     Args:
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: Hangul string of the given text
@@ -208,11 +226,13 @@ def hcj2h(
         return text
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=hangul_jamo.compose,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -220,6 +240,7 @@ def hcj2j(
     text: Union[str, List[str], Tuple[str]],
     position: str = "vowel",
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This converts a string of Hangul Compatibility Jamo to jamo.
@@ -228,6 +249,7 @@ def hcj2j(
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         position (str): the position of the HCJ character to convert to jamo character, one of 'lead', 'vowel', 'tail'
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: jamo string of the given text
@@ -251,6 +273,7 @@ def hcj2j(
 
     text = _check_char(text)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
     position = _check_type(position, "position", str).lower()
 
     if position not in ["lead", "vowel", "tail"]:
@@ -260,12 +283,14 @@ def hcj2j(
         func=partial(jamo.hcj2j, position=position),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
 def is_jamo(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[bool, List[bool]]:
     """
     This checks if a character is a jamo character.
@@ -273,6 +298,7 @@ def is_jamo(
     Args:
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[bool, List[bool]]: whether the given character is a jamo character or not
@@ -296,17 +322,20 @@ def is_jamo(
 
     text = _check_char(text)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=jamo.is_jamo,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
 def is_jamo_modern(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[bool, List[bool]]:
     """
     This checks if a character is a modern jamo character.
@@ -314,6 +343,7 @@ def is_jamo_modern(
     Args:
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[bool, List[bool]]: whether the given character is a modern jamo character or not
@@ -337,17 +367,20 @@ def is_jamo_modern(
 
     text = _check_char(text)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=jamo.is_jamo_modern,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
 def is_hcj(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[bool, List[bool]]:
     """
     This checks if a character is a Hangul Compatibility Jamo character.
@@ -355,6 +388,7 @@ def is_hcj(
     Args:
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[bool, List[bool]]: whether the given character is a Hangul Compatibility Jamo character or not
@@ -378,17 +412,20 @@ def is_hcj(
 
     text = _check_char(text)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=jamo.is_hcj,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
 def is_hcj_modern(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[bool, List[bool]]:
     """
     This checks if a character is a modern Hangul Compatibility Jamo character.
@@ -396,6 +433,7 @@ def is_hcj_modern(
     Args:
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[bool, List[bool]]: whether the given character is a modern Hangul Compatibility Jamo character or not
@@ -419,17 +457,20 @@ def is_hcj_modern(
 
     text = _check_char(text)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=jamo.is_hcj_modern,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
 def is_hangul_char(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[bool, List[bool]]:
     """
     This checks if a character is a Hangul character.
@@ -437,6 +478,7 @@ def is_hangul_char(
     Args:
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[bool, List[bool]]: whether the given character is a Hangul character or not
@@ -460,9 +502,11 @@ def is_hangul_char(
 
     text = _check_char(text)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=jamo.is_hangul_char,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
@@ -4,12 +4,14 @@
 from typing import Union, List
 
 from kss._modules.josa.utils import _check_text, _check_num_workers, _combine_josa, _run_job, _select_josa
+from kss._utils.sanity_checks import _check_executor
 
 
 def select_josa(
     prefix: Union[str, List[str]],
     josa: Union[str, List[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This selects the correct josa for the given prefix.
@@ -18,6 +20,7 @@ def select_josa(
         prefix (Union[str, List[str]): single prefix or list of prefixes
         josa (Union[str, List[str]): single josa or list of josas
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: the correct josa for the given prefix
@@ -36,6 +39,7 @@ def select_josa(
     """
     prefix, josa = _check_text(prefix, josa, "prefix", "josa")
     num_workers = _check_num_workers(prefix, josa, "prefix", "josa", num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=_select_josa,
@@ -44,6 +48,7 @@ def select_josa(
         input_1_name="prefix",
         input_2_name="josa",
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -51,6 +56,7 @@ def combine_josa(
     prefix: Union[str, List[str]],
     josa: Union[str, List[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This combines the given prefix and josa.
@@ -59,6 +65,7 @@ def combine_josa(
         prefix (Union[str, List[str]): single prefix or list of prefixes
         josa (Union[str, List[str]): single josa or list of josas
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: the combined prefix and josa
@@ -77,6 +84,7 @@ def combine_josa(
     """
     prefix, josa = _check_text(prefix, josa, "prefix", "josa")
     num_workers = _check_num_workers(prefix, josa, "prefix", "josa", num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=_combine_josa,
@@ -85,4 +93,5 @@ def combine_josa(
         input_1_name="prefix",
         input_2_name="josa",
         num_workers=num_workers,
+        executor=executor,
     )
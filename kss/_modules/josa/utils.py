@@ -1,12 +1,12 @@
 # Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
 # All rights reserved.
 
-import multiprocessing as mp
 from typing import Callable, Any, Optional, Union, List, Tuple
 
 import tossi
 
 from kss._modules.morphemes.split_morphemes import split_morphemes
+from kss._utils.multiprocessing import _get_pool, _get_thread_pool
 
 
 def _check_text(
@@ -57,6 +57,7 @@ def _run_job(
     input_1_name: str,
     input_2_name: str,
     num_workers: Optional[Union[int, bool]] = None,
+    executor: str = "process",
 ) -> Union[Any, List[Any]]:
     """
     Run job with or without multiprocessing.
@@ -68,8 +69,9 @@ def _run_job(
         input_1_name (str): input data name
         input_2_name (str): input data name
         num_workers (Optional[Union[int, bool]]): the number of multiprocessing workers.
+        executor (str): one of 'process', 'thread' and 'serial'
     """
-    if num_workers is False:
+    if num_workers is False or executor == "serial":
         if len(input_1) == 1 and len(input_2) == 1:
             return func(input_1[0], input_2[0])
         elif len(input_1) == 1 and len(input_2) > 1:
@@ -79,22 +81,21 @@ def _run_job(
         else:
             return [func(i, j) for i, j in zip(input_1, input_2)]
     else:
-        with mp.Pool(num_workers) as pool:
-            if len(input_1) == 1 and len(input_2) == 1:
-                raise ValueError(
-                    f"Oops! `{input_1_name}` or `{input_2_name}` "
-                    f"must have at least 2 elements when using multiprocessing."
-                )
-            elif len(input_1) == 1 and len(input_2) > 1:
-                output = pool.starmap(func, [(input_1[0], j) for j in input_2])
-            elif len(input_1) > 1 and len(input_2) == 1:
-                output = pool.starmap(func, [(i, input_2[0]) for i in input_1])
-            else:
-                output = pool.starmap(func, list(zip(input_1, input_2)))
-
-            pool.close()
-            pool.join()
-            return output
+        if len(input_1) == 1 and len(input_2) == 1:
+            raise ValueError(
+                f"Oops! `{input_1_name}` or `{input_2_name}` "
+                f"must have at least 2 elements when using multiprocessing."
+            )
+        elif len(input_1) == 1 and len(input_2) > 1:
+            inputs = [(input_1[0], j) for j in input_2]
+        elif len(input_1) > 1 and len(input_2) == 1:
+            inputs = [(i, input_2[0]) for i in input_1]
+        else:
+            inputs = list(zip(input_1, input_2))
+
+        if executor == "thread":
+            return list(_get_thread_pool(num_workers).map(func, *zip(*inputs)))
+        return _get_pool(num_workers).starmap(func, inputs)
 
 
 def _check_num_workers(
@@ -1,30 +1,26 @@
 # Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
 # All rights reserved.
 
+import threading
 from abc import ABC
-from functools import lru_cache
-from typing import Tuple, List, Any
+from typing import Tuple, List, Any, Callable, Optional
 
+from kss._modules.morphemes.cache import _analysis_cache, _analysis_key
 from kss._modules.morphemes.utils import _get_mecab, _get_pecab, _preserve_space
 from kss._utils.const import spaces
 
 
-class Analyzer(ABC):
-    _analyzer, _backend = None, None
+_thread_local = threading.local()
 
-    def pos(self, text: str, drop_space: bool) -> Any:
-        raise NotImplementedError
 
-    @staticmethod
-    def _drop_space(tokens: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
-        return [token for token in tokens if token[0] not in spaces]
+class Analyzer(ABC):
+    _analyzer, _backend = None, None
+    # the factory of `_analyzer` if it is not thread-safe
+    _factory: Optional[Callable] = None
 
+    # cache the analysis in the process-wide analysis cache or not
+    _cacheable: bool = True
 
-class MecabAnalyzer(Analyzer):
-    # `_analyzer` object must be class variable because of multiprocessing
-    _analyzer, _backend = _get_mecab()
-
-    @lru_cache(maxsize=500)
     def pos(self, text: str, drop_space: bool) -> List[Tuple[str, str]]:
         """
         Get pos information.
@@ -36,61 +32,148 @@ class MecabAnalyzer(Analyzer):
         Returns:
             List[Tuple[str, str]]: output of analysis.
         """
-        output = self._analyzer.pos(text)
-        output = _preserve_space(text, output, spaces=" \n\r\t\v")
+        if not self._cacheable:
+            output = self._analyze(text)
+        else:
+            key = _analysis_key(text, self._backend)
+            output = _analysis_cache.get(key)
+            if output is None:
+                output = self._analyze(text)
+                _analysis_cache.put(key, output)
 
         if drop_space:
             output = self._drop_space(output)
 
         return output
 
-
-class PecabAnalyzer(Analyzer):
-    # `_analyzer` object must be class variable because of multiprocessing
-    _analyzer, _backend = _get_pecab()
-
-    @lru_cache(maxsize=500)
-    def pos(self, text: str, drop_space: bool) -> List[Tuple[str, str]]:
+    def pos_batch(self, texts: List[str], drop_space: bool) -> List[List[Tuple[str, str]]]:
         """
-        Get pos information.
+        Get pos information of many texts at once.
 
         Args:
-            text (str): input text
+            texts (List[str]): input texts
             drop_space (bool): drop all spaces or not.
 
         Returns:
-            List[Tuple[str, str]]: output of analysis.
+            List[List[Tuple[str, str]]]: output of analysis for each text.
+
+        Notes:
+            The analysis cache is looked up for all texts first,
+            and the texts which were not cached are analyzed together once even if they are duplicated.
         """
-        output = self._analyzer.pos(text)
-        output = _preserve_space(text, output, spaces=" \n\r\t\v\f")
+        outputs: List[Optional[List[Tuple[str, str]]]] = [None] * len(texts)
+        keys = []
+
+        if self._cacheable:
+            keys = [_analysis_key(text, self._backend) for text in texts]
+            outputs = [_analysis_cache.get(key) for key in keys]
+
+        missing = {}
+        for i, (text, output) in enumerate(zip(texts, outputs)):
+            if output is None:
+                missing.setdefault(text, []).append(i)
+
+        if len(missing) != 0:
+            for text, output in zip(missing, self._analyze_batch(list(missing))):
+                indices = missing[text]
+                if self._cacheable:
+                    _analysis_cache.put(keys[indices[0]], output)
+                for i in indices:
+                    outputs[i] = output if i == indices[0] else list(output)
 
         if drop_space:
-            output = self._drop_space(output)
-
-        return output
-
+            outputs = [self._drop_space(output) for output in outputs]
 
-class CharacterAnalyzer(Analyzer):
-    _analyzer, _backend = None, "character"
+        return outputs
 
-    @lru_cache(maxsize=500)
-    def pos(self, text: str, drop_space: bool) -> List[Tuple[str, str]]:
+    def _analyze(self, text: str) -> List[Tuple[str, str]]:
         """
-        Get pos information.
+        Analyze text without dropping spaces.
 
         Args:
             text (str): input text
-            drop_space (bool): drop all spaces or not.
 
         Returns:
             List[Tuple[str, str]]: output of analysis.
         """
-        output = [(char, "-") for char in text]
+        raise NotImplementedError
 
-        if drop_space:
-            output = self._drop_space(output)
+    def _analyze_batch(self, texts: List[str]) -> List[List[Tuple[str, str]]]:
+        """
+        Analyze texts which are not cached without dropping spaces.
 
-        return output
+        Args:
+            texts (List[str]): input texts
+
+        Returns:
+            List[List[Tuple[str, str]]]: output of analysis for each text.
+
+        Notes:
+            Each text is analyzed by its own call. Joining the texts with a separator into one call
+            was measured with `bench/sentence_split/analysis_batch.py`, and it was not faster for mecab and pecab.
+            It also changes the analysis, because the last morpheme of each text is followed by the separator
+            instead of the end of the sentence. e.g. '.' is tagged as 'SY' instead of 'SF'.
+        """
+        return [self._analyze(text) for text in texts]
+
+    def _get_analyzer(self) -> Any:
+        """
+        Get the analyzer of the current thread.
+
+        Returns:
+            Any: morpheme analyzer object
+
+        Notes:
+            The main thread uses the class variable `_analyzer`.
+            Other threads create their own analyzer with `_factory` once, because taggers keep their state while parsing.
+        """
+        if self._factory is None or self._analyzer is None or threading.current_thread() is threading.main_thread():
+            return self._analyzer
+
+        analyzers = getattr(_thread_local, "analyzers", None)
+        if analyzers is None:
+            analyzers = _thread_local.analyzers = {}
+        if self._backend not in analyzers:
+            analyzers[self._backend] = self._factory()[0]
+        return analyzers[self._backend]
+
+    @staticmethod
+    def _drop_space(tokens: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        return [token for token in tokens if token[0] not in spaces]
+
+
+class MecabAnalyzer(Analyzer):
+    # `_analyzer` object must be class variable because of multiprocessing
+    _analyzer, _backend = _get_mecab()
+    _factory = staticmethod(_get_mecab)
+
+    def _analyze(self, text: str) -> List[Tuple[str, str]]:
+        output = self._get_analyzer().pos(text)
+        return _preserve_space(text, output, spaces=" \n\r\t\v")
+
+    def _analyze_batch(self, texts: List[str]) -> List[List[Tuple[str, str]]]:
+        # the tagger of the thread is looked up once for all texts.
+        # texts are not joined into one input, refer to `Analyzer._analyze_batch`.
+        pos = self._get_analyzer().pos
+        return [_preserve_space(text, pos(text), spaces=" \n\r\t\v") for text in texts]
+
+
+class PecabAnalyzer(Analyzer):
+    # `_analyzer` object must be class variable because of multiprocessing
+    _analyzer, _backend = _get_pecab()
+
+    def _analyze(self, text: str) -> List[Tuple[str, str]]:
+        output = self._analyzer.pos(text)
+        return _preserve_space(text, output, spaces=" \n\r\t\v\f")
+
+
+class CharacterAnalyzer(Analyzer):
+    _analyzer, _backend = None, "character"
+    # splitting characters is cheaper than hashing the text.
+    _cacheable = False
+
+    def _analyze(self, text: str) -> List[Tuple[str, str]]:
+        return [(char, "-") for char in text]
 
 
 class FastAnalyzer(CharacterAnalyzer):
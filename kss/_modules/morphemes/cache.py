@@ -0,0 +1,433 @@
+# Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
+# All rights reserved.
+
+import atexit
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from kss._modules.morphemes.utils import _dictionary_version
+
+# (surfaces joined without separator, end offset of each surface, pos tags)
+_Entry = Tuple[str, array, Tuple[str, ...]]
+
+# the disk cache is enabled by environment variables, so the workers started by `spawn` enable it too.
+_DISK_CACHE_PATH = "KSS_DISK_CACHE"
+_DISK_CACHE_MAX_BYTES = "KSS_DISK_CACHE_MAX_BYTES"
+
+
+def _analysis_key(text: str, backend: str) -> bytes:
+    """
+    Make the cache key of an analysis.
+
+    Args:
+        text (str): input text
+        backend (str): backend name
+
+    Returns:
+        bytes: 16 bytes digest of the text, the backend and the version of its dictionary
+    """
+    name = f"{backend}:{_dictionary_version(backend)}".encode()[:64]
+    return blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16, key=name).digest()
+
+
+def _encode(tokens: List[Tuple[str, str]], tags: Dict[str, str]) -> _Entry:
+    ends, end = array("I"), 0
+    for surface, _ in tokens:
+        end += len(surface)
+        ends.append(end)
+
+    # pos tags are repeated a lot, so the same string objects are shared.
+    return "".join(surface for surface, _ in tokens), ends, tuple(tags.setdefault(tag, tag) for _, tag in tokens)
+
+
+def _decode(entry: _Entry) -> List[Tuple[str, str]]:
+    surfaces, ends, tags = entry
+    output, start = [], 0
+    for end, tag in zip(ends, tags):
+        output.append((surfaces[start:end], tag))
+        start = end
+    return output
+
+
+class _DiskCache(object):
+    """
+    Persistent cache of morpheme analysis in a SQLite database.
+
+    Notes:
+        The database is opened in WAL mode, so the worker processes can read it concurrently.
+        Each process opens its own connection, because a connection can't be shared after `fork`.
+        The least recently used analyses are removed when the database becomes bigger than `max_bytes`.
+    """
+
+    # the number of reads buffered before their access times are written.
+    _touch_buffer_size = 256
+
+    def __init__(self):
+        self.path: Optional[str] = None
+        self.max_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+        self._inherited: List[sqlite3.Connection] = []
+        self._touched: Set[bytes] = set()
+        self._lock = threading.RLock()
+
+    def open(self, path: str, max_bytes: Optional[int]):
+        self.close()
+        with self._lock:
+            self.path, self.max_bytes = path, max_bytes
+            self.hits = self.misses = 0
+            self._connect()
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None and self._connection_pid == os.getpid():
+                self._flush_touched()
+                self._connection.close()
+            elif self._connection is not None:
+                self._inherited.append(self._connection)
+            self._connection, self._connection_pid = None, None
+            self.path, self.max_bytes = None, None
+            self._touched.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None or self._connection_pid != os.getpid():
+            # the connection and the buffered reads of the parent process are not ours after `fork`.
+            # the connection is kept without closing it, because closing it can break the parent's database.
+            if self._connection is not None:
+                self._inherited.append(self._connection)
+            self._touched.clear()
+            connection = sqlite3.connect(self.path, timeout=60, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS analyses "
+                "(key BLOB PRIMARY KEY, data BLOB NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS analyses_used ON analyses (used)")
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            connection.execute("INSERT OR IGNORE INTO meta (name, value) VALUES ('bytes', 0)")
+            self._connection, self._connection_pid = connection, os.getpid()
+        return self._connection
+
+    def get(self, key: bytes) -> Optional[_Entry]:
+        with self._lock:
+            row = self._connect().execute("SELECT data FROM analyses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._touched.add(key)
+            if len(self._touched) >= self._touch_buffer_size:
+                self._write()
+
+        surfaces, ends, tags = pickle.loads(row[0])
+        return surfaces, array("I", ends), tags
+
+    def put(self, key: bytes, entry: _Entry):
+        data = pickle.dumps((entry[0], entry[1].tobytes(), entry[2]), protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._write((key, data))
+
+    def _write(self, item: Optional[Tuple[bytes, bytes]] = None):
+        """
+        Write an analysis and the buffered access times, and evict old analyses in one transaction.
+
+        Args:
+            item (Optional[Tuple[bytes, bytes]]): key and data of an analysis
+        """
+        connection = self._connect()
+        now = time.time()
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if item is not None:
+                key, data = item
+                size = len(key) + len(data)
+                inserted = connection.execute(
+                    "INSERT OR IGNORE INTO analyses (key, data, size, used) VALUES (?, ?, ?, ?)",
+                    (key, data, size, now),
+                ).rowcount
+                if inserted:
+                    connection.execute("UPDATE meta SET value = value + ? WHERE name = 'bytes'", (size,))
+
+            if len(self._touched) != 0:
+                connection.executemany("UPDATE analyses SET used = ? WHERE key = ?", [(now, k) for k in self._touched])
+
+            num_bytes = connection.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+            if self.max_bytes is not None and num_bytes > self.max_bytes:
+                # evict a bit more than needed, so that eviction doesn't happen for every write.
+                self._evict(connection, num_bytes - int(self.max_bytes * 0.9))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self._touched.clear()
+
+    @staticmethod
+    def _evict(connection: sqlite3.Connection, num_bytes: int):
+        keys, freed = [], 0
+        for key, size in connection.execute("SELECT key, size FROM analyses ORDER BY used"):
+            if freed >= num_bytes:
+                break
+            keys.append((key,))
+            freed += size
+
+        connection.executemany("DELETE FROM analyses WHERE key = ?", keys)
+        connection.execute("UPDATE meta SET value = value - ? WHERE name = 'bytes'", (freed,))
+
+    def _flush_touched(self):
+        if len(self._touched) != 0:
+            self._write()
+
+    def info(self) -> Dict[str, Union[str, int, None]]:
+        with self._lock:
+            connection = self._connect()
+            entries = connection.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+            num_bytes = connection.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+            return {
+                "path": self.path,
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": entries,
+                "bytes": num_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class _AnalysisCache(object):
+    """
+    LRU cache of morpheme analysis shared by all analyzers and modules in a process.
+
+    Args:
+        max_entries (int): the maximum number of cached texts. 0 disables the cache.
+        max_bytes (int): the maximum (approximate) memory of cached analyses in bytes.
+
+    Notes:
+        A text is keyed by its digest, so the cache doesn't keep the texts alive.
+        The analysis is stored once with spaces, and `drop_space=True` is applied when it is read.
+        If the disk cache is enabled, it is looked up when the analysis is not in memory.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.num_bytes = 0
+        self.disk = _DiskCache()
+        self._entries: "OrderedDict[bytes, Tuple[_Entry, int]]" = OrderedDict()
+        self._tags: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[List[Tuple[str, str]]]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+        if item is not None:
+            return _decode(item[0])
+
+        if self.disk.path is not None:
+            entry = self.disk.get(key)
+            if entry is not None:
+                self._put_memory(key, entry)
+                return _decode(entry)
+        return None
+
+    def put(self, key: bytes, tokens: List[Tuple[str, str]]):
+        if self.max_entries <= 0 and self.disk.path is None:
+            return
+
+        entry = _encode(tokens, self._tags)
+        self._put_memory(key, entry)
+        if self.disk.path is not None:
+            self.disk.put(key, entry)
+
+    def _put_memory(self, key: bytes, entry: _Entry):
+        if self.max_entries <= 0:
+            return
+
+        num_bytes = sys.getsizeof(entry[0]) + sys.getsizeof(entry[1]) + sys.getsizeof(entry[2]) + len(key) + 64
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (entry, num_bytes)
+            self.num_bytes += num_bytes
+            self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries or (self.num_bytes > self.max_bytes and len(self._entries) != 0):
+            _, (_, num_bytes) = self._entries.popitem(last=False)
+            self.num_bytes -= num_bytes
+
+    def resize(self, max_entries: int, max_bytes: int):
+        with self._lock:
+            self.max_entries, self.max_bytes = max_entries, max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.num_bytes = self.hits = self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self.num_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_analysis_cache = _AnalysisCache()
+
+if os.environ.get(_DISK_CACHE_PATH):
+    _max_disk_bytes = os.environ.get(_DISK_CACHE_MAX_BYTES)
+    _analysis_cache.disk.open(os.environ[_DISK_CACHE_PATH], int(_max_disk_bytes) if _max_disk_bytes else None)
+
+atexit.register(_analysis_cache.disk.close)
+
+
+def set_analysis_cache(max_entries: int = 10000, max_bytes: int = 256 * 1024 * 1024) -> None:
+    """
+    Set the size of the morpheme analysis cache.
+
+    Args:
+        max_entries (int): the maximum number of cached texts. 0 disables the cache.
+        max_bytes (int): the maximum memory of cached analyses in bytes. it is approximate.
+
+    Examples:
+        >>> import kss
+        >>> kss.set_analysis_cache(max_entries=100000, max_bytes=1024 ** 3)
+        >>> kss.set_analysis_cache(max_entries=0)  # disable the cache
+
+    Notes:
+        The cache is shared by all modules in a process.
+        So `split_sentences`, `correct_spacing`, `summarize_sentences` and etc. don't analyze the same text again.
+        Each multiprocessing worker has its own cache, so call this before the workers are created
+        (or call `kss.close_pool()` after this) to change the size of their caches too.
+    """
+    from kss._utils.sanity_checks import _check_type
+
+    max_entries = _check_type(max_entries, "max_entries", int)
+    max_bytes = _check_type(max_bytes, "max_bytes", int)
+
+    for name, value in [("max_entries", max_entries), ("max_bytes", max_bytes)]:
+        if value < 0:
+            raise ValueError(
+                f"Oops! `{name}` must be same or greater than 0, but you input {value}.\n"
+                f"Please check `{name}` parameter again ;)"
+            )
+
+    _analysis_cache.resize(max_entries, max_bytes)
+
+
+def clear_analysis_cache() -> None:
+    """
+    Remove all cached analyses and reset the counters of the current process.
+    """
+    _analysis_cache.clear()
+
+
+def analysis_cache_info() -> Dict[str, int]:
+    """
+    Get statistics of the morpheme analysis cache of the current process.
+
+    Returns:
+        Dict[str, int]: 'hits', 'misses', 'entries', 'bytes', 'max_entries' and 'max_bytes'
+
+    Examples:
+        >>> import kss
+        >>> kss.split_sentences("회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요")
+        >>> kss.correct_spacing("회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요")
+        >>> kss.analysis_cache_info()
+        {'hits': 1, 'misses': 1, 'entries': 1, 'bytes': 412, 'max_entries': 10000, 'max_bytes': 268435456}
+    """
+    return _analysis_cache.info()
+
+
+def enable_disk_cache(path: str, max_bytes: Optional[int] = 4 * 1024 ** 3) -> None:
+    """
+    Store morpheme analyses in a SQLite database, so that the next runs over the same corpus don't analyze it again.
+
+    Args:
+        path (str): path of the database file. it is created if it doesn't exist.
+        max_bytes (Optional[int]): the maximum size of cached analyses in bytes.
+            the least recently used analyses are removed when it is exceeded. `None` means no limit.
+
+    Examples:
+        >>> import kss
+        >>> kss.enable_disk_cache("~/.cache/kss/analyses.db")
+        >>> kss.split_sentences(YOUR_LIST_OF_TEXTS, backend="mecab")
+        >>> kss.disk_cache_info()
+        {'path': '/home/user/.cache/kss/analyses.db', 'hits': 0, 'misses': 0, 'entries': 12345, ...}
+
+    Notes:
+        Analyses are keyed by the text, the backend and the version of its dictionary.
+        The database is shared by the multiprocessing workers safely.
+        The worker pool is closed, so that the new workers use the disk cache too.
+    """
+    from kss._utils.multiprocessing import close_pool
+    from kss._utils.sanity_checks import _check_type
+
+    path = os.path.abspath(os.path.expanduser(_check_type(path, "path", str)))
+    if max_bytes is not None:
+        max_bytes = _check_type(max_bytes, "max_bytes", int)
+        if max_bytes < 0:
+            raise ValueError(
+                f"Oops! `max_bytes` must be same or greater than 0, but you input {max_bytes}.\n"
+                "Please check `max_bytes` parameter again ;)"
+            )
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _analysis_cache.disk.open(path, max_bytes)
+    os.environ[_DISK_CACHE_PATH] = path
+    os.environ[_DISK_CACHE_MAX_BYTES] = str(max_bytes) if max_bytes is not None else ""
+    close_pool()
+
+
+def disable_disk_cache() -> None:
+    """
+    Stop using the disk cache. The database file is not removed.
+    """
+    from kss._utils.multiprocessing import close_pool
+
+    _analysis_cache.disk.close()
+    os.environ.pop(_DISK_CACHE_PATH, None)
+    os.environ.pop(_DISK_CACHE_MAX_BYTES, None)
+    close_pool()
+
+
+def disk_cache_info() -> Dict[str, Union[str, int, None]]:
+    """
+    Get statistics of the disk cache.
+
+    Returns:
+        Dict[str, Union[str, int, None]]: 'path', 'hits', 'misses', 'entries', 'bytes' and 'max_bytes'.
+            'hits' and 'misses' are counted in the current process,
+            and 'entries' and 'bytes' are of the whole database.
+    """
+    if _analysis_cache.disk.path is None:
+        raise RuntimeError(
+            "Oops! The disk cache is not enabled.\n"
+            "Please call `kss.enable_disk_cache(path)` first ;)"
+        )
+    return _analysis_cache.disk.info()
@@ -4,12 +4,13 @@
 from functools import partial
 from typing import List, Union, Tuple
 
-from kss._utils.multiprocessing import _run_job
+from kss._utils.multiprocessing import _run_batch_job
 from kss._utils.sanity_checks import (
     _check_text,
     _check_analyzer_backend_mecab_pecab_only,
     _check_num_workers,
     _check_type,
+    _check_executor,
 )
 
 
@@ -18,6 +19,7 @@ def split_morphemes(
     backend: str = "auto",
     num_workers: Union[int, str] = "auto",
     drop_space: bool = True,
+    executor: str = "process",
 ) -> Union[List[Tuple[str, str]], List[List[Tuple[str, str]]], Union[List, Tuple]]:
     """
     This splits texts into morphemes.
@@ -27,6 +29,7 @@ def split_morphemes(
         backend (str): morpheme analyzer backend. 'mecab', 'pecab' are supported.
         num_workers (Union[int, str])): the number of multiprocessing workers
         drop_space (bool): drop all spaces in output or not
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[List[Tuple[str, str]], List[List[Tuple[str, str]]], Union[List, Tuple]]:
@@ -47,6 +50,7 @@ def split_morphemes(
         return text
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
     backend = _check_analyzer_backend_mecab_pecab_only(backend)
-    result = _run_job(partial(backend.pos, drop_space=drop_space), text, num_workers)
+    result = _run_batch_job(partial(backend.pos_batch, drop_space=drop_space), text, num_workers, executor)
     return result
@@ -1,6 +1,7 @@
 # Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
 # All rights reserved.
 
+from functools import lru_cache
 from typing import List, Tuple
 
 
@@ -102,6 +103,40 @@ def _get_pecab():
         return None, None
 
 
+@lru_cache(maxsize=None)
+def _dictionary_version(backend: str) -> str:
+    """
+    Get the version of the dictionary used by the backend.
+
+    Args:
+        backend (str): backend name
+
+    Returns:
+        str: version of the package which ships the dictionary of the backend
+
+    Notes:
+        mecab, konlpy and pecab don't expose the version of their dictionaries,
+        so the version of the package which ships the dictionary is used instead.
+    """
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return "unknown"
+
+    packages = {
+        "mecab": ["python-mecab-kor", "mecab-python-msvc", "mecab-python3"],
+        "konlpy": ["konlpy"],
+        "pecab": ["pecab"],
+    }
+
+    for package in packages.get(backend, []):
+        try:
+            return f"{package}=={version(package)}"
+        except PackageNotFoundError:
+            continue
+    return "unknown"
+
+
 def _preserve_space(
     text: str,
     tokens: List[Tuple[str, str]],
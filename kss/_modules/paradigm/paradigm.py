@@ -8,7 +8,7 @@ import xlrd
 
 from kss._utils.logger import logger
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_num_workers
+from kss._utils.sanity_checks import _check_text, _check_num_workers, _check_executor
 
 xlrd.xlsx.ensure_elementtree_imported(False, None)
 xlrd.xlsx.Element_has_iter = True
@@ -22,6 +22,7 @@ def paradigm(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
     verbose: bool = False,
+    executor: str = "process",
 ) -> Union[Dict[str, str], List[Dict[str, str]]]:
     """
     This searches paradigms of the given text.
@@ -30,6 +31,7 @@ def paradigm(
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
         verbose (bool): whether to print the results or not
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[Dict[str, str], List[Dict[str, str]]]: paradigms of the given text
@@ -51,6 +53,7 @@ def paradigm(
         return [] if isinstance(text, list) else {}
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     if num_workers is not False and verbose:
         verbose = False
@@ -63,6 +66,7 @@ def paradigm(
         func=partial(_paradigm, verbose=verbose),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
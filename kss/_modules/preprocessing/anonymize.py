@@ -9,7 +9,7 @@ from functools import partial
 from typing import Tuple, List, Union
 
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_type, _check_num_workers, _check_text
+from kss._utils.sanity_checks import _check_type, _check_num_workers, _check_text, _check_executor
 
 
 PHONE_NUMBER_PATTERN = re.compile(r"([0-9]{2,3}-[0-9]{3,4}-[0-9]{4})|([0-9]{2,3}[0-9]{3,4}[0-9]{4})")
@@ -132,6 +132,7 @@ def anonymize(
     ip_v6_replacement: str = "<IPV6>",
     ip_v4_replacement: str = "<IPV4>",
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ):
     """
     This anonymizes sensitive information in the given text.
@@ -161,6 +162,7 @@ def anonymize(
         ip_v6_replacement (str): the replacement string for IPv6 addresses, default is "<IPV6>"
         ip_v4_replacement (str): the replacement string for IPv4 addresses, default is "<IPV4>"
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str], Tuple[str]]: anonymized text or list of anonymized texts
@@ -201,6 +203,7 @@ def anonymize(
     ip_v6_replacement = _check_type(ip_v6_replacement, "ip_v6_replacement", str)
     ip_v4_replacement = _check_type(ip_v4_replacement, "ip_v4_replacement", str)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=partial(
@@ -230,6 +233,7 @@ def anonymize(
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -7,7 +7,7 @@ from typing import Union, List, Tuple
 
 from kss._utils.logger import highlight_diffs, logger
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers
+from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers, _check_executor
 
 normalization_open = {
     "< ": "<",
@@ -281,6 +281,7 @@ def clean_news(
     footer_ratio: float = 0.4,
     num_workers: Union[int, str] = "auto",
     verbose: bool = False,
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This cleans news articles by removing useless headers and footers.
@@ -292,6 +293,7 @@ def clean_news(
         footer_ratio (float): Ratio of the number of sentences to check in the footer. Defaults to 0.4.
         num_workers (Union[int, str]): the number of multiprocessing workers
         verbose (bool): whether to print verbose outputs or not
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: Cleaned text or list of cleaned texts.
@@ -317,6 +319,7 @@ def clean_news(
     assert header_ratio + footer_ratio < 1, "header_ratio + footer_ratio should be less than 1"
     verbose = _check_type(verbose, "verbose", bool)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     if num_workers is not False and verbose:
         verbose = False
@@ -335,6 +338,7 @@ def clean_news(
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -4,12 +4,13 @@
 from typing import Tuple, List, Union
 
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_num_workers, _check_char
+from kss._utils.sanity_checks import _check_text, _check_num_workers, _check_char, _check_executor
 
 
 def is_completed_form(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[bool, List[bool]]:
     """
     This checks if the given text is in completed form.
@@ -17,6 +18,7 @@ def is_completed_form(
     Args:
         text (Union[str, List[str], Tuple[str]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[bool, List[bool]]: whether the given text is in completed form or not
@@ -39,12 +41,14 @@ def is_completed_form(
         return False
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
     text = _check_char(text)
 
     return _run_job(
         func=_is_completed_form,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -11,7 +11,7 @@ from typing import Union, Tuple, Dict, Any, List
 
 from kss._modules.preprocessing.completed_form import _incompleted_form_ratio
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_type, _check_num_workers, _check_text
+from kss._utils.sanity_checks import _check_type, _check_num_workers, _check_text, _check_executor
 
 hangul_pattern = re.compile(r'[ㄱ-ㅎㅏ-ㅣ가-힣]')
 symbols_pattern = re.compile("#+")
@@ -169,6 +169,7 @@ def filter_out(
     ngram_size_for_repeating_duplicate_ngrams: int = 3,
     max_hangul_incompleted_form_ratio: float = 1,
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[Tuple[bool, Dict[str, Any]], List[Tuple[bool, Dict[str, Any]]]]:
     """
     This filters out bad text based on various conditions.
@@ -216,6 +217,7 @@ def filter_out(
         ngram_size_for_repeating_duplicate_ngrams (int): ngram size for repeating duplicate ngrams
         max_hangul_incompleted_form_ratio (float): maximum hangul non completed form ratio
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[Tuple[bool, Dict[str, Any]], List[Tuple[bool, Dict[str, Any]]]]: filtered out text or list of filtered out texts
@@ -281,6 +283,7 @@ def filter_out(
     max_hangul_incompleted_form_ratio = _check_type(max_hangul_incompleted_form_ratio,
                                                       "max_hangul_incompleted_form_ratio", float)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=partial(
@@ -328,6 +331,7 @@ def filter_out(
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
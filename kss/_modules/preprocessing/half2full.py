@@ -4,7 +4,7 @@
 from typing import Union, List, Tuple
 
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_num_workers, _check_text
+from kss._utils.sanity_checks import _check_num_workers, _check_text, _check_executor
 
 
 replace_map = {
@@ -62,6 +62,7 @@ replace_map = {
 def half2full(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This converts half-width characters to full-width characters.
@@ -69,6 +70,7 @@ def half2full(
     Args:
         text (Union[str, List[str], Tuple[str]]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: converted text or list of converted texts
@@ -86,11 +88,13 @@ def half2full(
         return text
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=_half2full,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -15,7 +15,7 @@ from kss._modules.preprocessing.half2full import _half2full
 from kss._modules.preprocessing.reduce_repeats import _reduce_char_repeats, _reduce_emoticon_repeats
 from kss._modules.preprocessing.remove_invisible_chars import _remove_invisible_chars
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers
+from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers, _check_executor
 
 doubled_spaces_pattern = re.compile('(\s)\\1{2,}')
 
@@ -32,6 +32,7 @@ def normalize(
     reduce_char_repeats_over: int = sys.maxsize,
     reduce_emoticon_repeats_over: int = sys.maxsize,
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This normalizes text with various options.
@@ -48,6 +49,7 @@ def normalize(
         reduce_char_repeats_over (int): the maximum number of character that can be repeated
         reduce_emoticon_repeats_over (int): the maximum number of emoticon that can be repeated
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: normalized text or list of normalized texts
@@ -75,6 +77,7 @@ def normalize(
     reduce_char_repeats_over = _check_type(reduce_char_repeats_over, "reduce_char_repeats_over", int)
     reduce_emoticon_repeats_over = _check_type(reduce_emoticon_repeats_over, "reduce_emoticon_repeats_over", int)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=partial(
@@ -91,6 +94,7 @@ def normalize(
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
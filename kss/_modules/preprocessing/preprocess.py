@@ -9,7 +9,7 @@ from kss._modules.preprocessing.anonymize import _anonymize
 from kss._modules.preprocessing.filter_out import _filter_out
 from kss._modules.preprocessing.normalize import _normalize
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers
+from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers, _check_executor
 
 
 def preprocess(
@@ -86,6 +86,7 @@ def preprocess(
     ip_v6_replacement: str = "<IPV6>",
     ip_v4_replacement: str = "<IPV4>",
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This preprocesses text with various options.
@@ -165,6 +166,7 @@ def preprocess(
         ip_v6_replacement (str): replacement for IPv6
         ip_v4_replacement (str): replacement for IPv4
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[Tuple[str, Dict[str, Any]], List[Tuple[str, Dict[str, Any]]]]:
@@ -255,6 +257,7 @@ def preprocess(
     ip_v6_replacement = _check_type(ip_v6_replacement, "ip_v6_replacement", str)
     ip_v4_replacement = _check_type(ip_v4_replacement, "ip_v4_replacement", str)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=partial(
@@ -333,6 +336,7 @@ def preprocess(
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
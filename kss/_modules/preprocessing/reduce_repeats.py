@@ -9,7 +9,7 @@ from functools import partial
 from typing import List, Tuple, Union
 
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_num_workers, _check_text, _check_type
+from kss._utils.sanity_checks import _check_num_workers, _check_text, _check_type, _check_executor
 
 kor_begin = 44032
 kor_end = 55203
@@ -103,6 +103,7 @@ def reduce_char_repeats(
     text: Union[str, List[str], Tuple[str]],
     num_repeats: int = 2,
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This reduces character repeats in text.
@@ -111,6 +112,7 @@ def reduce_char_repeats(
         text (Union[str, List[str], Tuple[str]]): single text or list of texts
         num_repeats (int): the number of character that can be repeated
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: text with reduced character repeats or list of texts with reduced character repeats
@@ -134,11 +136,13 @@ def reduce_char_repeats(
 
     num_repeats = _check_type(num_repeats, "num_repeats", int)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=partial(_reduce_char_repeats, num_repeats=num_repeats),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -146,6 +150,7 @@ def reduce_emoticon_repeats(
     text: Union[str, List[str], Tuple[str]],
     num_repeats: int = 2,
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This reduces emoticon repeats in text.
@@ -154,6 +159,7 @@ def reduce_emoticon_repeats(
         text (Union[str, List[str], Tuple[str]]): single text or list of texts
         num_repeats (int): the number of emoticon that can be repeated
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: text with reduced emoticon repeats or list of texts with reduced emoticon repeats
@@ -177,11 +183,13 @@ def reduce_emoticon_repeats(
 
     num_repeats = _check_type(num_repeats, "num_repeats", int)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=partial(_reduce_emoticon_repeats, num_repeats=num_repeats),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
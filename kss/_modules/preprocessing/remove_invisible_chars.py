@@ -4,7 +4,7 @@
 from typing import Union, List, Tuple
 
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_num_workers
+from kss._utils.sanity_checks import _check_text, _check_num_workers, _check_executor
 
 UNICODE_TO_REMOVE = {
     0x0000: None,  # Null
@@ -161,6 +161,7 @@ UNICODE_TO_REPLACE = {
 def remove_invisible_chars(
     text: Union[str, List[str], Tuple[str]],
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This removes invisible characters from text.
@@ -168,6 +169,7 @@ def remove_invisible_chars(
     Args:
         text (Union[str, List[str], Tuple[str]]): single text or list of texts
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: text with removed invisible characters or list of texts with removed invisible characters
@@ -186,11 +188,13 @@ def remove_invisible_chars(
         return text
 
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=_remove_invisible_chars,
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
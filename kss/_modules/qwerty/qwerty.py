@@ -23,7 +23,7 @@ from kss._modules.qwerty.utils import (
     is_vowel,
 )
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers
+from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers, _check_executor
 
 
 def qwerty(
@@ -31,6 +31,7 @@ def qwerty(
     src: str,
     tgt: str,
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This converts text from one language to another using QWERTY keyboard layout.
@@ -40,6 +41,7 @@ def qwerty(
         src (str): source language
         tgt (str): target language
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: converted text or list of converted texts
@@ -65,6 +67,7 @@ def qwerty(
     src = _check_type(src, "src", str)
     tgt = _check_type(tgt, "tgt", str)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     if src not in ["en", "ko"] or tgt not in ["en", "ko"]:
         raise ValueError("`src` and `tgt` must be one of 'en', 'ko'")
@@ -73,6 +76,7 @@ def qwerty(
         func=partial(_qwerty, src=src, tgt=tgt),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
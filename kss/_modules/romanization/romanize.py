@@ -13,7 +13,7 @@ from unidecode import unidecode
 from kss._modules.g2p.g2p import g2p
 from kss._modules.romanization.utils import pronounce, Syllable
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers, _check_analyzer_backend_mecab_pecab_only
+from kss._utils.sanity_checks import _check_text, _check_type, _check_num_workers, _check_analyzer_backend_mecab_pecab_only, _check_executor
 
 vowel = {
     # 단모음 monophthongs
@@ -92,6 +92,7 @@ def romanize(
     convert_english_to_hangul_phonemes: bool = False,
     convert_numbers_to_hangul_phonemes: bool = False,
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[str, List[str]]:
     """
     This romanizes Korean text.
@@ -103,6 +104,7 @@ def romanize(
         convert_english_to_hangul_phonemes (bool): whether to convert English to Hangul phonemes or not
         convert_numbers_to_hangul_phonemes (bool): whether to convert numbers to Hangul phonemes or not
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[str, List[str]]: romanized text or list of romanized texts
@@ -133,6 +135,7 @@ def romanize(
     convert_numbers_to_hangul_phonemes = _check_type(convert_numbers_to_hangul_phonemes,
                                                      "convert_numbers_to_hangul_phonemes", bool)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=partial(
@@ -144,6 +147,7 @@ def romanize(
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -4,15 +4,16 @@
 from functools import partial
 from typing import Union, List, Tuple
 
-from kss._modules.safety.utils import bad_words, exceptions, pattern
+from kss._modules.safety.utils import bad_words_automaton, bad_words_order, exceptions, pattern
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_num_workers, _check_type
+from kss._utils.sanity_checks import _check_text, _check_num_workers, _check_type, _check_executor
 
 
 def is_unsafe(
     text: Union[str, List[str], Tuple[str]],
     return_matches: bool = False,
     num_workers: Union[int, str] = "auto",
+    executor: str = "process",
 ) -> Union[bool, List[bool], List[bool], List[List[str]]]:
     """
     This checks if the text is unsafe or not.
@@ -21,6 +22,7 @@ def is_unsafe(
         text (Union[str, List[str], Tuple[str]]): single text or list of texts
         return_matches (bool): whether to return matches or not
         num_workers (Union[int, str]): the number of multiprocessing workers
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[bool, List[bool], List[bool], List[List[str]]]:
@@ -50,6 +52,7 @@ def is_unsafe(
     text, finish = _check_text(text)
     return_matches = _check_type(return_matches, "return_matches", bool)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     if finish:
         return [] if return_matches else False
@@ -58,6 +61,7 @@ def is_unsafe(
         func=partial(_is_unsafe, return_matches=return_matches),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -90,21 +94,18 @@ def _is_unsafe_regex(text: str, return_matches: bool = False):
 
 
 def _is_unsafe_dict(text: str, return_matches: bool = False):
-    matches = []
-    for word in bad_words:
-        if word in text:
-            found_bad_words = True
-            if word in exceptions:
-                for exception in exceptions[word]:
-                    if exception in text:
-                        found_bad_words = False
-                        break
-            if found_bad_words:
-                if return_matches:
-                    matches.append(word)
-                else:
-                    return True
-    if return_matches:
-        return matches
-    else:
+    if not return_matches:
+        for _, word in bad_words_automaton.finditer(text):
+            if not _is_exception(word, text):
+                return True
         return False
+
+    matches = [word for word in bad_words_automaton.findall(text) if not _is_exception(word, text)]
+    return sorted(matches, key=bad_words_order.__getitem__)
+
+
+def _is_exception(word: str, text: str) -> bool:
+    for exception in exceptions.get(word, ()):
+        if exception in text:
+            return True
+    return False
@@ -3,6 +3,8 @@
 
 import re
 
+from kss._elements.trie import AhoCorasick
+
 # Copied from https://github.com/curioustorvald/KoreanCursewordRegex
 # And modified by Hyunwoong Ko [https://github.com/hyunwoongko]
 pattern = re.compile(
@@ -231,3 +233,7 @@ exceptions = {
 bad_words = [w.upper() for w in bad_words]
 bad_words = set(bad_words)
 # print(sorted(list(bad_words)))
+
+# all bad words are found in one scan of the text, and the matches are returned in order of `bad_words`.
+bad_words_automaton = AhoCorasick(bad_words)
+bad_words_order = {word: i for i, word in enumerate(bad_words)}
@@ -4,9 +4,8 @@
 
 from functools import lru_cache
 from itertools import chain
-from typing import List, Dict, Tuple, Iterable, Optional
+from typing import List, Dict, Tuple, Iterable, Optional, Sequence
 
-from kss._elements.subclasses import Syllable
 from kss._utils.const import (
     double_quotes,
     double_quotes_open_to_close,
@@ -35,68 +34,68 @@ class EmbracingProcessor:
         """
         return self._empty([self.single_stack, self.double_stack], dim=2)
 
-    def process(self, idx: int, sent_idx: int, syllable: Syllable):
+    def process(self, idx: int, sent_idx: int, text: str):
         """
         Push or pop symbols to detect embraced sentences
 
         Args:
             idx (int): current syllable index
             sent_idx (int): current sentence index
-            syllable (Syllable): current syllable object
+            text (str): text of current syllable
         """
-        if syllable.text in single_quotes_wo_direction:
+        if text in single_quotes_wo_direction:
             self.single_sent_idx = sent_idx
             self.single_idx = idx
             self.single_pop = self._pop_symbol(
-                syllable=syllable,
+                text=text,
                 stack=self.single_stack,
                 open_to_close=single_quotes_open_to_close,
                 close_to_open=single_quotes_close_to_open,
             )
-        elif syllable.text in double_quotes_wo_direction:
+        elif text in double_quotes_wo_direction:
             self.double_sent_idx = sent_idx
             self.double_idx = idx
             self.double_pop = self._pop_symbol(
-                syllable=syllable,
+                text=text,
                 stack=self.double_stack,
                 open_to_close=double_quotes_open_to_close,
                 close_to_open=double_quotes_close_to_open,
             )
 
-    def update_index(self, idx: int, sent_idx: int, syllable: Syllable):
+    def update_index(self, idx: int, sent_idx: int, text: str):
         """
         Update indices of syllables and sentences
 
         Args:
             idx (int): current syllable index
             sent_idx (int): current sentence index
-            syllable (Syllable): current syllable object
+            text (str): text of current syllable
         """
 
-        if syllable.text in single_quotes:
+        if text in single_quotes:
             self.single_idx = idx
             self.single_sent_idx = sent_idx
 
-        elif syllable.text in double_quotes:
+        elif text in double_quotes:
             self.double_idx = idx
             self.double_sent_idx = sent_idx
 
     def realign(
         self,
-        input_sentences: List[Syllable],
-        output_sentences: List[List[Syllable]],
+        input_sentences: Sequence[int],
+        output_sentences: List[List[int]],
         func: "function",
-    ) -> List[List[Syllable]]:
+    ) -> List[List[int]]:
         """
         Realign wrongly split sentences because of all symbols.
 
         Args:
-            input_sentences (List[Syllable]): input sentences
-            output_sentences (List[List[Syllables]): split sentences from `_split_sentences`
+            input_sentences (Sequence[int]): input sentences
+            output_sentences (List[List[int]]): split sentences from `_split_sentences`
             func (function): split function
 
         Returns:
-            List[List[Syllable]]: corrected split sentences.
+            List[List[int]]: corrected split sentences.
         """
         if len(self.single_stack) != 0:
             return self._realign_sentences(
@@ -120,7 +119,7 @@ class EmbracingProcessor:
 
     def _pop_symbol(
         self,
-        syllable: Syllable,
+        text: str,
         stack: List[str],
         open_to_close: Dict[str, str],
         close_to_open: Dict[str, str],
@@ -129,7 +128,7 @@ class EmbracingProcessor:
         Pop symbols from given stack if the symbols are contained in given dictionaries.
 
         Args:
-            syllable (Syllable): syllable object
+            text (str): text of syllable
             stack (List[str]): symbol stack
             open_to_close (Dict[str, str]): open to close dict
             close_to_open (Dict[str, str]): close to open dict
@@ -137,40 +136,40 @@ class EmbracingProcessor:
         Returns:
             str: popped symbol
         """
-        if syllable.text in open_to_close.keys():
+        if text in open_to_close.keys():
             pop = self._push_pop_symbol(
                 stack=stack,
-                symbol=open_to_close[syllable.text],
-                current_char=syllable.text,
+                symbol=open_to_close[text],
+                current_char=text,
             )
         else:
             pop = self._push_pop_symbol(
                 stack=stack,
-                symbol=close_to_open[syllable.text],
-                current_char=syllable.text,
+                symbol=close_to_open[text],
+                current_char=text,
             )
         return pop
 
     def _realign_sentences(
         self,
-        input_sentences: List[Syllable],
-        output_sentences: List[List[Syllable]],
+        input_sentences: Sequence[int],
+        output_sentences: List[List[int]],
         idx: int,
         sent_idx: int,
         func: "function",
-    ) -> List[List[Syllable]]:
+    ) -> List[List[int]]:
         """
         Realign wrongly split sentences because of specific symbol.
 
         Args:
-            input_sentences (List[Syllable]): input sentences
-            output_sentences (List[List[Syllables]): split sentences from `_split_sentences`
+            input_sentences (Sequence[int]): input sentences
+            output_sentences (List[List[int]]): split sentences from `_split_sentences`
             idx (int): current syllable index
             sent_idx (int): current sentence index
             func (function): split function
 
         Returns:
-            List[List[Syllable]]: corrected split sentences.
+            List[List[int]]: corrected split sentences.
         """
         return output_sentences[:sent_idx] + self._realign_sub_sentences(
             output_sentences=tuple(chain(*output_sentences[sent_idx:])),
@@ -183,7 +182,7 @@ class EmbracingProcessor:
     def _realign_sub_sentences(
         self,
         output_sentences: Tuple,
-        syllable: Syllable,
+        syllable: int,
         idx_in_sent: int,
         func: "function",
     ):
@@ -192,12 +191,12 @@ class EmbracingProcessor:
 
         Args:
             output_sentences (Tuple): tuple of syllables
-            syllable (Syllable): problematic syllable
+            syllable (int): index of problematic syllable
             idx_in_sent (int): syllable index in sentence
             func (function): split function
 
         Returns:
-            List[List[Syllable]]: corrected split sub-sentences.
+            List[List[int]]: corrected split sub-sentences.
         """
         before_quote = func(output_sentences[:idx_in_sent])
         before_last = before_quote[-1] if len(before_quote) > 0 else []
@@ -212,7 +211,7 @@ class EmbracingProcessor:
 
     @staticmethod
     def get_idx_in_sent(
-        output_sentences: List[List[Syllable]],
+        output_sentences: List[List[int]],
         idx: int,
         sent_idx: int,
     ) -> int:
@@ -220,7 +219,7 @@ class EmbracingProcessor:
         Get syllable index in the sentence.
 
         Args:
-            output_sentences (List[List[Syllables]): split sentences from `_split_sentences`
+            output_sentences (List[List[int]]): split sentences from `_split_sentences`
             idx (int): current syllable index
             sent_idx (int): current sentence index
 
@@ -4,7 +4,7 @@
 
 from typing import List
 
-from kss._elements.subclasses import Syllable
+from kss._elements.syllables import Syllables
 from kss._modules.sentences.sentence_preprocessor import SentenceProcessor
 from kss._utils.const import quotes_or_brackets_close_to_open, spaces, daggers
 
@@ -12,55 +12,58 @@ from kss._utils.const import quotes_or_brackets_close_to_open, spaces, daggers
 class SentencePostprocessor(SentenceProcessor):
     def postprocess(
         self,
-        output_sentences: List[List[Syllable]],
+        syllables: Syllables,
+        output_sentences: List[List[int]],
         strip: bool,
     ) -> List[str]:
         """
         Postprocess output sentences by splitting rules
 
         Args:
-            output_sentences (List[List[Syllable]]): output sentences by splitting rules in syllable object
+            syllables (Syllables): syllables of input text
+            output_sentences (List[List[int]]): output sentences by splitting rules in syllable indices
             strip (bool): strip all sentences or not
 
         Returns:
             List[str]: postprocessed output setences in string
         """
-        output_sentences = self._remove_first_space(output_sentences)
-        output_sentences = self._remove_space_before_emoji(output_sentences)
+        output_sentences = self._remove_first_space(syllables, output_sentences)
+        output_sentences = self._remove_space_before_emoji(syllables, output_sentences)
         output_sentences = self._merge_broken_sub_sentence_in_quotes_or_brackets(
-            output_sentences
+            syllables, output_sentences
         )
         output_sentences = self._move_first_footnote_in_sentence_to_previous(
-            output_sentences
+            syllables, output_sentences
         )
         output_sentences = self._move_first_daggers_in_sentence_to_previous(
-            output_sentences
+            syllables, output_sentences
         )
         output_sentences = self._move_non_structural_sub_sent_in_brackets_to_previous(
-            output_sentences
+            syllables, output_sentences
         )
         output_sentences = self._move_unexpected_split_sentences_to_previous(
-            output_sentences
+            syllables, output_sentences
         )
         output_sentences = self._move_symbol_sentences_only_to_previous(
-            output_sentences
+            syllables, output_sentences
         )
         output_sentences = self._convert_syllables_to_sentences_with_cleaning(
-            output_sentences, strip
+            syllables, output_sentences, strip
         )
         return output_sentences
 
     def _merge_broken_sub_sentence_in_quotes_or_brackets(
-        self, output_sentences: List[List[Syllable]]
-    ) -> List[List[Syllable]]:
+        self, syllables: Syllables, output_sentences: List[List[int]]
+    ) -> List[List[int]]:
         """
         Merge broken sub-sentence in quotes or brackets.
 
         Args:
-            output_sentences (List[List[Syllable]]): list of syllables
+            syllables (Syllables): syllables of input text
+            output_sentences (List[List[int]]): list of syllables
 
         Returns:
-            List[List[Syllable]]: corrected list of syllables.
+            List[List[int]]: corrected list of syllables.
 
         Notes:
             열고 닫음이 분명한 괄호나 따옴표 안의 인용문/독백 등이 분리 된 경우 이를 찾아내서 병합한다.
@@ -77,21 +80,21 @@ class SentencePostprocessor(SentenceProcessor):
             for syllable_idx, output_syllable in enumerate(
                 output_sentences[sentence_idx]
             ):
-                if output_syllable.check_pos("SSO", "QTO"):
-                    if output_syllable.text not in last_open:
-                        last_open[output_syllable.text] = [(sentence_idx, syllable_idx)]
+                if syllables.check_pos(output_syllable, "SSO", "QTO"):
+                    if syllables.text[output_syllable] not in last_open:
+                        last_open[syllables.text[output_syllable]] = [(sentence_idx, syllable_idx)]
                     else:
-                        last_open[output_syllable.text].append(
+                        last_open[syllables.text[output_syllable]].append(
                             (sentence_idx, syllable_idx)
                         )
 
-                if output_syllable.check_pos("SSC", "QTC") and not found_close:
-                    if output_syllable.text not in first_close:
-                        first_close[output_syllable.text] = [
+                if syllables.check_pos(output_syllable, "SSC", "QTC") and not found_close:
+                    if syllables.text[output_syllable] not in first_close:
+                        first_close[syllables.text[output_syllable]] = [
                             (sentence_idx, syllable_idx)
                         ]
                     else:
-                        first_close[output_syllable.text].append(
+                        first_close[syllables.text[output_syllable]].append(
                             (sentence_idx, syllable_idx)
                         )
 
@@ -137,44 +140,47 @@ class SentencePostprocessor(SentenceProcessor):
 
                 last_open[syllable_open].remove((open_sent_idx, open_idx))
                 first_close[syllable_close].remove((close_sent_idx, close_idx))
-        return self._remove_empty_sentence(output_sentences)
+        return self._remove_empty_sentence(syllables, output_sentences)
 
     @staticmethod
-    def _check_text_from_character(output_syllable: Syllable, target: str):
+    def _check_text_from_character(syllables: Syllables, output_syllable: int, target: str):
         """
         Check given text is matched from character
 
         Args:
-            output_syllable (Syllable): output syllable
+            syllables (Syllables): syllables of input text
+            output_syllable (int): output syllable
             target (str): target string
 
         Returns:
             bool: match or not
         """
         _next = output_syllable
-        if (not target.startswith(output_syllable.text)) and _next.text in target:
-            split = target.split(_next.text)
+        text = syllables.char(output_syllable)
+        if (not target.startswith(text)) and text in target:
+            split = target.split(text)
             if len(split) > 1:
-                target = output_syllable.text + target.split(_next.text)[1]
+                target = text + target.split(text)[1]
 
         for idx, char in enumerate(target):
-            if _next.text != char:
+            if syllables.char(_next) != char:
                 return False
             else:
-                _next = _next.next
+                _next = syllables.next[_next]
         return True
 
     def _move_first_daggers_in_sentence_to_previous(
-        self, output_sentences: List[List[Syllable]]
-    ) -> List[List[Syllable]]:
+        self, syllables: Syllables, output_sentences: List[List[int]]
+    ) -> List[List[int]]:
         """
         Move first daggers in sentence to previous.
 
         Args:
-            output_sentences (List[List[Syllable]]): list of syllables
+            syllables (Syllables): syllables of input text
+            output_sentences (List[List[int]]): list of syllables
 
         Returns:
-            List[List[Syllable]]: corrected list of syllables.
+            List[List[int]]: corrected list of syllables.
 
         Notes:
             칼표 처리:
@@ -193,27 +199,28 @@ class SentencePostprocessor(SentenceProcessor):
 
         for sentence_idx, output_sentence in enumerate(output_sentences):
             if sentence_idx != 0 and len(output_sentence) != 0:
-                if output_sentence[0].next_skip_from_current("SP").text in daggers:
-                    if output_sentences[sentence_idx - 1][-1].text not in " \r\n\v\f":
+                if syllables.char(syllables.next_skip_from_current(output_sentence[0], "SP")) in daggers:
+                    if syllables.text[output_sentences[sentence_idx - 1][-1]] not in " \r\n\v\f":
                         insert_idx = sentence_idx - 1
                         while insert_idx > 0 and len(output_sentences[insert_idx]) == 0:
                             insert_idx -= 1
                         output_sentences[insert_idx].append(output_sentence[0])
                         output_sentences[sentence_idx] = output_sentence[1:]
 
-        return self._remove_empty_sentence(output_sentences)
+        return self._remove_empty_sentence(syllables, output_sentences)
 
     def _move_symbol_sentences_only_to_previous(
-        self, output_sentences: List[List[Syllable]]
-    ) -> List[List[Syllable]]:
+        self, syllables: Syllables, output_sentences: List[List[int]]
+    ) -> List[List[int]]:
         """
         Move symbol only sentences to previous
 
         Args:
-            output_sentences (List[List[Syllable]]): list of syllables
+            syllables (Syllables): syllables of input text
+            output_sentences (List[List[int]]): list of syllables
 
         Returns:
-            List[List[Syllable]]: corrected list of syllables.
+            List[List[int]]: corrected list of syllables.
 
         Notes:
             Symbol 처리:
@@ -226,7 +233,7 @@ class SentencePostprocessor(SentenceProcessor):
                 and (
                     all(
                         [
-                            syllable.check_pos("SY", "SF", "SE", "SC", "QT", "SS", "SP")
+                            syllables.check_pos(syllable, "SY", "SF", "SE", "SC", "QT", "SS", "SP")
                             for syllable in output_sentence
                         ]
                     )
@@ -238,19 +245,20 @@ class SentencePostprocessor(SentenceProcessor):
                         insert_idx -= 1
                     output_sentences[insert_idx].append(output_syllable)
                 output_sentences[sentence_idx] = []
-        return self._remove_empty_sentence(output_sentences)
+        return self._remove_empty_sentence(syllables, output_sentences)
 
     def _move_first_footnote_in_sentence_to_previous(
-        self, output_sentences: List[List[Syllable]]
-    ) -> List[List[Syllable]]:
+        self, syllables: Syllables, output_sentences: List[List[int]]
+    ) -> List[List[int]]:
         """
         Move first footnote in sentence to previous.
 
         Args:
-            output_sentences (List[List[Syllable]]): list of syllables
+            syllables (Syllables): syllables of input text
+            output_sentences (List[List[int]]): list of syllables
 
         Returns:
-            List[List[Syllable]]: corrected list of syllables.
+            List[List[int]]: corrected list of syllables.
 
         Notes:
             각주 처리:
@@ -278,36 +286,36 @@ class SentencePostprocessor(SentenceProcessor):
 
         for sentence_idx, output_sentence in enumerate(output_sentences):
             if sentence_idx != 0 and len(output_sentence) != 0:
-                if output_sentence[0].next_skip_from_current("SP").text == "[":
+                if syllables.char(syllables.next_skip_from_current(output_sentence[0], "SP")) == "[":
                     close_idx = None
                     move = False
                     for syllable_idx, output_syllable in enumerate(output_sentence):
-                        if output_sentences[sentence_idx - 1][
+                        if syllables.text[output_sentences[sentence_idx - 1][
                             -1
-                        ].text not in "\r\n\v\f" and (
-                            output_syllable.text in "[0123456789*, ]"
-                            or self._check_text_from_character(output_syllable, "편집]")
-                            or self._check_text_from_character(output_syllable, "더 보기]")
-                            or self._check_text_from_character(output_syllable, "더보기]")
-                            or self._check_text_from_character(output_syllable, "스포일러]")
-                            or self._check_text_from_character(output_syllable, "참고 ")
+                        ]] not in "\r\n\v\f" and (
+                            syllables.text[output_syllable] in "[0123456789*, ]"
+                            or self._check_text_from_character(syllables, output_syllable, "편집]")
+                            or self._check_text_from_character(syllables, output_syllable, "더 보기]")
+                            or self._check_text_from_character(syllables, output_syllable, "더보기]")
+                            or self._check_text_from_character(syllables, output_syllable, "스포일러]")
+                            or self._check_text_from_character(syllables, output_syllable, "참고 ")
                         ):
                             move = True
                         else:
                             break
 
-                        if output_syllable.text == "]":
+                        if syllables.text[output_syllable] == "]":
                             close_idx = syllable_idx
 
                     if close_idx is not None:
                         if move is True:
                             if close_idx + 1 < len(output_sentence):
-                                next_syllable = output_sentence[
-                                    close_idx + 1
-                                ].next_skip_from_current("SP")
+                                next_syllable = syllables.next_skip_from_current(
+                                    output_sentence[close_idx + 1], "SP"
+                                )
 
-                                move = (not next_syllable.pos.startswith("J")) and (
-                                    not next_syllable.check_texts("버튼")
+                                move = (not syllables.tag(next_syllable).startswith("J")) and (
+                                    not syllables.check_texts(next_syllable, "버튼")
                                 )
 
                         if move is True:
@@ -324,19 +332,20 @@ class SentencePostprocessor(SentenceProcessor):
                                 close_idx + 1 :
                             ]
 
-        return self._remove_empty_sentence(output_sentences)
+        return self._remove_empty_sentence(syllables, output_sentences)
 
     def _move_non_structural_sub_sent_in_brackets_to_previous(
-        self, output_sentences: List[List[Syllable]]
-    ) -> List[List[Syllable]]:
+        self, syllables: Syllables, output_sentences: List[List[int]]
+    ) -> List[List[int]]:
         """
         Move non-structural sub sentence in brackets to previous.
 
         Args:
-            output_sentences (List[List[Syllable]]): list of syllables
+            syllables (Syllables): syllables of input text
+            output_sentences (List[List[int]]): list of syllables
 
         Returns:
-            List[List[Syllable]]: corrected list of syllables.
+            List[List[int]]: corrected list of syllables.
 
         Notes:
             최초로 발견되는 괄호('(') 안의 서브 문장이 명사(N*)로 끝나면서 공백을 제외한 다음 문자가
@@ -348,10 +357,10 @@ class SentencePostprocessor(SentenceProcessor):
         """
         for sentence_idx, output_sentence in enumerate(output_sentences):
             if sentence_idx != 0 and len(output_sentence) != 0:
-                if output_sentence[0].next_skip_from_current("SP").text == "(":
+                if syllables.char(syllables.next_skip_from_current(output_sentence[0], "SP")) == "(":
                     close_idx, close_last = None, None
                     for syllable_idx, output_syllable in enumerate(output_sentence):
-                        if output_syllable.text == ")":
+                        if syllables.text[output_syllable] == ")":
                             close_idx = syllable_idx
                             close_last = syllable_idx == len(output_sentence) - 1
                             break
@@ -359,25 +368,25 @@ class SentencePostprocessor(SentenceProcessor):
                     if close_idx is None:
                         continue
 
-                    noun_finish = (
-                        output_sentence[close_idx - 1]
-                        .prev_skip_from_current(
-                            *self._all_s_poses, exclude=self._all_s_exclude
+                    noun_finish = syllables.tag(
+                        syllables.prev_skip_from_current(
+                            output_sentence[close_idx - 1],
+                            *self._all_s_poses,
+                            exclude=self._all_s_exclude,
                         )
-                        .pos.startswith("N")
-                    )
+                    ).startswith("N")
 
                     not_josa_start = close_last is True or not (
-                        output_sentence[close_idx + 1]
-                        .next_skip_from_current("SP")
-                        .pos.startswith("J")
+                        syllables.tag(
+                            syllables.next_skip_from_current(output_sentence[close_idx + 1], "SP")
+                        ).startswith("J")
                     )
 
                     additional_merge = 0
                     if not close_last:
                         for output_syllable in output_sentence[close_idx + 1 :]:
-                            if output_syllable.check_pos(
-                                *self._all_s_poses, exclude=self._all_s_exclude
+                            if syllables.check_pos(
+                                output_syllable, *self._all_s_poses, exclude=self._all_s_exclude
                             ):
                                 additional_merge += 1
                             else:
@@ -398,19 +407,20 @@ class SentencePostprocessor(SentenceProcessor):
                             close_idx + 1 + additional_merge :
                         ]
 
-        return self._remove_empty_sentence(output_sentences)
+        return self._remove_empty_sentence(syllables, output_sentences)
 
     def _move_unexpected_split_sentences_to_previous(
-        self, output_sentences: List[List[Syllable]]
-    ) -> List[List[Syllable]]:
+        self, syllables: Syllables, output_sentences: List[List[int]]
+    ) -> List[List[int]]:
         """
         Move unexpected split sentences to previous.
 
         Args:
-            output_sentences (List[List[Syllable]]): list of syllables
+            syllables (Syllables): syllables of input text
+            output_sentences (List[List[int]]): list of syllables
 
         Returns:
-            List[List[Syllable]]: corrected list of syllables.
+            List[List[int]]: corrected list of syllables.
 
         Notes:
             분리된 문장이 조사(J*), 긍정지정사(VCP), 연결어미(EC), 보조용언(VX)으로 시작되면 이전 문장에 이어 붙인다.
@@ -428,11 +438,10 @@ class SentencePostprocessor(SentenceProcessor):
                 sentence_idx != 0
                 and len(output_sentence) != 0
                 and (
-                    output_sentence[0].next_skip_from_current("SP").pos
+                    syllables.tag(syllables.next_skip_from_current(output_sentence[0], "SP"))
                     in ("VCP+EC", "VX+EC")
-                    or output_sentence[0]
-                    .next_skip_from_current("SP")
-                    .check_pos(
+                    or syllables.check_pos(
+                        syllables.next_skip_from_current(output_sentence[0], "SP"),
                         "J",
                         "VCP",
                         "EC",
@@ -447,29 +456,31 @@ class SentencePostprocessor(SentenceProcessor):
                         insert_idx -= 1
                     output_sentences[insert_idx].append(output_syllable)
                 output_sentences[sentence_idx] = []
-        return self._remove_empty_sentence(output_sentences)
+        return self._remove_empty_sentence(syllables, output_sentences)
 
     @staticmethod
     def _convert_syllables_to_sentences_with_cleaning(
-        output_sentences: List[List[Syllable]],
+        syllables: Syllables,
+        output_sentences: List[List[int]],
         strip: bool,
     ) -> List[str]:
         """
         Convert syllables to sentences with cleaning
 
         Args:
-            output_sentences (List[List[Syllable]]): output syllables
+            syllables (Syllables): syllables of input text
+            output_sentences (List[List[int]]): output syllables
             strip (bool): strip all sentences or not
 
         Returns:
             List[str]: output sentences list
 
         Notes:
-            Syllable 객체를 모두 string으로 변경하고 각 문장에 strip을 수행한다.
+            Syllable 인덱스를 모두 string으로 변경하고 각 문장에 strip을 수행한다.
         """
         final_output_sentences = []
         for output_sentence in output_sentences:
-            output_sentence = "".join([syllable.text for syllable in output_sentence])
+            output_sentence = "".join([syllables.text[i] for i in output_sentence])
             if strip is True:
                 output_sentence = output_sentence.strip(spaces)
             if len(output_sentence) != 0:
@@ -478,65 +489,70 @@ class SentencePostprocessor(SentenceProcessor):
         return final_output_sentences
 
     @staticmethod
-    def _remove_empty_sentence(output_sentences: List[List[Syllable]]):
+    def _remove_empty_sentence(syllables: Syllables, output_sentences: List[List[int]]):
         """
         Remove emtpy sentences after postprocessing
 
         Args:
-            output_sentences (List[List[Syllable]]): split list of syllables
+            syllables (Syllables): syllables of input text
+            output_sentences (List[List[int]]): split list of syllables
 
         Returns:
-            List[List[Syllable]]: list of syllables without empty one
+            List[List[int]]: list of syllables without empty one
         """
         return [
             sentence
             for sentence in output_sentences
-            if len("".join([i.text for i in sentence]).strip()) != 0
+            if len("".join([syllables.text[i] for i in sentence]).strip()) != 0
         ]
 
     @staticmethod
     def _remove_space_before_emoji(
-        output_sentences: List[List[Syllable]],
-    ) -> List[List[Syllable]]:
+        syllables: Syllables,
+        output_sentences: List[List[int]],
+    ) -> List[List[int]]:
         """
         Remove a space character before emoji.
         The space character was appended in preprocessing step.
 
         Args:
-            output_sentences (List[List[Syllable]]): split list of syllables
+            syllables (Syllables): syllables of input text
+            output_sentences (List[List[int]]): split list of syllables
 
         Returns:
-            List[List[Syllable]]: list of syllables without space before emoji
+            List[List[int]]: list of syllables without space before emoji
         """
         for sentence_idx, output_sentence in enumerate(output_sentences):
             for syllable_idx, output_syllable in enumerate(output_sentence):
                 if (
-                    output_syllable.check_pos("EMOJI")
-                    and output_syllable.prev.text == " "
+                    syllables.check_pos(output_syllable, "EMOJI")
+                    and syllables.char(syllables.prev[output_syllable]) == " "
                 ):
-                    output_syllable.prev = output_syllable.prev.prev
+                    syllables.prev[output_syllable] = syllables.prev[syllables.prev[output_syllable]]
                     output_sentences[sentence_idx].pop(syllable_idx - 1)
         return output_sentences
 
     @staticmethod
     def _remove_first_space(
-        output_sentences: List[List[Syllable]],
-    ) -> List[List[Syllable]]:
+        syllables: Syllables,
+        output_sentences: List[List[int]],
+    ) -> List[List[int]]:
         """
         Remove a space added by preprocessor
 
         Args:
-            output_sentences (List[List[Syllable]]): split list of syllables
+            syllables (Syllables): syllables of input text
+            output_sentences (List[List[int]]): split list of syllables
 
         Returns:
-            List[List[Syllable]]: list of syllables without added space
+            List[List[int]]: list of syllables without added space
         """
         for sentence_idx, output_sentence in enumerate(output_sentences):
             for syllable_idx, output_syllable in enumerate(output_sentence):
                 if (
                     sentence_idx == 0
                     and syllable_idx == 0
-                    and output_syllable.check_pos("SP")
+                    and syllables.check_pos(output_syllable, "SP")
                 ):
                     output_sentences[sentence_idx].pop(syllable_idx)
 
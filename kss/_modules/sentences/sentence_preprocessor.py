@@ -2,9 +2,11 @@
 # All rights reserved.
 
 
+from array import array
+from functools import lru_cache
 from typing import List, Tuple
 
-from kss._elements.subclasses import Syllable
+from kss._elements.syllables import Syllables, _intern_pos
 from kss._modules.sentences.sentence_processor import SentenceProcessor
 from kss._utils.const import (
     bracket_open_to_close,
@@ -41,7 +43,11 @@ class SentencePreprocessor(SentenceProcessor):
         lambda c, p: c in spaces: "SP",
     }
 
-    def preprocess(self, input_morphemes: List[Tuple[str, str]]) -> List[Syllable]:
+    # the first characters of wrong tags which are corrected by `_correct_wrong_tags`.
+    _wrong_tag_chars = set("이네까을였구엇쥬어떄")
+
+
+    def preprocess(self, input_morphemes: List[Tuple[str, str]]) -> Syllables:
         """
         Convert mecab morphemes to syllables and correct wrong tags
 
@@ -49,7 +55,7 @@ class SentencePreprocessor(SentenceProcessor):
             input_morphemes (List[Tuple[str, str]]): input morphemes
 
         Returns:
-            List[Syllable]: syllables in input text
+            Syllables: syllables in input text
         """
         syllables = self._convert_morphemes_to_syllables(input_morphemes)
         syllables = self._correct_wrong_tags(syllables)
@@ -58,7 +64,7 @@ class SentencePreprocessor(SentenceProcessor):
 
     def _convert_morphemes_to_syllables(
         self, input_morphemes: List[Tuple[str, str]]
-    ) -> List[Syllable]:
+    ) -> Syllables:
         """
         Convert mecab morphemes to syllables.
 
@@ -66,130 +72,154 @@ class SentencePreprocessor(SentenceProcessor):
             input_morphemes (List[Tuple[str, str]]): input morphemes
 
         Returns:
-            List[Syllable]: syllables in input text.
+            Syllables: syllables in input text.
         """
-
-        char_idx = 1
-        prev = Syllable(" ", "SP", idx=0)
-        syllables = [prev]
+        chars = [" "]
+        poses = array("H", [_intern_pos("SP")])
 
         for pos in input_morphemes:
             for char in pos[0]:
-                tag = pos[1]
-                for _func, _tag in self._correction.items():
-                    if _func(char, pos[1]):
-                        tag = _tag
-                        break
+                chars.append(char)
+                poses.append(self._correct_tag(char, pos[1]))
 
-                syllable = Syllable(char, tag, idx=char_idx)
-                syllable.prev = prev
-                prev.next = syllable
-                syllables.append(syllable)
+        num_chars = len(chars)
+        _next = array("i", range(1, num_chars + 1))
+        _next[-1] = -1
+        return Syllables("".join(chars), poses, _next, array("i", range(-1, num_chars - 1)))
 
-                prev = syllable
-                char_idx += 1
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _correct_tag(char: str, tag: str) -> int:
+        """
+        Correct the tag of a character by its kind.
 
-        return syllables
+        Args:
+            char (str): character
+            tag (str): tag of the morpheme which contains the character
 
-    def _correct_wrong_tags(self, syllables: List[Syllable]):
+        Returns:
+            int: interned id of the corrected tag
+        """
+        for _func, _tag in SentencePreprocessor._correction.items():
+            if _func(char, tag):
+                return _intern_pos(_tag)
+        return _intern_pos(tag)
+
+    def _correct_wrong_tags(self, syllables: Syllables) -> Syllables:
         """
         Convert mecab morphemes to syllables and preprocess syllables
 
         Args:
-            syllables (List[Syllable]): input syllables
+            syllables (Syllables): input syllables
 
         Returns:
-            List[Syllable]: syllables in input text
+            Syllables: syllables in input text
         """
-        for syllable in syllables:
-            if syllable.check_pos_and_text(
-                "JKS", "이"
-            ) and syllable.next.check_pos_and_text("MAG", "다"):
-                self._change_poses(syllable, "VCP", "EF")
-
-            if syllable.check_pos_and_text(
-                "EF", "네"
-            ) and syllable.next.check_pos_and_text("XSN", "용"):
-                self._change_poses(syllable, "EF", "EF")
-
-            if syllable.check_pos_and_text(
-                "EC", "까"
-            ) and syllable.next.check_pos_and_text("NNG", "용"):
-                self._change_poses(syllable, "EF", "EF")
+        _next = syllables.next
+
+        for i in range(len(syllables)):
+            if syllables.text[i] not in self._wrong_tag_chars:
+                continue
+
+            if syllables.check_pos_and_text(
+                i, "JKS", "이"
+            ) and syllables.check_pos_and_text(_next[i], "MAG", "다"):
+                self._change_poses(syllables, i, "VCP", "EF")
+
+            if syllables.check_pos_and_text(
+                i, "EF", "네"
+            ) and syllables.check_pos_and_text(_next[i], "XSN", "용"):
+                self._change_poses(syllables, i, "EF", "EF")
+
+            if syllables.check_pos_and_text(
+                i, "EC", "까"
+            ) and syllables.check_pos_and_text(_next[i], "NNG", "용"):
+                self._change_poses(syllables, i, "EF", "EF")
 
             if (
-                syllable.check_pos_and_text("EF", "을")
-                and syllable.next.check_pos_and_text("EF", "까")
-                and syllable.next.next.check_pos_and_text("XSN", "용")
+                syllables.check_pos_and_text(i, "EF", "을")
+                and syllables.check_pos_and_text(_next[i], "EF", "까")
+                and syllables.check_pos_and_text(_next[_next[i]], "XSN", "용")
             ):
-                self._change_poses(syllable, "EF", "EF", "EF")
+                self._change_poses(syllables, i, "EF", "EF", "EF")
 
             if (
-                syllable.check_pos_and_text("EP", "였")
-                and syllable.next.check_pos_and_text("EC", "게")
-                and syllable.next.next.check_pos_and_text("NNG", "용")
+                syllables.check_pos_and_text(i, "EP", "였")
+                and syllables.check_pos_and_text(_next[i], "EC", "게")
+                and syllables.check_pos_and_text(_next[_next[i]], "NNG", "용")
             ):
-                self._change_poses(syllable, "EP", "EF", "EF")
+                self._change_poses(syllables, i, "EP", "EF", "EF")
 
-            if syllable.check_pos_and_text(
-                "EC", "구"
-            ) and syllable.next.check_pos_and_text("NNG", "용"):
-                self._change_poses(syllable, "EF", "EF")
+            if syllables.check_pos_and_text(
+                i, "EC", "구"
+            ) and syllables.check_pos_and_text(_next[i], "NNG", "용"):
+                self._change_poses(syllables, i, "EF", "EF")
 
-            if syllable.check_pos_and_text(
-                "EF", "엇"
-            ) and syllable.next.check_pos_and_text("IC", "음"):
-                self._change_poses(syllable, "EP", "ETN")
+            if syllables.check_pos_and_text(
+                i, "EF", "엇"
+            ) and syllables.check_pos_and_text(_next[i], "IC", "음"):
+                self._change_poses(syllables, i, "EP", "ETN")
 
-            if syllable.check_pos_and_text("EC", "쥬"):
-                self._change_poses(syllable, "EF")
+            if syllables.check_pos_and_text(i, "EC", "쥬"):
+                self._change_poses(syllables, i, "EF")
 
-            if syllable.check_pos_and_text(
-                "EC", "어"
-            ) and syllable.next.check_pos_and_text("EC", "용"):
-                self._change_poses(syllable, "EF", "EF")
+            if syllables.check_pos_and_text(
+                i, "EC", "어"
+            ) and syllables.check_pos_and_text(_next[i], "EC", "용"):
+                self._change_poses(syllables, i, "EF", "EF")
 
-            if syllable.check_pos_and_text("UNKNOWN", "떄"):
-                self._change_poses(syllable, "NNG")
+            if syllables.check_pos_and_text(i, "UNKNOWN", "떄"):
+                self._change_poses(syllables, i, "NNG")
 
         return syllables
 
     @staticmethod
-    def _change_poses(syllable: Syllable, *poses: str):
+    def _change_poses(syllables: Syllables, i: int, *poses: str):
         """
         Change poses from the given syllable.
         This method could make a huge problem, so this implemented in preprocessor class.
 
         Args:
-            syllable (Syllable): input syllable
+            syllables (Syllables): input syllables
+            i (int): index of the first syllable to be changed
             *poses (str): poses to be changed
         """
-        _next = syllable
+        _next = i
         for pos in poses:
-            _next.pos = pos
-            _next = _next.next
+            syllables.set_tag(_next, pos)
+            _next = syllables.next[_next]
 
     @staticmethod
-    def _append_space_before_emoji(syllables: List[Syllable]) -> List[Syllable]:
+    def _append_space_before_emoji(syllables: Syllables) -> Syllables:
         """
         Append a space character before emoji character.
         This could be helpful for tokenizing sentences which contain emoji.
 
         Args:
-            syllables (List[Syllable]): input syllables
+            syllables (Syllables): input syllables
 
         Returns:
-            List[Syllable]: preprocessed syllables
+            Syllables: preprocessed syllables
+
+        Notes:
+            Only the emoji links back to the appended space.
+            The previous syllable still links to the emoji, so the space is skipped when moving forward.
         """
-        new_syllables = []
-        for syllable in syllables:
-            if syllable.check_pos("EMOJI") and not syllable.prev.check_pos("EMOJI"):
-                space_syllable = Syllable(" ", "SP", idx=syllable.idx)
-                if syllable.prev is not None:
-                    space_syllable.prev = syllable.prev
-                space_syllable.next = syllable
-                syllable.prev = space_syllable
-
-                new_syllables.append(space_syllable)
-            new_syllables.append(syllable)
-        return new_syllables
+        chars, poses, appended = [], array("H"), []
+        for i in range(len(syllables)):
+            if syllables.check_pos(i, "EMOJI") and not syllables.check_pos(syllables.prev[i], "EMOJI"):
+                appended.append(len(chars))
+                chars.append(" ")
+                poses.append(_intern_pos("SP"))
+            chars.append(syllables.text[i])
+            poses.append(syllables.pos[i])
+
+        if len(appended) == 0:
+            return syllables
+
+        num_chars = len(chars)
+        _next = array("i", range(1, num_chars + 1))
+        _next[-1] = -1
+        for space in appended:
+            _next[space - 1] = space + 1
+        return Syllables("".join(chars), poses, _next, array("i", range(-1, num_chars - 1)))
@@ -4,72 +4,132 @@
 
 import re
 from functools import lru_cache
-from typing import List
+from typing import Dict, List, Tuple
 
+from kss._elements.syllables import _add_flag
+from kss._elements.trie import Trie
 from kss._utils.const import (
-    alphabet_with_quotes,
+    alphabets,
     url_pattern,
     email_pattern,
     backup_normal,
 )
 
 
+# tries of the static backups for each ignores. preprocessors and postprocessors share them.
+backup_tries = {}
+
+
+def _placeholder(source: str) -> str:
+    return str(abs(hash(source)))
+
+
 class SentenceProcessor:
     _all_s_exclude = ("QTO",)
     _all_s_poses = ("SP", "SF", "SY", "SE", "SSC", "QTC", "QTN", "EMOJI", "JAMO")
     _all_s_poses_wo_qtn = ("SP", "SF", "SY", "SE", "SSC", "QTC", "EMOJI", "JAMO")
 
-    _heavy_backup = {}
-    _heavy_backup.update(
-        {
-            k: {_v: str(abs(hash(_v))) for _v in v}
-            for k, v in alphabet_with_quotes.items()
-        }
+    # flags of syllables which are frequently skipped by splitting rules.
+    _sp_flag = _add_flag("SP")
+    _sf_flag = _add_flag("SF")
+    _all_s_flag = _add_flag(*_all_s_poses, exclude=_all_s_exclude)
+
+    # alphabets with quotes like "I'm", "don't".
+    _heavy_pattern = re.compile(
+        f"[{''.join(sorted(alphabets))}]['’`][{''.join(sorted(alphabets))}]"
     )
-    _normal_backup = {k: str(abs(hash(k))) for k in sorted(backup_normal)}
+    _normal_backup = {k: _placeholder(k) for k in sorted(backup_normal)}
 
     def __init__(self, ignores: List[str] = None):
         self.ignores = ignores
+        self._normal_backup = dict(SentenceProcessor._normal_backup)
         if self.ignores is not None:
-            self._normal_backup.update({k: str(abs(hash(k))) for k in self.ignores})
+            self._normal_backup.update({k: _placeholder(k) for k in self.ignores if len(k) != 0})
+
+        ignores_tuple = tuple(self.ignores) if self.ignores is not None else ()
+        if ignores_tuple not in backup_tries:
+            backup_tries[ignores_tuple] = Trie(self._normal_backup)
+        self._normal_trie = backup_tries[ignores_tuple]
 
     @staticmethod
-    def _replace(text: str, purpose_dict: dict, restore: bool = False):
-        for k, v in purpose_dict.items():
-            if restore is True:
-                source, target = v, k
-            else:
-                source, target = k, v
+    @lru_cache(100)
+    def _find_url_or_email(text: str) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(re.findall(url_pattern, text) + re.findall(email_pattern, text)))
 
-            if source in text:
-                text = text.replace(source, target)
+    @lru_cache(100)
+    def _backup(self, inputs: str) -> Tuple[str, Dict[str, str], Trie]:
+        """
+        Replace the strings which must not be split with placeholders.
 
-        return text
+        Args:
+            inputs (str): input text
 
-    def _add_url_or_email(self, text):
-        _url_or_email = {
-            k: str(abs(hash(k)))
-            for k in re.findall(url_pattern, text) + re.findall(email_pattern, text)
-        }
-        self._normal_backup.update(_url_or_email)
+        Returns:
+            Tuple[str, Dict[str, str], Trie]: text with placeholders, original strings of the placeholders
+                and trie of the placeholders
 
-    @lru_cache(100)
-    def backup(self, inputs: str):
-        self._add_url_or_email(inputs)
-        inputs = self._replace(inputs, self._normal_backup)
+        Notes:
+            The placeholders of urls and emails are kept only for the given text,
+            so memory usage doesn't grow with the number of texts.
+        """
+        text, originals = inputs, {}
 
-        for source, purpose_dict in self._heavy_backup.items():
-            if source in inputs:
-                inputs = self._replace(inputs, purpose_dict, restore=False)
+        def _replace(match, backup: Dict[str, str] = None):
+            source = match.group()
+            target = backup[source] if backup is not None else _placeholder(source)
+            originals[target] = source
+            return target
 
-        return inputs
+        inputs = self._normal_trie.sub(lambda m: _replace(m, self._normal_backup), inputs)
+        inputs = Trie(k for k in self._find_url_or_email(text) if k in inputs).sub(_replace, inputs)
+        inputs = self._heavy_pattern.sub(_replace, inputs)
+        return inputs, originals, Trie(originals)
 
-    @lru_cache(100)
-    def restore(self, outputs: str, inputs: str):
-        outputs = self._replace(outputs, self._normal_backup, restore=True)
+    def backup(self, inputs: str) -> str:
+        return self._backup(inputs)[0]
 
-        for source, purpose_dict in self._heavy_backup.items():
-            if source in inputs:
-                outputs = self._replace(outputs, purpose_dict, restore=True)
+    @lru_cache(100)
+    def restore(self, outputs: str, inputs: str) -> str:
+        _, originals, placeholders = self._backup(inputs)
+        return placeholders.sub(lambda m: originals[m.group()], outputs)
+
+    def backup_morphemes(self, inputs: str, morphemes: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """
+        Convert morphemes of a text into morphemes of the backed up text without analyzing it again.
+
+        Args:
+            inputs (str): input text
+            morphemes (List[Tuple[str, str]]): morphemes which cover the input text including spaces
+
+        Returns:
+            List[Tuple[str, str]]: morphemes of `backup(inputs)`. the placeholders are tagged with 'SN'.
+        """
+        text, originals, placeholders = self._backup(inputs)
+        if len(originals) == 0:
+            return morphemes
+
+        # spans of the backed up strings in the input text.
+        spans, shift = [], 0
+        for match in placeholders.pattern.finditer(text):
+            source = originals[match.group()]
+            spans.append((match.start() + shift, match.start() + shift + len(source), match.group()))
+            shift += len(source) - len(match.group())
+
+        outputs, offset, span_idx = [], 0, 0
+        for word, pos in morphemes:
+            start, end = offset, offset + len(word)
+            while start < end:
+                if span_idx < len(spans) and spans[span_idx][0] <= start:
+                    span_start, span_end, placeholder = spans[span_idx]
+                    if span_start == start:
+                        outputs.append((placeholder, "SN"))
+                    start = min(end, span_end)
+                    if start == span_end:
+                        span_idx += 1
+                else:
+                    stop = min(end, spans[span_idx][0]) if span_idx < len(spans) else end
+                    outputs.append((word[start - offset:stop - offset], pos))
+                    start = stop
+            offset = end
 
         return outputs
@@ -2,20 +2,30 @@
 # All rights reserved.
 
 
-from functools import lru_cache
-from typing import Tuple
+from typing import Dict, Iterable, Set, Tuple
 
-from kss._elements.subclasses import Syllable
+from kss._elements.syllables import Syllables, _add_flag
 from kss._modules.sentences.sentence_processor import SentenceProcessor
 from kss._utils.const import sf_exception, jaum
 
 
+def _group_by_length(texts: Iterable[str]) -> Dict[int, Set[str]]:
+    groups = {}
+    for text in texts:
+        groups.setdefault(len(text), set()).add(text)
+    return dict(sorted(groups.items()))
+
+
 class SentenceSplitter(SentenceProcessor):
     """
     Sentence Splitting Rules class
 
     Args:
-        syllable (Syllable): current syllable
+        syllables (Syllables): syllables of input text
+
+    Notes:
+        All pos conditions of the rules are compiled into flags of `Syllables` when this module is imported,
+        so a rule checks a pos with a bitwise and, and one splitter is used for all syllables of a text.
     """
 
     unavailable_next = set()
@@ -29,22 +39,65 @@ class SentenceSplitter(SentenceProcessor):
     )
     unavailable_next.update({"할" + add for add in ["텐데"]})
 
-    def __init__(self, syllable: Syllable):
+    # texts checked by a set lookup for each length instead of one by one.
+    _unavailable_next = _group_by_length(unavailable_next)
+    _unavailable_next_max = max(_unavailable_next)
+    _sf_exceptions = _group_by_length(sf_exception)
+
+    _dashes = ("－", "-", "–")
+
+    # pos conditions of the rules.
+    _all_s_wo_qtn_flag = _add_flag(*SentenceProcessor._all_s_poses_wo_qtn, exclude=SentenceProcessor._all_s_exclude)
+    _jamo_flag = _add_flag("JAMO")
+    _emoji_jamo_flag = _add_flag("EMOJI", "JAMO")
+    _sf_next_flag = _add_flag("SY", "SSO", "EMOJI", "JAMO")
+    _vcp_flag = _add_flag("VCP", exclude=("+VCP",))
+    _sf_prev_j_flag = _add_flag("J", exclude=("EMOJI", "JAMO", "+J"))
+    _maj_mag_flag = _add_flag("MAJ", "MAG")
+    _ec_flag = _add_flag("EC")
+    _ec_nnb_flag = _add_flag("EC", "NNB")
+    _ef_flag = _add_flag("EF")
+    _ef_wo_j_flag = _add_flag("EF", exclude=("+J",))
+    _ef_next_flag = _add_flag("EC", "J", "VX", exclude=("MAJ", "EMOJI", "JAMO", "+VX", "+EC", "+J", "VX+"))
+    _np_vcp_ef_flag = _add_flag("NP+VCP+EF")
+    _vx_flag = _add_flag("VX", exclude=("VX+",))
+    _ec_wo_j_flag = _add_flag("EC", exclude=("+J",))
+    _ec_next_flag = _add_flag("VCP", "J", "VX", exclude=("MAJ", "JAMO", "EMOJI", "+J", "+VCP", "+VX"))
+    _ec_permission_flag = _add_flag("SF", "SY", "SSO", "QTO", "EMOJI")
+    _ep_flag = _add_flag("EP")
+    _np_flag = _add_flag("NP", exclude=("MAJ",))
+    _etn_flag = _add_flag("ETN")
+    _etn_wo_j_xs_flag = _add_flag("ETN", exclude=("+J", "XS"))
+    _etn_next_flag = _add_flag("SP", "SF", "SY", "SSO", "QTO", "EMOJI", "JAMO")
+    _etn_next_skip_flag = _add_flag("J", "VV", "VA", "VX", exclude=("MAJ", "EMOJI", "JAMO", "+J"))
+    _mm_ssc_flag = _add_flag("MM", "SSC")
+    _etm_flag = _add_flag("ETM")
+    _etm_wo_j_xs_flag = _add_flag("ETM", exclude=("+J", "XS"))
+    _etm_next_flag = _add_flag("J", exclude=("MAJ", "EMOJI", "JAMO", "+J"))
+    _nnb_flag = _add_flag("NNB")
+    _se_flag = _add_flag("SE")
+    _vv_flag = _add_flag("VV")
+
+    def __init__(self, syllables: Syllables):
         super().__init__()
-        self.syllable = syllable
-
-    def __hash__(self):
-        """Hash function for lru_cache"""
-        return hash(self.syllable)
+        self.syllables = syllables
+        self.text = syllables.text
+        self.char = syllables.char
+        self.flags = syllables.flags
+        self.next = syllables.next
+        self.prev = syllables.prev
 
     ####################
     # Flow Controllers #
     ####################
 
-    def check_split_start(self) -> bool:
+    def check_split_start(self, idx: int) -> bool:
         """
         Check whether the given syllable is split point or not.
 
+        Args:
+            idx (int): index of current syllable
+
         Returns:
             bool: whether the given syllable is split point or not.
 
@@ -53,18 +106,21 @@ class SentenceSplitter(SentenceProcessor):
                 종결부호(SF), 캐릭터 휴리스틱 규칙, 4개의 어말어미(EF, EC, ETN, ETM) 규칙 중 하나라도 성립하면 분할한다.
         """
         return (
-            self._sf()
-            or self._ef()
-            or self._ec()
-            or self._etn()
-            or self._etm()
-            or self._char()
+            self._sf(idx)
+            or self._ef(idx)
+            or self._ec(idx)
+            or self._etn(idx)
+            or self._etm(idx)
+            or self._char(idx)
         )
 
-    def check_split_end(self) -> Tuple[bool, bool]:
+    def check_split_end(self, idx: int) -> Tuple[bool, bool]:
         """
         Check whether the given syllable is split end point or not.
 
+        Args:
+            idx (int): index of current syllable
+
         Returns:
             bool: whether the given syllable is split end point or not.
 
@@ -80,41 +136,41 @@ class SentenceSplitter(SentenceProcessor):
                 2. 만약 현재 문자가 하이푼(-)인데 공백을 제외한 다음 문자가 종결부호(SF)가 아닌 경우 지금 즉시 분할한다.
                 3. 만약 현재 문자가 자음인데 이전문자가 공백이고 다음 문자가 종결부호(SF)이며 다다음 문자가 공백이면 즉시 분할한다.
         """
+        flags, char, _prev, _next = self.flags, self.char, self.prev[idx], self.next[idx]
+        skip_sp = self.syllables.next_skip_flags
 
-        no_more_all_s = not self._check_pos(
-            self._all_s_poses_wo_qtn, exclude=self._all_s_exclude
-        )
+        no_more_all_s = not flags[idx] & self._all_s_wo_qtn_flag
 
         end_split = no_more_all_s and not (
-            (self._check_text(",") and self._check_next_text(","))
-            or (self._check_text(",") and self._check_prev_text(","))
+            (char(idx) == "," and char(_next) == ",")
+            or (char(idx) == "," and char(_prev) == ",")
         )
 
-        end_split = end_split and not self.syllable.check_pos("JAMO")
-        end_split = end_split and not self.check_split_start()
+        end_split = end_split and not flags[idx] & self._jamo_flag
+        end_split = end_split and not self.check_split_start(idx)
         end_split_exception = False
 
         if not end_split:
             # 예외 1
-            if self._check_prev_skip_sp_text(
-                ("?", "!")
-            ) and self._check_next_skip_sp_text("."):
+            if char(self.syllables.prev_skip_flags(idx, self._sp_flag)) in ("?", "!") and (
+                char(skip_sp(idx, self._sp_flag)) == "."
+            ):
                 end_split = True
                 end_split_exception = True
 
             # 예외 2
-            elif self._check_text(("－", "-", "–")) and not (
-                self._check_next_skip_sp_pos("SF")
-                or self._check_next_text(("－", "-", "–"))
+            elif char(idx) in self._dashes and not (
+                flags[skip_sp(idx, self._sp_flag)] & self._sf_flag
+                or char(_next) in self._dashes
             ):
                 end_split = True
                 end_split_exception = True
 
             elif (
-                self.syllable.prev.check_pos("SP")
-                and self.syllable.check_text(*jaum)
-                and self.syllable.next.check_text(".")
-                and self.syllable.next.next.check_text(" ")
+                flags[_prev] & self._sp_flag
+                and char(idx) in jaum
+                and char(_next) == "."
+                and char(self.next[_next]) == " "
             ):
                 end_split = True
                 end_split_exception = True
@@ -125,23 +181,29 @@ class SentenceSplitter(SentenceProcessor):
     # Splitting Rules #
     ###################
 
-    def check_split_right_now(self) -> bool:
+    def check_split_right_now(self, idx: int) -> bool:
         """
         Check whether the given syllable is split end point or not.
 
+        Args:
+            idx (int): index of current syllable
+
         Returns:
             bool: whether the given syllable is split end point or not.
 
         Notes:
             단락기호(¶)가 등장하면 곧바로 분리한다.
         """
-        available = self.syllable.check_text("¶")
+        available = self.char(idx) == "¶"
         return available
 
-    def _sf(self) -> bool:
+    def _sf(self, idx: int) -> bool:
         """
         Check whether the given syllable is split end point or not.
 
+        Args:
+            idx (int): index of current syllable
+
         Returns:
             bool: whether the given syllable is split end point or not.
 
@@ -161,81 +223,83 @@ class SentenceSplitter(SentenceProcessor):
                 9. 현재 문자가 ' no.', ' No.', ' vol.', ' p.', ' pp.', ' page.', ' al.', ' ed.', ' eds.'
                     ' 항.', ' 조.', ' 호.', ' 절.', ' 권.', " 쪽.' 등에 존재하면 분할하지 않는다.
         """
-
         available = False
+        flags, char = self.flags, self.char
 
         # 종결부호 분할 규칙
-        if self._check_pos("SF") and (
-            self._check_next_pos("SP")
-            or self._check_next_skip_sp_pos(("SY", "SSO", "EMOJI", "JAMO"))
+        if flags[idx] & self._sf_flag and (
+            flags[self.next[idx]] & self._sp_flag
+            or flags[self.syllables.next_skip_flags(idx, self._sp_flag)] & self._sf_next_flag
         ):
+            prev_skip_spsf = self.syllables.prev_skip_flags(idx, self._sp_flag | self._sf_flag)
+            next_skip_spsf = self.syllables.next_skip_flags(idx, self._sp_flag | self._sf_flag)
+
             # 예외 1
-            available = not self._prev_skip(("SP", "SF")).text.isnumeric()
+            available = not char(prev_skip_spsf).isnumeric()
 
             # 예외 2
-            available = available and not (
-                self._check_prev_skip_spsf_pos("VCP", exclude="+VCP")
-            )
+            available = available and not flags[prev_skip_spsf] & self._vcp_flag
 
             # 예외 3
             available = available and not (
-                self._check_prev_skip_spsf_pos("J", exclude=("EMOJI", "JAMO", "+J"))
-                and self._check_text(".")
-                and self._check_prev_text(".")
+                flags[prev_skip_spsf] & self._sf_prev_j_flag
+                and char(idx) == "."
+                and char(self.prev[idx]) == "."
             )
 
             # 예외 4
-            available = available and not (
-                self._check_next_skip_spsf_pos("VCP", exclude="+VCP")
-            )
+            available = available and not flags[next_skip_spsf] & self._vcp_flag
 
             # 예외 5
-            available = available and not self._check_prev_skip_spsf_pos(("MAJ", "MAG"))
+            available = available and not flags[prev_skip_spsf] & self._maj_mag_flag
 
             # 예외 6
             available = available and not (
                 (
-                    self._check_prev_skip_spsf_pos("EC")
-                    and self._check_prev_skip_spsf_text("만")
+                    flags[prev_skip_spsf] & self._ec_flag
+                    and char(prev_skip_spsf) == "만"
                 )
                 or (
-                    self._check_prev_skip_spsf_pos(("EC", "NNB"))
-                    and self._check_prev_skip_spsf_text("데")
-                    and self._check_prev_text(".")
+                    flags[prev_skip_spsf] & self._ec_nnb_flag
+                    and char(prev_skip_spsf) == "데"
+                    and char(self.prev[idx]) == "."
                 )
             )
 
             # 예외 7
-            next_skip_sp = self._next_skip("SP")
-            prev_skip_sp = self._prev_skip("SP")
+            next_skip_sp = self.syllables.next_skip_flags(idx, self._sp_flag)
+            prev_skip_sp = self.syllables.prev_skip_flags(idx, self._sp_flag)
 
             available = (
                 available
                 and not (
-                    not next_skip_sp.check_text(".")
-                    and next_skip_sp.next_skip("SP").check_text(".")
+                    not char(next_skip_sp) == "."
+                    and char(self.syllables.next_skip_flags(next_skip_sp, self._sp_flag)) == "."
                 )
                 and not (
-                    not prev_skip_sp.check_text(".")
-                    and prev_skip_sp.prev_skip("SP").check_text(".")
+                    not char(prev_skip_sp) == "."
+                    and char(self.syllables.prev_skip_flags(prev_skip_sp, self._sp_flag)) == "."
                 )
             )
 
             # 예외 8
-            available = available and not self._check_next_is_unavailable_split()
+            available = available and not self._check_next_is_unavailable_split(idx)
 
             # 예외 9
             available = available and not (
-                self._check_text(".")
-                and self._check_multiple_prev_texts_from_before(*sf_exception)
+                char(idx) == "."
+                and self._check_prev_texts_from_before(idx, self._sf_exceptions)
             )
 
         return available
 
-    def _ef(self) -> bool:
+    def _ef(self, idx: int) -> bool:
         """
         Check whether the given syllable is split end point or not.
 
+        Args:
+            idx (int): index of current syllable
+
         Returns:
             bool: whether the given syllable is split end point or not.
 
@@ -250,43 +314,40 @@ class SentenceSplitter(SentenceProcessor):
                 4. 현재 문자 바로 이전 문자가 공백(SP)이고 그 이전 문자가 보조용언(VX)이면 분할하지 않는다.
                 5. 현재 문자 뒤로 등장하는 한글 문자열이 몇가지 분할하지 않아야 하는 경우에 속하면 분할하지 않는다.
         """
-
         available = False
+        flags, char = self.flags, self.char
+        next_skip_sp = self.syllables.next_skip_flags(idx, self._sp_flag)
 
         # 종결어미 분할 규칙
-        if self._check_pos("EF", exclude="+J") and not self._check_next_skip_sp_pos(
-            "EF"
-        ):
+        if flags[idx] & self._ef_wo_j_flag and not flags[next_skip_sp] & self._ef_flag:
             # 예외 1
-            available = not self._check_non_doubled_comma()
+            available = not self._check_non_doubled_comma(idx)
 
             # 예외 2
-            available = available and not (
-                self._check_next_skip_sp_pos(
-                    ("EC", "J", "VX"),
-                    exclude=("MAJ", "EMOJI", "JAMO", "+VX", "+EC", "+J", "VX+"),
-                )
-            )
+            available = available and not flags[next_skip_sp] & self._ef_next_flag
 
             # 예외 3
-            if available and self._check_prev_pos("NP+VCP+EF"):
-                available = self._check_next_pos("SF")
+            if available and flags[self.prev[idx]] & self._np_vcp_ef_flag:
+                available = bool(flags[self.next[idx]] & self._sf_flag)
 
             # 예외 4
             available = available and not (
-                self._check_prev_text(" ")
-                and self.syllable.prev.check_pos("VX", exclude="VX+")
+                char(self.prev[idx]) == " "
+                and flags[self.prev[idx]] & self._vx_flag
             )
 
             # 예외 5
-            available = available and not self._check_next_is_unavailable_split()
+            available = available and not self._check_next_is_unavailable_split(idx)
 
         return available
 
-    def _ec(self) -> bool:
+    def _ec(self, idx: int) -> bool:
         """
         Check whether the given syllable is split end point or not.
 
+        Args:
+            idx (int): index of current syllable
+
         Returns:
             bool: whether the given syllable is split end point or not.
 
@@ -308,49 +369,49 @@ class SentenceSplitter(SentenceProcessor):
         """
         available = False
         permission = False
+        flags, char, _prev = self.flags, self.char, self.prev[idx]
+        next_skip_sp = self.syllables.next_skip_flags(idx, self._sp_flag)
 
         # 연결어미 분할 규칙
         if (
-            self._check_text("다")
-            and self._check_pos("EC", exclude="+J")
-            and not self._check_next_skip_sp_pos("EC")
+            char(idx) == "다"
+            and flags[idx] & self._ec_wo_j_flag
+            and not flags[next_skip_sp] & self._ec_flag
         ):
             # 예외 1
-            available = not self._check_non_doubled_comma()
+            available = not self._check_non_doubled_comma(idx)
 
             # 예외 2
-            available = available and not self._check_next_skip_sp_pos(
-                ("VCP", "J", "VX"),
-                exclude=("MAJ", "JAMO", "EMOJI", "+J", "+VCP", "+VX"),
-            )
+            available = available and not flags[next_skip_sp] & self._ec_next_flag
 
             # 예외 3
-            available = available and not self._check_next_is_unavailable_split()
+            available = available and not self._check_next_is_unavailable_split(idx)
 
         if available:
             # 허용 1:
-            permission = self._check_prev_pos("EP") and self._check_next_skip_sp_pos(
-                ("SF", "SY", "SSO", "QTO", "EMOJI")
-            )
+            permission = flags[_prev] & self._ep_flag and flags[next_skip_sp] & self._ec_permission_flag
 
             # 허용 2:
             permission = permission or (
-                self._check_prev_pos("EP") and self._check_next_skip_sp_pos("NP", "MAJ")
+                flags[_prev] & self._ep_flag and flags[next_skip_sp] & self._np_flag
             )
 
             # 허용 3:
             permission = permission or (
-                self._check_prev_text("니")
-                and self._check_prev_pos("EC")
-                and not (self._check_next_text("만") and self._check_next_pos("EC"))
+                char(_prev) == "니"
+                and flags[_prev] & self._ec_flag
+                and not (char(self.next[idx]) == "만" and flags[self.next[idx]] & self._ec_flag)
             )
 
-        return available and permission
+        return bool(available and permission)
 
-    def _etn(self) -> bool:
+    def _etn(self, idx: int) -> bool:
         """
         Check whether the given syllable is split end point or not.
 
+        Args:
+            idx (int): index of current syllable
+
         Returns:
             bool: whether the given syllable is split end point or not.
 
@@ -369,47 +430,49 @@ class SentenceSplitter(SentenceProcessor):
                 6. 현재 문자 뒤로 등장하는 한글 문자열이 몇가지 분할하지 않아야 하는 경우에 속하면 분할하지 않는다.
         """
         available = False
+        flags, char = self.flags, self.char
+        next_skip_sp = self.syllables.next_skip_flags(idx, self._sp_flag)
 
         if (
-            self._check_pos("ETN", exclude=("+J", "XS"))
-            and not self._check_next_skip_sp_pos("ETN")
-            and not self._check_text("기", "길")
+            flags[idx] & self._etn_wo_j_xs_flag
+            and not flags[next_skip_sp] & self._etn_flag
+            and not char(idx) == "기"
         ):
             # 예외 1
-            available = not self._check_non_doubled_comma()
+            available = not self._check_non_doubled_comma(idx)
 
             # 예외 2
-            available = available and (
-                self._check_next_pos(("SP", "SF", "SY", "SSO", "QTO", "EMOJI", "JAMO"))
-            )
+            available = available and bool(flags[self.next[idx]] & self._etn_next_flag)
 
             # 예외 3
-            available = available and not self._check_next_skip_sp_pos(
-                ("J", "VV", "VA", "VX"),
-                exclude=("MAJ", "EMOJI", "JAMO", "+J"),
-            )
+            available = available and not flags[next_skip_sp] & self._etn_next_skip_flag
 
             # 예외 4
-            available = available and not self._check_next_skip_spsf_pos(("MM", "SSC"))
+            available = available and not (
+                flags[self.syllables.next_skip_flags(idx, self._sp_flag | self._sf_flag)] & self._mm_ssc_flag
+            )
 
             # 예외 5
-            available = available and not (
-                self._check_next_skip_all_s_text(
-                    self._prev_skip("ETN")
-                    .prev_skip(*self._all_s_poses, exclude=self._all_s_exclude)
-                    .text
+            prev_text = char(
+                self.syllables.prev_skip_flags(
+                    self.syllables.prev_skip_flags(idx, self._etn_flag), self._all_s_flag
                 )
             )
+            next_all_s = self.syllables.next_skip_flags(idx, self._all_s_flag)
+            available = available and not (next_all_s >= 0 and prev_text in self.text[next_all_s])
 
             # 예외 6
-            available = available and not self._check_next_is_unavailable_split()
+            available = available and not self._check_next_is_unavailable_split(idx)
 
         return available
 
-    def _etm(self) -> bool:
+    def _etm(self, idx: int) -> bool:
         """
         Check whether the given syllable is split end point or not.
 
+        Args:
+            idx (int): index of current syllable
+
         Returns:
             bool: whether the given syllable is split end point or not.
 
@@ -431,37 +494,40 @@ class SentenceSplitter(SentenceProcessor):
         """
         available = False
         permission = False
+        flags = self.flags
+        next_skip_sp = self.syllables.next_skip_flags(idx, self._sp_flag)
 
-        if self._check_pos(
-            "ETM", exclude=("+J", "XS")
-        ) and not self._check_next_skip_sp_pos("ETM"):
+        if flags[idx] & self._etm_wo_j_xs_flag and not flags[next_skip_sp] & self._etm_flag:
             # 예외 1
-            available = not self._check_non_doubled_comma()
+            available = not self._check_non_doubled_comma(idx)
 
             # 예외 2
-            available = available and not self._check_next_skip_all_s_pos("NNB")
+            available = available and not (
+                flags[self.syllables.next_skip_flags(idx, self._all_s_flag)] & self._nnb_flag
+            )
 
             # 예외 3
-            available = available and not self._check_next_skip_sp_pos(
-                "J", exclude=("MAJ", "EMOJI", "JAMO", "+J")
-            )
+            available = available and not flags[next_skip_sp] & self._etm_next_flag
 
             # 예외 4
-            available = available and not self._check_next_is_unavailable_split()
+            available = available and not self._check_next_is_unavailable_split(idx)
 
         if available:
             # 허용 1
-            permission = self._check_prev_texts("다능")
+            permission = self.syllables.check_texts(self.prev[idx], "다능")
 
             # 허용 2
-            permission = permission or self._check_next_skip_sp_pos("SE")
+            permission = permission or bool(flags[next_skip_sp] & self._se_flag)
 
         return available and permission
 
-    def _char(self):
+    def _char(self, idx: int):
         """
         Check whether the given syllable is split end point or not.
 
+        Args:
+            idx (int): index of current syllable
+
         Returns:
             bool: whether the given syllable is split end point or not.
 
@@ -473,374 +539,57 @@ class SentenceSplitter(SentenceProcessor):
                 듯 규칙 1. 현재 문자가 의존명사(NNB)이면서 '듯'이고 공백(SP) 종결부호(SF)를 제외한 다음 문자가 한글 자모(JAMO), 이모지(EMOJI), 말 줄임표(SE)
                         중 하나이면 현재 문자 뒤로 이어지는 모든 자모(JAMO) 및 이모지(EMOJI) 뒤의 문자가 동사가 아닌 경우 분할한다.
         """
+        flags = self.flags
+        next_skip_spsf = self.syllables.next_skip_flags(idx, self._sp_flag | self._sf_flag)
 
         # 듯 규칙 1.
         if (
-            self._check_text("듯")
-            and self._check_pos("NNB")
+            self.char(idx) == "듯"
+            and flags[idx] & self._nnb_flag
             and (
-                self._check_next_skip_spsf_pos(("EMOJI", "JAMO"))
-                or self._check_next_skip_spsf_text("…")
+                flags[next_skip_spsf] & self._emoji_jamo_flag
+                or self.char(next_skip_spsf) == "…"
             )
         ):
-            _next = self.syllable.next_skip("SP")
+            _next = self.syllables.next_skip_flags(idx, self._sp_flag)
             _cur_cnt, _max_cnt = 0, 5
-            while _cur_cnt < _max_cnt and not _next.check_pos("JAMO", "EMOJI"):
-                _next = _next.next_skip("SP")
+            while _cur_cnt < _max_cnt and not flags[_next] & self._emoji_jamo_flag:
+                _next = self.syllables.next_skip_flags(_next, self._sp_flag)
                 _cur_cnt += 1
-            if not _next.check_pos("VV"):
+            if not flags[_next] & self._vv_flag:
                 return True
 
         return False
-
     #####################
     # Utility functions #
     #####################
 
-    @staticmethod
-    def _tuple(exclude):
-        if isinstance(exclude, str):
-            exclude = (exclude,)
-        return exclude
-
-    @lru_cache(1)
-    def _prev(self):
-        return self.syllable.prev
-
-    @lru_cache(1)
-    def _next(self):
-        return self.syllable.next
-
-    @lru_cache(30)
-    def _prev_skip(
-        self,
-        poses=None,
-        exclude=None,
-    ):
-        return self.syllable.prev_skip(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _next_skip(
-        self,
-        poses=None,
-        exclude=None,
-    ):
-        return self.syllable.next_skip(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_pos(
-        self,
-        poses=None,
-        exclude=None,
-    ):
-        return self.syllable.check_pos(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
+    def _read(self, idx: int, length: int) -> str:
+        chars = []
+        while idx >= 0 and len(chars) < length:
+            chars.append(self.text[idx])
+            idx = self.next[idx]
+        return "".join(chars)
+
+    def _check_next_is_unavailable_split(self, idx: int) -> bool:
+        following = self._read(
+            self.syllables.next_skip_flags(idx, self._all_s_flag),
+            self._unavailable_next_max,
         )
-
-    @lru_cache(30)
-    def _check_text(
-        self,
-        texts=None,
-        exclude=None,
-    ):
-        return self.syllable.check_text(
-            *self._tuple(texts),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_next_pos(
-        self,
-        poses=None,
-        exclude=None,
-    ):
-        return self.syllable.next.check_pos(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_prev_pos(
-        self,
-        poses=None,
-        exclude=None,
-    ):
-        return self.syllable.prev.check_pos(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_next_text(
-        self,
-        texts=None,
-        exclude=None,
-    ):
-        return self.syllable.next.check_text(
-            *self._tuple(texts),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_prev_text(
-        self,
-        texts=None,
-        exclude=None,
-    ):
-        return self.syllable.prev.check_text(
-            *self._tuple(texts),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_next_skip_pos(
-        self,
-        poses=None,
-        exclude=None,
-        skip=None,
-        skip_exclude=None,
-    ):
-        return self.syllable.next_skip(
-            *self._tuple(skip),
-            exclude=self._tuple(skip_exclude),
-        ).check_pos(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_prev_skip_pos(
-        self,
-        poses=None,
-        exclude=None,
-        skip=None,
-        skip_exclude=None,
-    ):
-        return self.syllable.prev_skip(
-            *self._tuple(skip),
-            exclude=self._tuple(skip_exclude),
-        ).check_pos(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_next_skip_text(
-        self,
-        texts=None,
-        exclude=None,
-        skip=None,
-        skip_exclude=None,
-    ):
-        return self.syllable.next_skip(
-            *self._tuple(skip),
-            exclude=self._tuple(skip_exclude),
-        ).check_text(
-            *self._tuple(texts),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_prev_skip_text(
-        self,
-        texts=None,
-        exclude=None,
-        skip=None,
-        skip_exclude=None,
-    ):
-        return self.syllable.prev_skip(
-            *self._tuple(skip),
-            exclude=self._tuple(skip_exclude),
-        ).check_text(
-            *self._tuple(texts),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_next_skip_sp_pos(
-        self,
-        poses=None,
-        exclude=None,
-    ):
-        return self.syllable.next_skip("SP").check_pos(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_next_skip_from_current_pos(
-        self,
-        poses=None,
-        exclude=None,
-    ):
-        return self.syllable.next_skip_from_current("SP").check_pos(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_prev_skip_sp_pos(
-        self,
-        poses=None,
-        exclude=None,
-    ):
-        return self.syllable.prev_skip("SP").check_pos(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_next_skip_spsf_pos(
-        self,
-        poses=None,
-        exclude=None,
-    ):
-        return self.syllable.next_skip("SP", "SF").check_pos(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_prev_skip_spsf_pos(
-        self,
-        poses=None,
-        exclude=None,
-    ):
-        return self.syllable.prev_skip("SP", "SF").check_pos(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_next_skip_sp_text(
-        self,
-        texts=None,
-        exclude=None,
-    ):
-        return self.syllable.next_skip("SP").check_text(
-            *self._tuple(texts),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_prev_skip_sp_text(
-        self,
-        texts=None,
-        exclude=None,
-    ):
-        return self.syllable.prev_skip("SP").check_text(
-            *self._tuple(texts),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_next_skip_spsf_text(
-        self,
-        texts=None,
-        exclude=None,
-    ):
-        return self.syllable.next_skip("SP", "SF").check_text(
-            *self._tuple(texts),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_prev_skip_spsf_text(
-        self,
-        texts=None,
-        exclude=None,
-    ):
-        return self.syllable.prev_skip("SP", "SF").check_text(
-            *self._tuple(texts),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_next_skip_all_s_pos(
-        self,
-        poses=None,
-        exclude=None,
-    ):
-        return self.syllable.next_skip(
-            *self._all_s_poses,
-            exclude=self._all_s_exclude,
-        ).check_pos(
-            *self._tuple(poses),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_next_skip_all_s_text(
-        self,
-        texts=None,
-        exclude=None,
-    ):
-        return self.syllable.next_skip(
-            *self._all_s_poses,
-            exclude=self._all_s_exclude,
-        ).check_text(
-            *self._tuple(texts),
-            exclude=self._tuple(exclude),
-        )
-
-    @lru_cache(30)
-    def _check_texts(self, texts=None):
-        return self.syllable.check_texts(*self._tuple(texts))
-
-    @lru_cache(30)
-    def _check_prev_texts(self, texts=None):
-        return self.syllable.prev.check_texts(*self._tuple(texts))
-
-    @lru_cache(30)
-    def _check_next_skip_all_s_texts(self, texts=None):
-        return self.syllable.next_skip_from_current(
-            *self._all_s_poses,
-            exclude=self._all_s_exclude,
-        ).check_texts(*self._tuple(texts))
-
-    @lru_cache(30)
-    def _check_next_skip_all_s_multiple_texts(self, *texts):
-        next_skip_all_s = self.syllable.next_skip(
-            *self._all_s_poses,
-            exclude=self._all_s_exclude,
-        )
-
-        for text in texts:
-            if next_skip_all_s.check_texts(*self._tuple(text)):
+        return any(following[:length] in texts for length, texts in self._unavailable_next.items())
+
+    def _check_non_doubled_comma(self, idx: int) -> bool:
+        next_all_s = self.syllables.next_skip_flags(idx, self._all_s_flag)
+        return self.char(next_all_s) == "," and not self.char(
+            self.syllables.next_skip_flags(next_all_s, self._sp_flag)
+        ) == ","
+
+    def _check_prev_texts_from_before(self, idx: int, groups: Dict[int, Set[str]]) -> bool:
+        _prev = idx
+        for length in range(1, max(groups) + 1):
+            _prev = self.prev[_prev]
+            if _prev < 0:
+                return False
+            if length in groups and self._read(_prev, length) in groups[length]:
                 return True
-
         return False
-
-    @lru_cache(1)
-    def _check_next_is_unavailable_split(self):
-        return self._check_next_skip_all_s_multiple_texts(*self.unavailable_next)
-
-    @lru_cache(1)
-    def _check_non_doubled_comma(self):
-        next_all_s = self._next_skip(self._all_s_poses, exclude=self._all_s_exclude)
-        return next_all_s.check_text(",") and not next_all_s.next_skip("SP").check_text(
-            ","
-        )
-
-    @lru_cache(30)
-    def _check_prev_texts_from_before(self, text):
-        _prev = self.syllable
-        for _ in text:
-            _prev = _prev.prev
-
-        return _prev.check_texts(text)
-
-    @lru_cache(30)
-    def _check_multiple_prev_texts_from_before(self, *texts):
-        return any(self._check_prev_texts_from_before(t) for t in texts)
-
-    @lru_cache(30)
-    def _check_multiple_next_texts_from_current(self, *texts):
-        return any(self._check_texts(t) for t in texts)
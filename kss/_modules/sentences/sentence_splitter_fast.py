@@ -2,12 +2,20 @@
 # All rights reserved.
 
 
+import re
 from collections import defaultdict
+from functools import lru_cache
+from typing import Any, List, Tuple
 
-from kss._modules.morphemes.analyzers import Analyzer, CharacterAnalyzer
-from kss._modules.sentences.sentence_postprocessor import SentencePostprocessor
+from kss._elements.trie import Trie
+from kss._modules.morphemes.analyzers import Analyzer
+from kss._modules.morphemes.utils import _reset_spaces
 from kss._modules.sentences.sentence_preprocessor import SentencePreprocessor
-from kss._utils import const
+
+try:
+    from kss_cython import split_sentences_fast_batch as _split_sentences_native_batch
+except ImportError:
+    _split_sentences_native_batch = None
 
 
 class ID(object):
@@ -32,6 +40,7 @@ def create_dict(d, default=0):
     return defaultdict(lambda: default, d)
 
 
+# It must be same with `map` of csrc/sentence_splitter.h.
 Table = create_dict(
     {
         Stats.DA: create_dict(
@@ -53,8 +62,8 @@ Table = create_dict(
                 "럽": ID.PREV,
                 "렵": ID.PREV,
                 "렸": ID.PREV,
-                "뤘": ID.PREV,
                 "린": ID.PREV,
+                "뤘": ID.PREV,
                 "몄": ID.PREV,
                 "밌": ID.PREV,
                 "볐": ID.PREV,
@@ -63,7 +72,6 @@ Table = create_dict(
                 "섰": ID.PREV,
                 "샜": ID.PREV,
                 "셨": ID.PREV,
-                "싼": ID.PREV,
                 "싸": ID.PREV,
                 "않": ID.PREV,
                 "았": ID.PREV,
@@ -78,17 +86,16 @@ Table = create_dict(
                 "진": ID.PREV,
                 "졌": ID.PREV,
                 "쳤": ID.PREV,
-                "췄": ID.PREV,
                 "챘": ID.PREV,
-                "켰": ID.PREV,
-                "켠": ID.PREV,
-                "캔": ID.PREV,
+                "췄": ID.PREV,
                 "팠": ID.PREV,
                 "펐": ID.PREV,
                 "폈": ID.PREV,
+                "캔": ID.PREV,
+                "켰": ID.PREV,
+                "켠": ID.PREV,
                 "했": ID.PREV,
                 "혔": ID.PREV,
-                "한": ID.NEXT,
                 "가": ID.NEXT,
                 "고": ID.NEXT | ID.NEXT2,
                 "는": ID.NEXT | ID.NEXT2,
@@ -98,8 +105,8 @@ Table = create_dict(
                 "든": ID.NEXT,
                 "지": ID.NEXT2,
                 "를": ID.NEXT,
-                "운": ID.NEXT,  # ~ 다운
-                "만": ID.NEXT,  # ~ 하다만
+                "운": ID.NEXT,
+                "만": ID.NEXT,
                 "며": ID.NEXT | ID.NEXT2,
                 "면": ID.NEXT | ID.NEXT1 | ID.NEXT2,
                 "서": ID.PREV | ID.NEXT2,
@@ -107,7 +114,8 @@ Table = create_dict(
                 "죠": ID.NEXT,
                 "죵": ID.NEXT,
                 "쥬": ID.NEXT,
-                "하": ID.NEXT1,
+                "한": ID.NEXT,
+                "하": ID.PREV | ID.NEXT1,
                 "해": ID.NEXT1,
                 "도": ID.NEXT2,
                 "": ID.NONE,
@@ -173,12 +181,6 @@ Table = create_dict(
                 "럽": ID.PREV,
                 "렵": ID.PREV,
                 "렸": ID.PREV,
-                "맞": ID.PREV,
-                "몄": ID.PREV,
-                "밌": ID.PREV,
-                "볐": ID.PREV,
-                "볍": ID.PREV,
-                "봤": ID.PREV,
                 "서": ID.PREV,
                 "섰": ID.PREV,
                 "셨": ID.PREV,
@@ -192,11 +194,10 @@ Table = create_dict(
                 "졌": ID.PREV,
                 "쳤": ID.PREV,
                 "챘": ID.PREV,
-                "켰": ID.PREV,
                 "팠": ID.PREV,
-                "폈": ID.PREV,
                 "펐": ID.PREV,
-                "하": ID.PREV,
+                "폈": ID.PREV,
+                "켰": ID.PREV,
                 "했": ID.PREV,
                 "혔": ID.PREV,
                 "고": ID.PREV | ID.NEXT2,
@@ -211,9 +212,9 @@ Table = create_dict(
         Stats.SB: create_dict(
             {
                 "것": ID.PREV,
-                "거": ID.PREV,
                 "가": ID.PREV,
                 "까": ID.PREV,
+                "거": ID.PREV,
                 "걸": ID.PREV,
                 "껄": ID.PREV,
                 "나": ID.PREV,
@@ -221,28 +222,24 @@ Table = create_dict(
                 "네": ID.PREV,
                 "다": ID.PREV,
                 "도": ID.PREV,
-                "쎄": ID.PREV,
-                "래": ID.PREV,
-                "데": ID.PREV,
-                "지": ID.PREV,
                 "든": ID.PREV,
-                "덩": ID.PREV,
-                "등": ID.PREV,
+                "데": ID.PREV,
                 "랴": ID.PREV,
+                "래": ID.PREV,
                 "마": ID.PREV,
                 "봐": ID.PREV,
                 "서": ID.PREV,
-                "셈": ID.PREV,  # ~하셈 (신조어)
+                "셈": ID.PREV,
                 "아": ID.PREV,
                 "어": ID.PREV,
                 "오": ID.PREV,
                 "요": ID.PREV,
-                "용": ID.PREV,
                 "을": ID.PREV,
                 "자": ID.PREV,
+                "지": ID.PREV,
                 "죠": ID.PREV,
-                "쥬": ID.PREV,  # ~했쥬 (사투리)
-                "죵": ID.PREV,  # ~했죵 (신조어)
+                "쥬": ID.PREV,
+                "죵": ID.PREV,
                 "고": ID.PREV | ID.NEXT2,
                 "는": ID.NEXT,
                 "라": ID.PREV | ID.NEXT,
@@ -285,6 +282,7 @@ Table = create_dict(
                 "!": ID.CONT,
                 "~": ID.CONT,
                 "…": ID.CONT,
+                ",": ID.CONT,
                 "": ID.NONE,
             }
         ),
@@ -292,112 +290,169 @@ Table = create_dict(
     default=create_dict({}),
 )
 
+# characters of `isspace` in C. an empty string is not a space unlike `"" in " "`.
+_space_chars = " \t\n\v\f\r"
+_spaces = frozenset(_space_chars)
 
-def _split_sentences_fast(
-    text: str,
-    backend: Analyzer,
-    strip: bool,
-    preprocessor: SentencePreprocessor,
-    postprocessor: SentencePostprocessor,
-):
-    backup_sentence = preprocessor.backup(text)
-    syllables = backend.pos(backup_sentence, drop_space=False)
-    syllables = preprocessor.preprocess(syllables)
+
+def _get_id(stat: int, char: str) -> int:
+    # `get` doesn't insert missing characters into the tables unlike `Table[stat][char]`,
+    # so the tables are same for all texts.
+    return Table.get(stat, Table.default_factory()).get(char, ID.NONE)
+
+
+@lru_cache(maxsize=100)
+def _unit_pattern(ignores: Tuple[str, ...]) -> re.Pattern:
+    # a unit is the longest string of `ignores` at the position, or a character.
+    return re.compile(f"(?P<ignore>{Trie(ignores).pattern.pattern})|.", re.DOTALL)
+
+
+def _split_sentences_fast(text: str, strip: bool = True, ignores: Tuple[str, ...] = ()) -> List[str]:
+    """
+    Split a text into sentences by the table of characters.
+
+    Args:
+        text (str): input text
+        strip (bool): strip all sentences or not
+        ignores (Tuple[str, ...]): strings which must not be split
+
+    Returns:
+        List[str]: outputs of sentence splitting
+
+    Notes:
+        It is same with `splitSentences` of csrc/sentence_splitter.cpp, which is used if kss_cython is installed.
+        The strings in `ignores` are looked up as an empty string, so they never change the state.
+    """
+
+    def push():
+        sentence = "".join(current_sentence)
+        output_sentences.append(sentence.strip(_space_chars) if strip else sentence)
+        current_sentence.clear()
 
     output_sentences = []
     current_sentence = []
     current_stat = Stats.DEFAULT
+    prev_char, prev_char_skip_space = "", ""
 
-    for i, syllable in enumerate(syllables):
-        if current_stat == Stats.DEFAULT:
-            if syllable.text in [".", "!", "?", "…", "~"]:
-                if Table[Stats.SB][syllable.prev.text] & ID.PREV:
-                    current_stat = Stats.SB
+    for match in _unit_pattern(tuple(ignores)).finditer(text):
+        unit = match.group()
+        char = "" if match.lastgroup == "ignore" else unit
 
-            if syllable.text in ["다"]:
-                if Table[Stats.DA][syllable.prev.text] & ID.PREV:
+        if current_stat == Stats.DEFAULT:
+            if char == "다":
+                if _get_id(Stats.DA, prev_char) & ID.PREV:
                     current_stat = Stats.DA
 
-            if syllable.text in ["요"]:
-                if Table[Stats.YO][syllable.prev.text] & ID.PREV:
+            elif char == "요":
+                if _get_id(Stats.YO, prev_char) & ID.PREV:
                     current_stat = Stats.YO
 
-            if syllable.text in ["죠", "죵"]:
-                if Table[Stats.JYO][syllable.prev.text] & ID.PREV:
+            elif char in ["죠", "죵"]:
+                if _get_id(Stats.JYO, prev_char) & ID.PREV:
                     current_stat = Stats.JYO
 
-        else:
-            endif = False
-
-            if not endif:
-                if syllable.text == " " or Table[Stats.COMMON][syllable.text] & ID.CONT or syllable.pos == "EMOJI":
-                    if Table[current_stat][syllable.prev.text] & ID.NEXT1:
-                        output_sentences.append(current_sentence)
-                        current_sentence = [syllable.prev]
-                        current_stat = Stats.DEFAULT
-                    endif = True
-
-            if not endif:
-                if Table[current_stat][syllable.text] & ID.NEXT:
-                    if Table[current_stat][syllable.prev.text] & ID.NEXT1:
-                        current_sentence.append(syllable.prev)
-
-                    elif syllable.prev_skip("SP").text in Table[Stats.COMMON]:
-                        # NEW RULE for KSS 3 to fix following issue.
-                        # https://github.com/hyunwoongko/kss/issues/7
-                        output_sentences.append(current_sentence)
-                        current_sentence = []
-
-                    current_stat = Stats.DEFAULT
-                    endif = True
-
-            if not endif:
-                if Table[current_stat][syllable.text] & ID.NEXT1:
-                    if Table[current_stat][syllable.prev.text] & ID.NEXT1:
-                        output_sentences.append(current_sentence)
-                        current_sentence = [syllable.prev]
-                        current_stat = Stats.DEFAULT
-                    endif = True
-
-            if not endif:
-                if Table[current_stat][syllable.text] & ID.NEXT2:
-                    if Table[current_stat][syllable.prev.text] & ID.NEXT1:
-                        current_sentence.append(syllable.prev)
-
-                    else:
-                        # NEW RULE for KSS 3 to fix following issue.
-                        # https://github.com/hyunwoongko/kss/issues/7
-                        output_sentences.append(current_sentence)
-                        current_sentence = []
-
-                    current_stat = Stats.DEFAULT
-                    endif = True
-
-            if not endif:
-                if (
-                    not Table[current_stat][syllable.text]
-                    or Table[current_stat][syllable.text] & ID.PREV
-                ):
-
-                    if syllable.text not in const.not_endpoint:
-                        output_sentences.append(current_sentence)
-                        current_sentence = []
-                        if Table[current_stat][syllable.prev.text] & ID.NEXT1:
-                            current_sentence.append(syllable.prev)
-
-                    current_stat = Stats.DEFAULT
-
-        if current_stat == Stats.DEFAULT or not (Table[current_stat][syllable.text] & ID.NEXT1):
-            current_sentence.append(syllable)
+            elif char in [".", "!", "?", "…", "~"]:
+                if _get_id(Stats.SB, prev_char) & ID.PREV:
+                    current_stat = Stats.SB
+
+        elif char in _spaces or _get_id(Stats.COMMON, char) & ID.CONT:
+            if _get_id(current_stat, prev_char) & ID.NEXT1:
+                push()
+                current_sentence.append(prev_char)
+                current_stat = Stats.DEFAULT
+
+        elif _get_id(current_stat, char) & ID.NEXT:
+            if _get_id(current_stat, prev_char) & ID.NEXT1:
+                current_sentence.append(prev_char)
+
+            elif _get_id(Stats.COMMON, prev_char_skip_space) & ID.CONT:
+                # NEW RULE for KSS 3 to fix following issue.
+                # https://github.com/hyunwoongko/kss/issues/7
+                push()
+
+            current_stat = Stats.DEFAULT
+
+        elif _get_id(current_stat, char) & ID.NEXT1:
+            if _get_id(current_stat, prev_char) & ID.NEXT1:
+                push()
+                current_sentence.append(prev_char)
+                current_stat = Stats.DEFAULT
+
+        elif _get_id(current_stat, char) & ID.NEXT2:
+            if _get_id(current_stat, prev_char) & ID.NEXT1:
+                current_sentence.append(prev_char)
+
+            else:
+                # NEW RULE for KSS 3 to fix following issue.
+                # https://github.com/hyunwoongko/kss/issues/7
+                push()
+
+            current_stat = Stats.DEFAULT
+
+        elif not _get_id(current_stat, char) or _get_id(current_stat, char) & ID.PREV:
+            push()
+            if _get_id(current_stat, prev_char) & ID.NEXT1:
+                current_sentence.append(prev_char)
+
+            current_stat = Stats.DEFAULT
+
+        if current_stat == Stats.DEFAULT or not (_get_id(current_stat, char) & ID.NEXT1):
+            current_sentence.append(unit)
+
+        prev_char = char
+        if char not in _spaces:
+            prev_char_skip_space = char
 
     if len(current_sentence) != 0:
-        output_sentences.append(current_sentence)
-        current_sentence = []
+        push()
 
-    if Table[current_stat][syllable.prev.text] & ID.NEXT1:
-        current_sentence.append(syllable.prev)
-        output_sentences.append(current_sentence)
+    if _get_id(current_stat, prev_char) & ID.NEXT1:
+        current_sentence.append(prev_char)
+        push()
 
-    output_sentences = postprocessor.postprocess(output_sentences, strip)
-    output_sentences = [postprocessor.restore(s, text) for s in output_sentences]
     return output_sentences
+
+
+def _split_sentences_fast_batch(
+    texts: List[str],
+    backend: Analyzer,
+    strip: bool,
+    preprocessor: SentencePreprocessor,
+    return_morphemes: bool = False,
+    native: bool = True,
+    **kwargs,
+) -> List[Any]:
+    """
+    Split texts into sentences with the fast backend.
+
+    Args:
+        texts (List[str]): list of texts
+        backend (Analyzer): morpheme analyzer backend
+        strip (bool): strip all sentences or not
+        preprocessor (SentencePreprocessor): sentence preprocessor which has the strings to ignore
+        return_morphemes (bool): whether to return morphemes or not
+        native (bool): whether to use kss_cython if it's installed or not
+        **kwargs: arguments of the other backends, which are not used
+
+    Returns:
+        List[Any]: outputs of sentence splitting for each text
+
+    Notes:
+        The whole batch is split in C++ without holding the GIL if kss_cython is installed,
+        and `_split_sentences_fast` gives the same output otherwise.
+        The strings in `ignores` are kept as they are instead of being backed up,
+        and the sentences are not postprocessed like the other backends.
+    """
+    ignores = tuple(k for k in preprocessor.ignores or [] if len(k) != 0)
+
+    if native and _split_sentences_native_batch is not None:
+        outputs = _split_sentences_native_batch(texts, strip=strip, ignores=ignores)
+    else:
+        outputs = [_split_sentences_fast(text, strip=strip, ignores=ignores) for text in texts]
+
+    if return_morphemes:
+        outputs = [
+            (sentences, _reset_spaces(" ".join(sentences), backend.pos(text, drop_space=False)))
+            for text, sentences in zip(texts, outputs)
+        ]
+    return outputs
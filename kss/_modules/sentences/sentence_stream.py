@@ -0,0 +1,186 @@
+# Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
+# All rights reserved.
+
+from typing import List
+
+from kss._modules.sentences.split_sentences import split_sentences
+from kss._utils.const import quotes_open_to_close, quotes_close_to_open, bracket_open_to_close, bracket_close_to_open
+from kss._utils.sanity_checks import _check_type, _check_iterable_type, _check_analyzer_backend
+
+# quotes and brackets which can make the following sentences merged into an embraced sentence.
+_open_to_close = {**quotes_open_to_close, **bracket_open_to_close}
+_close_to_open = {**quotes_close_to_open, **bracket_close_to_open}
+
+
+class SentenceStream(object):
+    """
+    Incremental sentence splitter for unbounded text streams.
+
+    Args:
+        backend (str): morpheme analyzer backend. 'mecab', 'pecab', 'punct', 'fast' are supported
+        strip (bool): strip all sentences or not
+        ignores (List[str]): list of strings to ignore
+        lookahead (int): the number of last sentences which are kept until more text comes.
+            they can be merged with the following text, so they are not final yet.
+        min_chars (int): the number of new characters which triggers splitting the buffer.
+        max_window (int): the maximum number of characters kept in the buffer.
+            if the buffer becomes longer than this, sentences are emitted even if a quote or a bracket is still open.
+
+    Examples:
+        >>> import kss
+        >>> stream = kss.SentenceStream(backend="fast")
+        >>> with open("huge_file.txt", encoding="utf-8") as f:
+        ...     for chunk in iter(lambda: f.read(4096), ""):
+        ...         for sentence in stream.feed(chunk):
+        ...             print(sentence)
+        >>> for sentence in stream.flush():
+        ...     print(sentence)
+
+    Notes:
+        The buffer is split whenever `min_chars` characters are fed, and all sentences but the last `lookahead`
+        ones are emitted if no quote or bracket is open after them. The emitted text is removed from the buffer,
+        so memory usage depends on `max_window`, not on the length of the stream.
+        With 'punct' and 'fast' backends, the output is the same as `split_sentences` of the whole text.
+        'mecab' and 'pecab' tag words using the whole input, so a few boundaries can be different.
+    """
+
+    def __init__(
+        self,
+        backend: str = "auto",
+        strip: bool = True,
+        ignores: List[str] = None,
+        lookahead: int = 2,
+        min_chars: int = 1024,
+        max_window: int = 16384,
+    ):
+        self.strip = _check_type(strip, "strip", bool)
+        self.ignores = _check_iterable_type(ignores if ignores is not None else [], "ignores", list, str)
+        self.lookahead = _check_type(lookahead, "lookahead", int)
+        self.min_chars = _check_type(min_chars, "min_chars", int)
+        self.max_window = _check_type(max_window, "max_window", int)
+
+        # the analyzer is resolved once, so that 'auto' doesn't print its message for each split.
+        analyzer = _check_analyzer_backend(backend)
+        self.backend = {"character": "punct", "fast": "fast", "pecab": "pecab"}.get(analyzer._backend, "mecab")
+
+        for name, value, minimum in [("lookahead", lookahead, 1), ("min_chars", min_chars, 1), ("max_window", max_window, 1)]:
+            if value < minimum:
+                raise ValueError(
+                    f"Oops! `{name}` must be same or greater than {minimum}, but you input {value}.\n"
+                    f"Please check `{name}` parameter again ;)"
+                )
+
+        self.buffer = ""
+        self.context = ""
+        self.num_new_chars = 0
+        # quotes and brackets opened in the emitted text and not closed yet.
+        # it is not empty only if sentences were emitted inside a quotation because of `max_window`.
+        self.stack: List[str] = []
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Feed a chunk of text.
+
+        Args:
+            chunk (str): chunk of text. it can end in the middle of a sentence or a word.
+
+        Returns:
+            List[str]: sentences which became final
+        """
+        chunk = _check_type(chunk, "chunk", str)
+        self.buffer += chunk
+        self.num_new_chars += len(chunk)
+
+        if self.num_new_chars < self.min_chars:
+            return []
+
+        self.num_new_chars = 0
+        return self._emit(final=False)
+
+    def flush(self) -> List[str]:
+        """
+        Split all text in the buffer. Call this at the end of the stream.
+
+        Returns:
+            List[str]: the remaining sentences
+        """
+        self.num_new_chars = 0
+        return self._emit(final=True)
+
+    def _emit(self, final: bool) -> List[str]:
+        if len(self.buffer.strip()) == 0:
+            if final:
+                self.buffer, self.context, self.stack = "", "", []
+            return []
+
+        # the last emitted sentences are split again with the buffer,
+        # so that the morpheme analyzer sees the same left context as in the batch mode.
+        text, offset = self.context + self.buffer, len(self.context)
+        sentences, spans = split_sentences(
+            text,
+            backend=self.backend,
+            strip=self.strip,
+            ignores=self.ignores,
+            return_spans=True,
+            num_workers=1,
+        )
+
+        # sentences in the context were emitted already.
+        first = 0
+        while first < len(spans) and spans[first][1] <= offset:
+            first += 1
+
+        if first < len(spans) and spans[first][0] < offset:
+            # a sentence crossing the context can't be taken back, so only its new part is emitted.
+            start, end = offset, spans[first][1]
+            while start < end and text[start].isspace():
+                start += 1
+            sentences[first], spans[first] = (text[start:end].strip() if self.strip else text[offset:end]), (start, end)
+
+        if final:
+            self.buffer, self.context, self.stack = "", "", []
+            return sentences[first:]
+
+        num_candidates = max(len(sentences) - first - self.lookahead, 0)
+        num_emitted, stack, stacks, cursor = 0, list(self.stack), [], offset
+
+        for i in range(first, first + max(num_candidates, 1)):
+            if i >= len(spans):
+                break
+
+            end = spans[i][1]
+            self._update_stack(stack, text[cursor:end])
+            stacks.append(list(stack))
+            cursor = end
+
+            # sentences after an open quote or bracket can be merged into the embraced sentence.
+            if i < first + num_candidates and len(stack) == 0:
+                num_emitted = i - first + 1
+
+        if num_emitted == 0 and len(self.buffer) > self.max_window:
+            # the buffer must not grow anymore, even if a quote or a bracket is still open.
+            num_emitted = min(max(num_candidates, 1), len(sentences) - first)
+
+        if num_emitted == 0:
+            return []
+
+        last = first + num_emitted - 1
+        self.stack = stacks[num_emitted - 1]
+        self.context = text[spans[max(last - self.lookahead + 1, 0)][0]: spans[last][1]][-self.max_window:]
+        self.buffer = text[spans[last][1]:]
+        return sentences[first: last + 1]
+
+    @staticmethod
+    def _update_stack(stack: List[str], text: str):
+        for char in text:
+            if char in _open_to_close and char not in _close_to_open:
+                stack.append(char)
+            elif char in _close_to_open and char not in _open_to_close:
+                if len(stack) != 0 and stack[-1] == _close_to_open[char]:
+                    stack.pop()
+            elif char in _open_to_close:
+                # quotes without direction close the same quote or open a new one.
+                if len(stack) != 0 and stack[-1] == char:
+                    stack.pop()
+                else:
+                    stack.append(char)
@@ -3,23 +3,26 @@
 
 
 from functools import partial, lru_cache
-from typing import List, Union, Tuple, Any
+from typing import List, Union, Tuple, Any, Callable, Optional
 
 from kss._modules.morphemes.utils import _reset_spaces
 
-from kss._elements.subclasses import Syllable
+from kss._elements.syllables import Syllables
 from kss._modules.morphemes.analyzers import Analyzer
+from kss._modules.morphemes.cache import _analysis_cache
 from kss._modules.sentences.embracing_processor import EmbracingProcessor
 from kss._modules.sentences.sentence_postprocessor import SentencePostprocessor
 from kss._modules.sentences.sentence_preprocessor import SentencePreprocessor
 from kss._modules.sentences.sentence_splitter import SentenceSplitter
-from kss._utils.multiprocessing import _run_job
+from kss._modules.sentences.sentence_splitter_fast import _split_sentences_fast_batch
+from kss._utils.multiprocessing import _run_batch_job
 from kss._utils.sanity_checks import (
     _check_num_workers,
     _check_text,
     _check_analyzer_backend,
     _check_type,
     _check_iterable_type,
+    _check_executor,
 )
 
 preprocessors = {(): SentencePreprocessor()}
@@ -33,6 +36,8 @@ def split_sentences(
     strip: bool = True,
     return_morphemes: bool = False,
     ignores: List[str] = None,
+    return_spans: bool = False,
+    executor: str = "process",
 ) -> Union[List[str], List[List[str]]]:
     """
     This splits texts into sentences.
@@ -44,6 +49,8 @@ def split_sentences(
         strip (bool): strip all sentences or not
         return_morphemes (bool): whether to return morphemes or not
         ignores (List[str]): list of strings to ignore
+        return_spans (bool): whether to return (start, end) character offsets of sentences in the input text or not
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[List[str], List[List[str]]]: outputs of sentence splitting
@@ -54,6 +61,11 @@ def split_sentences(
         >>> text = "회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요 다만, 강남 토끼정이 강남 쉑쉑버거 골목길로 쭉 올라가야 하는데 다들 쉑쉑버거의 유혹에 넘어갈 뻔 했답니다 강남역 맛집 토끼정의 외부 모습."
         >>> split_sentences(text)
         ['회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요', '다만, 강남 토끼정이 강남 쉑쉑버거 골목길로 쭉 올라가야 하는데 다들 쉑쉑버거의 유혹에 넘어갈 뻔 했답니다', '강남역 맛집 토끼정의 외부 모습.']
+        >>> split_sentences(text, return_spans=True)
+        (['회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요', '다만, 강남 토끼정이 강남 쉑쉑버거 골목길로 쭉 올라가야 하는데 다들 쉑쉑버거의 유혹에 넘어갈 뻔 했답니다', '강남역 맛집 토끼정의 외부 모습.'], [(0, 33), (34, 93), (94, 112)])
+
+    Notes:
+        If both of `return_morphemes` and `return_spans` are True, it returns (sentences, morphemes, spans).
     """
     if ignores is None:
         ignores = []
@@ -61,6 +73,7 @@ def split_sentences(
     text, finish = _check_text(text)
     strip = _check_type(strip, "strip", bool)
     return_morphemes = _check_type(return_morphemes, "return_morphemes", bool)
+    return_spans = _check_type(return_spans, "return_spans", bool)
     ignores = _check_iterable_type(ignores, "ignores", list, str)
 
     if finish:
@@ -68,6 +81,7 @@ def split_sentences(
 
     backend_analyzer = _check_analyzer_backend(backend)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     ignores_tuple = tuple(ignores)
     if ignores_tuple not in preprocessors:
@@ -77,32 +91,125 @@ def split_sentences(
     _postprocessor = postprocessors[ignores_tuple]
 
     if backend_analyzer._backend == "fast":
-        try:
-            from kss_cython import split_sentences_fast as _split_sentences_fast
-        except ImportError:
-            from kss._modules.sentences.sentence_splitter_fast import _split_sentences_fast
-
-        split_fn = _split_sentences_fast
+        # kss_cython splits a whole batch without holding the GIL, so the batches run in parallel with `executor="thread"`.
+        split_fn, batch_split_fn = None, _split_sentences_fast_batch
     else:
-        split_fn = _split_sentences
+        split_fn, batch_split_fn = _split_sentences, None
 
-    return _run_job(
-        func=partial(
-            split_fn,
+    return _run_batch_job(
+        batch_func=partial(
+            _split_sentences_batch,
+            split_fn=split_fn,
+            batch_split_fn=batch_split_fn,
             backend=backend_analyzer,
             strip=strip,
             return_morphemes=return_morphemes,
+            return_spans=return_spans,
             preprocessor=_preprocessor,
             postprocessor=_postprocessor,
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
+def _split_sentences_batch(
+    texts: List[str],
+    split_fn: Optional[Callable],
+    backend: Analyzer,
+    preprocessor: SentencePreprocessor,
+    return_spans: bool = False,
+    batch_split_fn: Optional[Callable] = None,
+    **kwargs,
+) -> List[Any]:
+    """
+    Split a batch of texts into sentences.
+
+    Args:
+        texts (List[str]): list of texts
+        split_fn (Optional[Callable]): function which splits a text. it's not used if `batch_split_fn` is given.
+        backend (Analyzer): morpheme analyzer backend
+        preprocessor (SentencePreprocessor): sentence preprocessor
+        return_spans (bool): whether to return spans of sentences or not
+        batch_split_fn (Optional[Callable]): function which splits all texts at once. `split_fn` is used if it's None.
+        **kwargs: other arguments of `split_fn`
+
+    Returns:
+        List[Any]: outputs of sentence splitting for each text
+
+    Notes:
+        All texts are analyzed by `Analyzer.pos_batch` first,
+        then `split_fn` reads the analysis of each text from the analysis cache.
+    """
+    if len(texts) > 1 and backend._cacheable and _analysis_cache.max_entries >= len(texts):
+        backend.pos_batch([preprocessor.backup(text) for text in texts], drop_space=False)
+    if batch_split_fn is not None:
+        outputs = batch_split_fn(texts, backend=backend, preprocessor=preprocessor, **kwargs)
+    else:
+        outputs = [split_fn(text, backend=backend, preprocessor=preprocessor, **kwargs) for text in texts]
+
+    if return_spans:
+        for i, (text, output) in enumerate(zip(texts, outputs)):
+            sentences = output[0] if isinstance(output, tuple) else output
+            spans = _align_spans(text, sentences)
+            outputs[i] = (*output, spans) if isinstance(output, tuple) else (output, spans)
+    return outputs
+
+
+def _align_spans(text: str, sentences: List[str]) -> List[Tuple[int, int]]:
+    """
+    Find (start, end) character offsets of sentences in the input text.
+
+    Args:
+        text (str): input text
+        sentences (List[str]): output sentences of the text
+
+    Returns:
+        List[Tuple[int, int]]: offsets of each sentence, `text[start:end]` is the sentence.
+
+    Notes:
+        Sentences are in the input order and don't overlap, so they are matched from a cursor which only moves forward.
+        It takes linear time even if the same sentence is repeated many times.
+        If postprocessing changed a sentence so that it's not in the text, it is matched ignoring whitespaces,
+        and `text[start:end]` is the part of the text which the sentence came from.
+    """
+    spans = []
+    cursor, len_text = 0, len(text)
+
+    for sentence in sentences:
+        # the spaces between sentences are skipped one by one,
+        # because a sentence can start with a space which isn't stripped, such as '\u3000'.
+        start = cursor
+        while not text.startswith(sentence, start) and start < len_text and text[start].isspace():
+            start += 1
+
+        if text.startswith(sentence, start):
+            end = start + len(sentence)
+        else:
+            first, end = None, start
+            for char in sentence:
+                if char.isspace():
+                    continue
+
+                position = end
+                while position < len_text and text[position] != char and text[position].isspace():
+                    position += 1
+
+                # characters which are not in the input text were added by postprocessing.
+                if position < len_text and text[position] == char:
+                    first = position if first is None else first
+                    end = position + 1
+            start = first if first is not None else start
+
+        spans.append((start, end))
+        cursor = end
+    return spans
+
+
 @lru_cache(maxsize=500)
 def _split_sentences(
-    text: Union[str, Tuple[Syllable]],
+    text: Union[str, Tuple[int]],
     backend: Analyzer,
     strip: bool,
     postprocess: bool = True,
@@ -110,12 +217,14 @@ def _split_sentences(
     return_morphemes: bool = False,
     preprocessor: SentencePreprocessor = preprocessors[()],
     postprocessor: SentencePostprocessor = postprocessors[()],
+    syllables: Syllables = None,
+    morphemes: Tuple[Tuple[str, str], ...] = None,
 ):
     """
     Split texts into sentences.
 
     Args:
-        text (Union[str, List[Syllable]]): single text
+        text (Union[str, Tuple[int]]): single text or indices of syllables
         backend (str): morpheme analyzer backend
         strip (bool): strip all sentences or not
         postprocess (bool): whether it uses postprocessing or not
@@ -123,6 +232,8 @@ def _split_sentences(
         return_morphemes (bool): whether to return morphemes or not
         preprocessor (SentencePreprocessor): sentence preprocessor
         postprocessor (SentencePostprocessor): sentence postprocessor
+        syllables (Syllables): syllables which the indices of `text` refer to
+        morphemes (Tuple[Tuple[str, str], ...]): morphemes of `text` including spaces. it's not analyzed again if given.
 
     Returns:
         List[str]: outputs of sentence splitting.
@@ -132,13 +243,14 @@ def _split_sentences(
 
     # 1. analyze morphemes
     if isinstance(text, str):
-        backup_sentence = preprocessor.backup(text)
-        morphemes = backend.pos(backup_sentence, drop_space=False)
+        if morphemes is None:
+            morphemes = backend.pos(preprocessor.backup(text), drop_space=False)
+        else:
+            morphemes = preprocessor.backup_morphemes(text, morphemes)
         syllables = preprocessor.preprocess(morphemes)
-    elif isinstance(text, tuple) and len(text) > 0 and isinstance(text[0], Syllable):
-        syllables = text
-    elif isinstance(text, tuple) and len(text) == 0:
-        syllables = tuple()
+        indices = range(len(syllables))
+    elif isinstance(text, tuple) and (len(text) == 0 or syllables is not None):
+        indices = text
     else:
         raise ValueError("Wrong data type input for `_split_sentences`.")
 
@@ -149,28 +261,29 @@ def _split_sentences(
     split_mode = False
 
     # 3. split sentences
-    for idx, syllable in enumerate(syllables):
+    splitter = SentenceSplitter(syllables)
+
+    for idx, syllable in enumerate(indices):
         sent_idx = len(output_sentences)
-        splitter = SentenceSplitter(syllable)
         syllable_added = False
-        embracing.process(idx, sent_idx, syllable)
+        embracing.process(idx, sent_idx, syllables.text[syllable])
         current_embracing_mode = not embracing.empty()
 
         if split_mode is False:
-            if splitter.check_split_right_now():
+            if splitter.check_split_right_now(syllable):
                 output_sentences.append(current_sentence_syllables)
                 current_sentence_syllables = [syllable]
                 syllable_added = True
 
             else:
                 if backend._backend == "character":
-                    split_mode = splitter._sf()
+                    split_mode = splitter._sf(syllable)
                 else:
-                    split_mode = splitter.check_split_start()
+                    split_mode = splitter.check_split_start(syllable)
 
         else:
-            end_split, end_split_exception = splitter.check_split_end()
-            embracing.update_index(idx, sent_idx, syllable)
+            end_split, end_split_exception = splitter.check_split_end(syllable)
+            embracing.update_index(idx, sent_idx, syllables.text[syllable])
 
             if end_split is True:
                 split_mode = False
@@ -199,7 +312,7 @@ def _split_sentences(
     # 4. realign wrong quotes and brackets
     if recursion < 10:
         output_sentences = embracing.realign(
-            input_sentences=syllables,
+            input_sentences=indices,
             output_sentences=output_sentences,
             func=partial(
                 _split_sentences,
@@ -208,12 +321,13 @@ def _split_sentences(
                 return_morphemes=False,
                 postprocess=False,
                 recursion=recursion + 1,
+                syllables=syllables,
             ),
         )
 
     # 5. postprocess
     if postprocess is True:
-        output_sentences = postprocessor.postprocess(output_sentences, strip)
+        output_sentences = postprocessor.postprocess(syllables, output_sentences, strip)
         output_sentences = [postprocessor.restore(s, text) for s in output_sentences]
 
     if return_morphemes and isinstance(text, str):
@@ -9,12 +9,19 @@ from typing import Union, List, Tuple
 
 from kss._elements.subclasses import Token
 from kss._modules.morphemes.analyzers import Analyzer
-from kss._modules.morphemes.split_morphemes import split_morphemes
 from kss._modules.morphemes.utils import _reset_spaces
 from kss._modules.sentences.split_sentences import _split_sentences
-from kss._modules.spacing.utils import postprocess, postprocess_heuristic
+from kss._modules.spacing.rule_pack import RulePack, _load_rule_pack
+from kss._modules.spacing.utils import postprocess_heuristic
 from kss._utils.multiprocessing import _run_job
-from kss._utils.sanity_checks import _check_text, _check_analyzer_backend_mecab_pecab_only, _check_num_workers
+from kss._utils.sanity_checks import (
+    _check_text,
+    _check_analyzer_backend_mecab_pecab_only,
+    _check_num_workers,
+    _check_executor,
+    _check_type,
+    _check_rules,
+)
 
 any_ws = re.compile(r"\s+")
 space_insertable = r"(([^SUWX]|X[RS]|S[EH]).* ([NMI]|V[VAX]|VCN|XR|XPN|S[WLHN]))|(SN ([MI]|N[PR]|NN[GP]|V[VAX]|VCN|XR|XPN|S[WHN]))|((S[FPL]).* ([NMI]|V[VAX]|VCN|XR|XPN|S[WHN]))"
@@ -39,6 +46,9 @@ def correct_spacing(
     num_workers: Union[int, str] = "auto",
     reset_whitespaces: bool = False,
     return_morphemes: bool = False,
+    executor: str = "process",
+    split_sentences: bool = True,
+    rules: Union[str, List[str], RulePack] = "default",
 ) -> Union[str, List[str]]:
     """
     This corrects the spacing of the text.
@@ -49,6 +59,11 @@ def correct_spacing(
         num_workers (Union[int, str])): the number of multiprocessing workers
         reset_whitespaces (bool): reset whitespaces or not
         return_morphemes (bool): whether to return morphemes or not
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
+        split_sentences (bool): split the text into sentences to correct the spaces between them or not.
+            set False if the texts are already split into sentences, then they are analyzed only once.
+        rules (Union[str, List[str], RulePack]): spacing rules which are applied after the morpheme analysis.
+            'default' for all rules, path of a rule pack saved by `RulePack.save`, list of rule names or `RulePack`
 
     Returns:
         Union[str, List[str]]: corrected text or list of corrected texts
@@ -69,27 +84,32 @@ def correct_spacing(
     if finish:
         return text
 
-    backend_string = backend
     backend = _check_analyzer_backend_mecab_pecab_only(backend)
+    split_sentences = _check_type(split_sentences, "split_sentences", bool)
+    rules = _check_rules(rules)
     _num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
 
     return _run_job(
         func=partial(_correct_spacing,
                      backend=backend,
-                     backend_string=backend_string,
                      reset_whitespaces=reset_whitespaces,
-                     return_morphemes=return_morphemes),
+                     return_morphemes=return_morphemes,
+                     split_sentences=split_sentences,
+                     rules=rules),
         inputs=text,
         num_workers=_num_workers,
+        executor=executor,
     )
 
 
 def _correct_spacing(
     text: str,
     backend: Analyzer,
-    backend_string: str,
     reset_whitespaces: bool = False,
     return_morphemes: bool = False,
+    split_sentences: bool = True,
+    rules: Union[str, Tuple[str, ...], RulePack] = "default",
 ) -> Union[str, Tuple[str, List[Tuple[str, str]]]]:
     if reset_whitespaces:
         text = text.replace(" ", "")
@@ -103,11 +123,7 @@ def _correct_spacing(
     last_position = 0
     prev_token = None
 
-    morphs = split_morphemes(
-        text,
-        backend=backend_string,
-        drop_space=False
-    )
+    morphs = backend.pos(text, drop_space=False)
 
     for i, (word, pos) in enumerate(morphs):
         token = Token(
@@ -149,19 +165,26 @@ def _correct_spacing(
     if last_position < len(text):
         chunks.append(text[last_position:])
 
+    # the morphemes are same after the spaces are corrected, so the text is not analyzed again.
     output_text = "".join(chunks)
-    sents, morphs = _split_sentences(
-        output_text,
-        backend=backend,
-        recursion=99,
-        strip=True,
-        return_morphemes=True
-    )
-
-    output_text = " ".join(sents)
     morphs_with_spaces = _reset_spaces(output_text, morphs)
 
-    output_text = postprocess(output_text, morphs_with_spaces)
+    if split_sentences:
+        sents = _split_sentences(
+            output_text,
+            backend=backend,
+            recursion=99,
+            strip=True,
+            morphemes=tuple(morphs_with_spaces),
+        )
+        output_text = " ".join(sents)
+    else:
+        output_text = output_text.strip()
+
+    morphs_with_spaces = _reset_spaces(output_text, morphs_with_spaces)
+
+    rule_pack = rules if isinstance(rules, RulePack) else _load_rule_pack(rules)
+    output_text = rule_pack.postprocess(output_text, morphs_with_spaces)
     output_text = postprocess_heuristic(output_text)
 
     for k, v in restore_dict.items():
@@ -0,0 +1,125 @@
+# Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
+# All rights reserved.
+
+import threading
+from typing import Dict, List, Optional
+
+_fields = ["evaluations", "matches", "skips", "time"]
+
+
+class _SpacingProfile(object):
+    """
+    Counters of the spacing rules in a process. They are recorded only while it is enabled.
+
+    Notes:
+        - evaluations: the number of times the rule was evaluated for a text.
+          the rules which can't match the text are not evaluated. refer to `candidate_cases`.
+        - matches: the number of evaluations which found a wrong spacing.
+        - skips: the number of matches which were not corrected because of the exceptions of the rule.
+        - time: cumulative time of the evaluations in seconds.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stats: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def evaluated(self, name: str, matched: bool, elapsed: float):
+        with self._lock:
+            stats = self.stats.setdefault(name, [0, 0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += matched
+            stats[3] += elapsed
+
+    def skipped(self, name: str):
+        with self._lock:
+            self.stats.setdefault(name, [0, 0, 0, 0.0])[2] += 1
+
+    def clear(self):
+        with self._lock:
+            self.stats.clear()
+
+
+_spacing_profile = _SpacingProfile()
+
+
+def enable_spacing_profile() -> None:
+    """
+    Start recording the evaluations of the spacing rules.
+
+    Examples:
+        >>> import kss
+        >>> kss.enable_spacing_profile()
+        >>> kss.correct_spacing(YOUR_LIST_OF_TEXTS, executor="thread")
+        >>> kss.spacing_profile(top=3)
+
+    Notes:
+        The profile is recorded in each process, so use `executor="thread"` or `"serial"` to profile many texts.
+        It makes the spacing correction a little slower.
+    """
+    _spacing_profile.enabled = True
+
+
+def disable_spacing_profile() -> None:
+    """
+    Stop recording the evaluations of the spacing rules. The recorded numbers are kept.
+    """
+    _spacing_profile.enabled = False
+
+
+def clear_spacing_profile() -> None:
+    """
+    Remove all recorded numbers of the spacing rules.
+    """
+    _spacing_profile.clear()
+
+
+def spacing_profile(sort_by: str = "time", top: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Get the recorded numbers of the spacing rules.
+
+    Args:
+        sort_by (str): the field to sort rules in descending order, one of ['evaluations', 'matches', 'skips', 'time']
+        top (Optional[int]): the number of rules to return. `None` means all rules.
+
+    Returns:
+        Dict[str, Dict[str, float]]: 'evaluations', 'matches', 'skips' and 'time' of each rule name
+
+    Examples:
+        >>> import kss
+        >>> kss.enable_spacing_profile()
+        >>> kss.correct_spacing("아버지가방에들어가시다", num_workers=1)
+        >>> kss.spacing_profile(top=1)
+        {'0105111a1_격 조사의 띄어쓰기': {'evaluations': 3, 'matches': 0, 'skips': 0, 'time': 6.1e-05}}
+
+    Notes:
+        All rules are returned even if they were never evaluated,
+        so the rules which never match are found with `sort_by="matches"` at the end of the outputs.
+    """
+    from kss._modules.spacing.utils import rule_names
+    from kss._utils.sanity_checks import _check_type
+
+    sort_by = _check_type(sort_by, "sort_by", str)
+    if sort_by not in _fields:
+        raise ValueError(
+            f"Oops! '{sort_by}' is not supported value for `sort_by`.\n"
+            f"Currently kss only supports {_fields} for this.\n"
+            "Please check `sort_by` parameter again ;)"
+        )
+
+    if top is not None:
+        top = _check_type(top, "top", int)
+        if top < 0:
+            raise ValueError(
+                f"Oops! `top` must be same or greater than 0, but you input {top}.\n"
+                "Please check `top` parameter again ;)"
+            )
+
+    with _spacing_profile._lock:
+        stats = {name: [0, 0, 0, 0.0] for name in rule_names()}
+        stats.update({name: list(values) for name, values in _spacing_profile.stats.items()})
+
+    outputs = sorted(stats.items(), key=lambda x: x[1][_fields.index(sort_by)], reverse=True)
+    if top is not None:
+        outputs = outputs[:top]
+    return {name: dict(zip(_fields, values)) for name, values in outputs}
@@ -0,0 +1,231 @@
+# Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
+# All rights reserved.
+
+import pickle
+import re
+import time
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple, Union
+
+from kss._elements.trie import AhoCorasick
+from kss._modules.spacing.profile import _spacing_profile
+from kss._modules.spacing.utils import (
+    RULES,
+    make_table,
+    is_regex,
+    case_literals,
+    most_selective,
+    process_case,
+)
+
+
+class RulePack(object):
+    """
+    Spacing rules which are prepared for `correct_spacing`.
+
+    Args:
+        rules (Union[str, List[str]]): 'default' for all rules or list of rule names
+
+    Examples:
+        >>> from kss import Kss, RulePack
+        >>> correct_spacing = Kss("correct_spacing")
+        >>> pack = RulePack(["kss-add-1", "kss-add-2", "0105111a1_격 조사의 띄어쓰기"])
+        >>> pack.save("rules.pkl")
+        >>> correct_spacing(YOUR_LIST_OF_TEXTS, rules="rules.pkl")
+
+    Notes:
+        The cases of the rules are indexed by the literals which a text must contain for them to match,
+        and only the cases which can match a text are evaluated for it.
+        The index is saved with the pack, so loading a pack is much faster than making it.
+        The patterns are compiled when they are evaluated first, because compiled patterns can't be pickled.
+    """
+
+    def __init__(self, rules: Union[str, List[str]] = "default"):
+        if rules == "default":
+            selected = RULES
+        else:
+            names = set(_check_rule_names(rules))
+            selected = [rule for rule in RULES if rule["name"] in names]
+
+        self.names: List[str] = list(dict.fromkeys(rule["name"] for rule in selected))
+        self.table: List[List[Tuple]] = make_table(selected)
+        self.requirements: Dict[Tuple[int, int], List[FrozenSet[str]]] = {}
+        self.anchored_cases: Dict[str, List[Tuple[int, int]]] = {}
+        self.unanchored_cases: List[Tuple[int, int]] = []
+
+        # the cases without "<" which are not regex are never corrected by `postprocess`, so they are not indexed.
+        for rule_idx, rule in enumerate(self.table):
+            for cs_idx, case in enumerate(rule):
+                if not is_regex(case[3]) and "<" not in case[3]:
+                    continue
+
+                requirements = case_literals(case[3])
+                if len(requirements) == 0:
+                    self.unanchored_cases.append((rule_idx, cs_idx))
+                else:
+                    self.requirements[rule_idx, cs_idx] = requirements
+                    for literal in most_selective(requirements):
+                        self.anchored_cases.setdefault(literal, []).append((rule_idx, cs_idx))
+
+        self.anchors = AhoCorasick(
+            literal for requirements in self.requirements.values() for literals in requirements for literal in literals
+        )
+        self._patterns: Dict[str, re.Pattern] = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return f"RulePack({len(self)} rules)"
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_patterns"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def save(self, path: str):
+        """
+        Save the rule pack to a file.
+
+        Args:
+            path (str): path of the file
+        """
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(path: str) -> "RulePack":
+        """
+        Load a rule pack from a file.
+
+        Args:
+            path (str): path of the file which was saved by `RulePack.save`
+
+        Returns:
+            RulePack: loaded rule pack
+        """
+        with open(path, "rb") as f:
+            pack = pickle.load(f)
+
+        if not isinstance(pack, RulePack):
+            raise TypeError(
+                f"Oops! '{path}' is not a file of rule pack.\n"
+                "Please check `rules` parameter again ;)"
+            )
+        return pack
+
+    def candidate_cases(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Get the cases which can be corrected in the text.
+
+        Args:
+            text (str): input text
+
+        Returns:
+            List[Tuple[int, int]]: rule and case indices in order of `table`
+        """
+        found = self.anchors.findall(text)
+        candidates = set(self.unanchored_cases)
+        for literal in found:
+            for case in self.anchored_cases.get(literal, ()):
+                if case not in candidates and all(not x.isdisjoint(found) for x in self.requirements[case]):
+                    candidates.add(case)
+        return sorted(candidates)
+
+    def postprocess(self, text: str, morphs: List[Tuple[str, str]], use_index: bool = True) -> str:
+        """
+        Correct the spacing of the text by the rules.
+
+        Args:
+            text (str): input text
+            morphs (List[Tuple[str, str]]): morphemes of the text with spaces
+            use_index (bool): evaluate only the cases which can match the text or all cases
+
+        Returns:
+            str: corrected text
+        """
+        if use_index:
+            cases = self.candidate_cases(text)
+        else:
+            cases = [(rule_idx, cs_idx) for rule_idx, rule in enumerate(self.table) for cs_idx in range(len(rule))]
+
+        profile = _spacing_profile if _spacing_profile.enabled else None
+        results = set()
+        for rule_idx, cs_idx in cases:
+            case = self.table[rule_idx][cs_idx]
+            if profile is None:
+                results.update(process_case(case, self._pattern(case[3]), text, morphs))
+            else:
+                start = time.perf_counter()
+                matches = process_case(case, self._pattern(case[3]), text, morphs)
+                profile.evaluated(case[1], len(matches) != 0, time.perf_counter() - start)
+                results.update(matches)
+
+        for _cs_idx, name, desc, bad, good, exceptions in results:
+            loc = text.find(bad)
+            skip = False
+            for ex in exceptions:
+                beg, end = 0, -1
+                sz = 10
+                if loc > sz:
+                    beg = loc - sz
+                if len(text) - loc > 10:
+                    end = loc + sz
+                window = text[beg:end]
+
+                if ex in window:
+                    skip = True
+
+            if not skip:
+                good = good.replace("()", "")
+                text = text.replace(bad, good)
+            elif profile is not None:
+                profile.skipped(name)
+
+        return text
+
+    def _pattern(self, bad: str) -> re.Pattern:
+        pattern = self._patterns.get(bad)
+        if pattern is None:
+            pattern = self._patterns[bad] = re.compile(bad)
+        return pattern
+
+
+def _check_rule_names(rules: Union[List[str], Tuple[str, ...]]) -> Tuple[str, ...]:
+    """
+    Check names of spacing rules.
+
+    Args:
+        rules (Union[List[str], Tuple[str, ...]]): names of rules
+
+    Returns:
+        Tuple[str, ...]: names of rules
+    """
+    names = {rule["name"] for rule in RULES}
+    for name in rules:
+        if name not in names:
+            raise ValueError(
+                f"Oops! '{name}' is not a spacing rule.\n"
+                "You can find the names of rules in `kss._modules.spacing.utils.RULES`.\n"
+                "Please check `rules` parameter again ;)"
+            )
+    return tuple(rules)
+
+
+@lru_cache(maxsize=16)
+def _load_rule_pack(rules: Union[str, Tuple[str, ...]]) -> RulePack:
+    """
+    Get the rule pack of `rules` parameter. It's made or loaded once in each process.
+
+    Args:
+        rules (Union[str, Tuple[str, ...]]): 'default', path of a saved rule pack or names of rules
+
+    Returns:
+        RulePack: rule pack
+    """
+    if rules == "default" or isinstance(rules, tuple):
+        return RulePack(rules if rules == "default" else list(rules))
+    return RulePack.load(rules)
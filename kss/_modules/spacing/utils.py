@@ -5,8 +5,17 @@
 # And modified by Hyunwoong Ko [https://github.com/hyunwoongko]
 
 import re
+import time
 from functools import reduce
 
+from kss._modules.spacing.profile import _spacing_profile
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:
+    import sre_constants
+    import sre_parse
+
 CONSONANTS = "ㄱㄲㄳㄴㄵㄶㄷㄸㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅃㅄㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
 FIRST_CONSONANTS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
 VOWELS = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
@@ -7307,40 +7316,116 @@ RULES = [
     }
 ]
 
-TABLE = []
 find_morphs = re.compile(r'<\w+>')
 find_good = re.compile(r"(?<=[(])[1-9]*(?=[)])")
-for rule in RULES:
-    cases = []
-    _name = rule['name']
-    _desc = rule['desc']
-    _exceptions = rule['exception']
-    for rc in rule['cases']:
-        if len(rc[0]) > 4 and rc[0][:4] in ['~은/는', '~이/가', '~을/를', '~와/과']:
-            try:
-                cases.append((_name, _desc, '~' + rc[0][1] + rc[0][4:], '~' + rc[1][1] + rc[1][4:], _exceptions))
-            except:
-                cases.append((_name, _desc, '~' + rc[0][1] + rc[0][4:], rc[1], _exceptions))
-            try:
-                cases.append((_name, _desc, '~' + rc[0][3] + rc[0][4:], '~' + rc[1][3] + rc[1][4:], _exceptions))
-            except:
-                cases.append((_name, _desc, '~' + rc[0][3] + rc[0][4:], rc[1], _exceptions))
-        else:
-            cases.append((_name, _desc, rc[0], rc[1], _exceptions))
-    TABLE.append(cases)
 
-for rule_idx, rule in enumerate(TABLE):
-    for cs_idx, (_name, _desc, _bad, _good, _exceptions) in enumerate(rule):
-        TABLE[rule_idx][cs_idx] = (
-            cs_idx,
-            _name,
-            _desc,
-            re.compile(_bad),
-            _bad,
-            find_good.findall(_good),
-            _good,
-            tuple(_exceptions),
-        )
+
+def make_table(rules):
+    """
+    Make the cases of the rules.
+
+    Args:
+        rules (List[Dict]): rules in `RULES`
+
+    Returns:
+        List[List[Tuple]]: cases of each rule. the patterns are not compiled.
+    """
+    table = []
+    for rule in rules:
+        cases = []
+        _name = rule['name']
+        _desc = rule['desc']
+        _exceptions = rule['exception']
+        for rc in rule['cases']:
+            if len(rc[0]) > 4 and rc[0][:4] in ['~은/는', '~이/가', '~을/를', '~와/과']:
+                try:
+                    cases.append((_name, _desc, '~' + rc[0][1] + rc[0][4:], '~' + rc[1][1] + rc[1][4:], _exceptions))
+                except:
+                    cases.append((_name, _desc, '~' + rc[0][1] + rc[0][4:], rc[1], _exceptions))
+                try:
+                    cases.append((_name, _desc, '~' + rc[0][3] + rc[0][4:], '~' + rc[1][3] + rc[1][4:], _exceptions))
+                except:
+                    cases.append((_name, _desc, '~' + rc[0][3] + rc[0][4:], rc[1], _exceptions))
+            else:
+                cases.append((_name, _desc, rc[0], rc[1], _exceptions))
+        table.append(cases)
+
+    for rule_idx, rule in enumerate(table):
+        for cs_idx, (_name, _desc, _bad, _good, _exceptions) in enumerate(rule):
+            table[rule_idx][cs_idx] = (
+                cs_idx,
+                _name,
+                _desc,
+                _bad,
+                find_good.findall(_good),
+                _good,
+                tuple(_exceptions),
+            )
+    return table
+
+
+def is_regex(bad):
+    return any(map(lambda x: x in r'[]\+?|', bad))
+
+
+def most_selective(literals):
+    # the longer literals are the less frequent ones.
+    return max(literals, key=lambda x: (min(map(len, x)), -len(x)))
+
+
+def required_literals(parsed):
+    """
+    Get literals which a text must contain for the parsed pattern to match it.
+
+    Args:
+        parsed: subpattern parsed by `sre_parse`
+
+    Returns:
+        List[FrozenSet[str]]: the text contains one of the literals of every set.
+    """
+    requirements = []
+    literal = ""
+    for op, av in list(parsed) + [(None, None)]:
+        if op is sre_constants.LITERAL:
+            literal += chr(av)
+            continue
+
+        if len(literal) != 0:
+            requirements.append(frozenset([literal]))
+            literal = ""
+
+        if op is sre_constants.SUBPATTERN:
+            requirements += required_literals(av[-1])
+        elif op is sre_constants.BRANCH:
+            branches = [required_literals(branch) for branch in av[1]]
+            if all(len(branch) != 0 for branch in branches):
+                requirements.append(frozenset().union(*map(most_selective, branches)))
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0] >= 1:
+            requirements += required_literals(av[2])
+        elif op is sre_constants.IN and all(_op is sre_constants.LITERAL for _op, _ in av):
+            requirements.append(frozenset(chr(_av) for _, _av in av))
+
+    return requirements
+
+
+def case_literals(bad):
+    """
+    Get literals which a text must contain for the case to be corrected.
+
+    Args:
+        bad (str): bad pattern of the case
+
+    Returns:
+        List[FrozenSet[str]]: the text contains one of the literals of every set.
+    """
+    if is_regex(bad):
+        parsed = sre_parse.parse(bad)
+        if parsed.state.flags & re.IGNORECASE:
+            return []
+        return required_literals(parsed)
+
+    # the morphemes are replaced in the pattern, and the rest of it must be in the text.
+    return [frozenset([x]) for x in find_morphs.split(bad) if len(x) != 0 and "<" not in x and ">" not in x]
 
 
 def pos_processing(cs_idx, name, desc, bad, good, exceptions, text, morphs, target_pos, startswith):
@@ -7367,74 +7452,67 @@ def morpheme_processing(cs_idx, name, desc, bad, good, exceptions, text, morphs)
     return results
 
 
-def postprocess(text, morphs):
+def process_case(case, bad_compile, text, morphs):
+    cs_idx, name, desc, bad, good_findall, good, exceptions = case
     results = set()
-    for rule in TABLE:
-        for cs_idx, name, desc, bad_compile, bad, good_findall, good, exceptions in rule:
-            if any(map(lambda x: x in r'[]\+?|', bad)):
-                m = bad_compile.search(text)
-                if m:
-                    bad = m.group()
-                    remain = good
-                    buffer = ""
-                    k = 1
-                    for s in good_findall:
-                        n = int(s) if len(s) > 0 else k
-                        k += 1
-                        if f'({n})' in remain:
-                            buffer += remain[:remain.index(f'({n})')] + m.group(n)
-                            remain = remain[remain.index(f'({n})') + len(f'({n})'):]
-                        elif '()' in remain:
-                            try:
-                                buffer += remain[:remain.index('()')] + m.group(n)
-                                remain = remain[remain.index('()') + len('()'):]
-                            except:
-                                pass
-                        else:
-                            pass
-                    good = buffer + remain
-                    results.add((cs_idx, name, desc, bad, good, exceptions))
+    if is_regex(bad):
+        m = bad_compile.search(text)
+        if m:
+            bad = m.group()
+            remain = good
+            buffer = ""
+            k = 1
+            for s in good_findall:
+                n = int(s) if len(s) > 0 else k
+                k += 1
+                if f'({n})' in remain:
+                    buffer += remain[:remain.index(f'({n})')] + m.group(n)
+                    remain = remain[remain.index(f'({n})') + len(f'({n})'):]
+                elif '()' in remain:
+                    try:
+                        buffer += remain[:remain.index('()')] + m.group(n)
+                        remain = remain[remain.index('()') + len('()'):]
+                    except:
+                        pass
                 else:
-                    continue
+                    pass
+            good = buffer + remain
+            results.add((cs_idx, name, desc, bad, good, exceptions))
 
+    else:
+        if "<" in bad:
+            if "<Noun>" in bad:
+                results.update(pos_processing(cs_idx, name, desc, bad, good, exceptions, text, morphs, "<Noun>", "N"))
+            elif "<Adverb>" in bad:
+                results.update(pos_processing(cs_idx, name, desc, bad, good, exceptions, text, morphs, "<Adverb>", "M"))
             else:
-                if "<" in bad:
-                    if "<Noun>" in bad:
-                        results.update(pos_processing(cs_idx, name, desc, bad, good, exceptions, text, morphs, "<Noun>", "N"))
-                    elif "<Adverb>" in bad:
-                        results.update(pos_processing(cs_idx, name, desc, bad, good, exceptions, text, morphs, "<Adverb>", "M"))
-                    else:
-                        results.update(morpheme_processing(cs_idx, name, desc, bad, good, exceptions, text, morphs))
+                results.update(morpheme_processing(cs_idx, name, desc, bad, good, exceptions, text, morphs))
 
-    for _cs_idx, name, desc, bad, good, exceptions in results:
-        loc = text.find(bad)
-        skip = False
-        for ex in exceptions:
-            beg, end = 0, -1
-            sz = 10
-            if loc > sz:
-                beg = loc - sz
-            if len(text) - loc > 10:
-                end = loc + sz
-            window = text[beg:end]
-
-            if ex in window:
-                skip = True
+    return results
 
-        if not skip:
-            good = good.replace("()", "")
-            text = text.replace(bad, good)
 
-    return text
+HEURISTICS = [
+    ("heuristic_comma", re.compile(","), ", "),
+    ("heuristic_colon", re.compile(":"), ": "),
+    ("heuristic_spaces", re.compile(r"  +"), " "),
+    ("heuristic_spaces_after_newline", re.compile(r"[\n\t\v\f\r]  {1,}"), " "),
+    ("heuristic_spaces_before_newline", re.compile(r" {1,}[\n\t\v\f\r]"), " "),
+    ("heuristic_comma_with_numbers", comma_with_numbers, r"\1,\2"),
+    ("heuristic_spaces", re.compile(r"  +"), " "),
+]
 
 
 def postprocess_heuristic(text):
-    text = text.replace(",", ", ")
-    text = text.replace(":", ": ")
-    text = re.sub(r"  +", " ", text)
-    text = re.sub(r"[\n\t\v\f\r]  {1,}", " ", text)
-    text = re.sub(r" {1,}[\n\t\v\f\r]", " ", text)
-
-    text = comma_with_numbers.sub(r"\1,\2", text)
-    text = re.sub(r"  +", " ", text)
+    profile = _spacing_profile if _spacing_profile.enabled else None
+    for name, pattern, repl in HEURISTICS:
+        if profile is None:
+            text = pattern.sub(repl, text)
+        else:
+            start = time.perf_counter()
+            text, count = pattern.subn(repl, text)
+            profile.evaluated(name, count != 0, time.perf_counter() - start)
     return text
+
+
+def rule_names():
+    return list(dict.fromkeys([rule["name"] for rule in RULES] + [name for name, _, _ in HEURISTICS]))
@@ -19,6 +19,7 @@ from kss._utils.sanity_checks import (
     _check_analyzer_backend,
     _check_type,
     _check_value,
+    _check_executor,
 )
 
 
@@ -30,6 +31,7 @@ def summarize_sentences(
     tolerance: Union[float] = 0.05,
     strip: bool = True,
     ignores: List[str] = None,
+    executor: str = "process",
 ) -> Union[List[str], List[List[str]]]:
     """
     This summarizes the given text, using TextRank algorithm.
@@ -42,6 +44,7 @@ def summarize_sentences(
         tolerance (float): a threshold for omitting edge weights.
         strip (bool): strip all sentences or not
         ignores (List[str]): list of strings to ignore
+        executor (str): the way to run the job, one of ['process', 'thread', 'serial']
 
     Returns:
         Union[List[str], List[List[str]]]: outputs of text summarization
@@ -63,6 +66,7 @@ def summarize_sentences(
 
     _check_analyzer_backend(backend)
     num_workers = _check_num_workers(text, num_workers)
+    executor = _check_executor(executor)
     max_sentences = _check_type(max_sentences, "max_sentences", int)
     max_sentences = _check_value(
         max_sentences, "max_sentences", lambda x: x > 0, "integer value in 1~N"
@@ -80,6 +84,7 @@ def summarize_sentences(
         ),
         inputs=text,
         num_workers=num_workers,
+        executor=executor,
     )
 
 
@@ -2,14 +2,345 @@
 # All rights reserved.
 
 
+import atexit
+import math
 import multiprocessing as mp
-from typing import Union, Any, List, Optional, Callable
+import os
+import pickle
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
+from multiprocessing import resource_tracker
+from multiprocessing.pool import Pool
+from multiprocessing.shared_memory import SharedMemory
+from queue import Queue
+from typing import Union, Any, List, Optional, Callable, Iterable, Iterator, Dict, Tuple
+
+# The worker pool is shared by all modules and lives until the interpreter exits.
+# Creating a pool costs forking workers and re-initializing analyzers in each of them,
+# which is often more expensive than the job itself for small batches.
+_pool: Optional[Pool] = None
+_pool_pid: Optional[int] = None
+_pool_pinned: bool = False
+_pool_startup_seconds: float = 0.1
+
+# Inputs larger than this are sent to workers through shared memory instead of pickling them into pipes.
+_SHARED_MEMORY_MIN_CHARS = 1 << 20
+# On Windows a segment is destroyed when its last handle is closed, so the outputs of a worker can't outlive it.
+_SHARED_MEMORY_SUPPORTED = os.name == "posix"
+
+# the maximum number of texts which are processed at once by `_run_batch_job`.
+_MAX_BATCH_SIZE = 64
+
+# The thread pool is used instead of the worker pool for `executor='thread'`.
+# It fits analyzers which release the GIL, because nothing has to be pickled or copied to workers.
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_thread_pool_pid: Optional[int] = None
+
+# Modules which are run once by every new worker before it receives tasks. See `warmup()`.
+_warmup_modules: Tuple[str, ...] = ()
+_warmup_text = "안녕하세요. 오늘은 날씨가 좋네요! Hello, 漢字 1234."
+_warmup_inputs = {
+    "select_josa": ("철수", "은"),
+    "combine_josa": ("철수", "은"),
+    "is_hanja": ("漢",),
+    "hcj2j": ("ㄱ",),
+    "is_jamo": ("ㄱ",),
+    "is_jamo_modern": ("ㄱ",),
+    "is_hcj": ("ㄱ",),
+    "is_hcj_modern": ("ㄱ",),
+    "is_hangul_char": ("가",),
+    "is_completed_form": ("가",),
+    "get_all_completed_form_hangul_chars": (),
+    "get_all_incompleted_form_hangul_chars": (),
+    "hangulize": ("gloria",),
+    "qwerty": ("dkssudgktpdy",),
+}
+_warmup_kwargs = {
+    "hangulize": {"lang": "ita"},
+    "qwerty": {"src": "en", "tgt": "ko"},
+}
+# modules which have `num_workers` in their signatures but don't accept any value other than the default.
+_warmup_without_num_workers = {"extract_keywords"}
+
+# Measured cost (seconds per character) of each module, used by `num_workers='auto'`.
+# The calibration is done once per process with the first inputs of the first call.
+_costs: Dict[tuple, float] = {}
+_CALIBRATION_SECONDS = 0.02
+_CALIBRATION_MAX_INPUTS = 16
+_MIN_SECONDS_PER_WORKER = 0.01
+_SECONDS_PER_TASK = 0.0005
+_SECONDS_PER_CHUNK = 0.005
+
+
+def _check_pool_num_workers(num_workers: Union[int, str]) -> Optional[int]:
+    """
+    Check the number of workers of the shared pool.
+
+    Args:
+        num_workers (Union[int, str]): the number of workers or 'auto'
+
+    Returns:
+        Optional[int]: the number of workers. `None` means all cores.
+    """
+    if isinstance(num_workers, str) and num_workers.lower() == "auto":
+        return None
+
+    if isinstance(num_workers, bool) or not isinstance(num_workers, int):
+        raise TypeError(
+            f"Oops! '{num_workers}' is not supported value for `num_workers`.\n"
+            f"Currently kss only supports [int, 'auto'] for this.\n"
+            f"Please check `num_workers` parameter again ;)"
+        )
+
+    if num_workers < 1:
+        raise ValueError(
+            f"Oops! `num_workers` must be same or greater than 1, but you input {num_workers}.\n"
+            "Please check `num_workers` parameter again ;)"
+        )
+
+    return num_workers
+
+
+def _pool_size(num_workers: Optional[int]) -> int:
+    return num_workers if num_workers is not None else (os.cpu_count() or 1)
+
+
+def _get_pool(num_workers: Optional[int] = None) -> Pool:
+    """
+    Get the shared worker pool, creating it lazily.
+
+    Args:
+        num_workers (Optional[int]): the number of workers. `None` means all cores.
+
+    Returns:
+        Pool: shared worker pool
+
+    Notes:
+        If the pool was set by `set_pool()`, it is used regardless of `num_workers`.
+        Otherwise the pool is re-created only when a different number of workers is requested.
+    """
+    global _pool, _pool_pid
+
+    if _pool is not None and _pool_pid != os.getpid():
+        # the pool was inherited from the parent process by fork, it is not usable here.
+        _discard_pool()
+
+    if _pool is not None:
+        if _pool_pinned or _pool._processes == _pool_size(num_workers):
+            return _pool
+        close_pool()
+
+    _create_pool(num_workers)
+    return _pool
+
+
+def _create_pool(num_workers: Optional[int], queue: Optional[mp.Queue] = None):
+    global _pool, _pool_pid, _pool_startup_seconds
+    start = time.perf_counter()
+    # workers must share the resource tracker of this process, see `_run_shared_chunk`.
+    resource_tracker.ensure_running()
+    _pool = mp.Pool(
+        _pool_size(num_workers),
+        initializer=_warmup_worker if len(_warmup_modules) != 0 else None,
+        initargs=(_warmup_modules, queue),
+    )
+    _pool_pid = os.getpid()
+    _pool_startup_seconds = time.perf_counter() - start
+
+
+def _discard_pool():
+    global _pool, _pool_pid, _pool_pinned
+    _pool, _pool_pid, _pool_pinned = None, None, False
+
+
+def set_pool(num_workers: Union[int, str] = "auto") -> None:
+    """
+    Create the worker pool shared by all kss modules.
+
+    Args:
+        num_workers (Union[int, str]): the number of workers or 'auto' for using all cores
+
+    Examples:
+        >>> import kss
+        >>> kss.set_pool(4)
+        >>> kss.split_sentences(["텍스트 1", "텍스트 2"])  # uses the 4 workers
+        >>> kss.correct_spacing(["텍스트 1", "텍스트 2"])  # reuses the same 4 workers
+        >>> kss.close_pool()
+
+    Notes:
+        While the pool is set, every multiprocessing job uses it regardless of `num_workers` of each module.
+        Pass `num_workers=1` to a module to run it without multiprocessing.
+    """
+    global _pool_pinned
+    num_workers = _check_pool_num_workers(num_workers)
+
+    close_pool()
+    _create_pool(num_workers)
+    _pool_pinned = True
+
+
+def close_pool() -> None:
+    """
+    Shut down the worker pool and the thread pool shared by all kss modules.
+    They will be created again lazily when a module needs them.
+    """
+    global _thread_pool, _thread_pool_pid
+
+    if _pool is not None and _pool_pid == os.getpid():
+        _pool.terminate()
+        _pool.join()
+    _discard_pool()
+
+    if _thread_pool is not None and _thread_pool_pid == os.getpid():
+        _thread_pool.shutdown(wait=False)
+    _thread_pool, _thread_pool_pid = None, None
+
+
+def _get_thread_pool(num_workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool, creating it lazily.
+
+    Args:
+        num_workers (Optional[int]): the number of threads. `None` means the number of cores.
+
+    Returns:
+        ThreadPoolExecutor: shared thread pool
+    """
+    global _thread_pool, _thread_pool_pid
+
+    if _thread_pool is not None and _thread_pool_pid != os.getpid():
+        _thread_pool, _thread_pool_pid = None, None
+
+    if _thread_pool is not None:
+        if _thread_pool._max_workers == _pool_size(num_workers):
+            return _thread_pool
+        _thread_pool.shutdown(wait=False)
+
+    _thread_pool = ThreadPoolExecutor(_pool_size(num_workers), thread_name_prefix="kss")
+    _thread_pool_pid = os.getpid()
+    return _thread_pool
+
+
+@contextmanager
+def pool(num_workers: Union[int, str] = "auto"):
+    """
+    Context manager which sets the shared worker pool and shuts it down on exit.
+
+    Args:
+        num_workers (Union[int, str]): the number of workers or 'auto' for using all cores
+
+    Examples:
+        >>> import kss
+        >>> with kss.pool(4):
+        ...     sentences = kss.split_sentences(texts)
+        ...     unsafe = kss.is_unsafe(texts)
+    """
+    set_pool(num_workers)
+    try:
+        yield _pool
+    finally:
+        close_pool()
+
+
+def _warmup_worker(modules: Tuple[str, ...], queue: Optional[mp.Queue]):
+    """
+    Initializer of workers which runs each module once to load its resources.
+
+    Args:
+        modules (Tuple[str, ...]): module names
+        queue (Optional[mp.Queue]): queue to report `(pid, {module: seconds})` or `(pid, error message)`
+    """
+    from inspect import signature
+    from kss import Kss
+
+    timings = {}
+    try:
+        for name in modules:
+            module = Kss(name).module
+            kwargs = dict(_warmup_kwargs.get(module.__name__, {}))
+            if "num_workers" in signature(module).parameters and module.__name__ not in _warmup_without_num_workers:
+                kwargs["num_workers"] = 1
+
+            start = time.perf_counter()
+            module(*_warmup_inputs.get(module.__name__, (_warmup_text,)), **kwargs)
+            timings[name] = time.perf_counter() - start
+    except Exception as e:
+        # raising an error here makes the pool restart the worker forever.
+        timings = f"{type(e).__name__}: {e}"
+
+    if queue is not None:
+        queue.put((os.getpid(), timings))
+
+
+def warmup(
+    modules: Union[str, List[str]],
+    num_workers: Union[int, str] = "auto",
+) -> Dict[int, Dict[str, float]]:
+    """
+    Start the shared worker pool and load the resources of the given modules in every worker.
+
+    Args:
+        modules (Union[str, List[str]]): module names or aliases
+        num_workers (Union[int, str]): the number of workers or 'auto' for using all cores
+
+    Returns:
+        Dict[int, Dict[str, float]]: warm-up seconds of each module in each worker, keyed by pid
+
+    Examples:
+        >>> import kss
+        >>> kss.warmup(["split_sentences", "g2p"], num_workers=2)
+        {4312: {'split_sentences': 0.41, 'g2p': 1.2}, 4313: {'split_sentences': 0.43, 'g2p': 1.3}}
+
+    Notes:
+        Analyzers, dictionaries and tables of kss are loaded lazily on the first call,
+        so the first task of each worker is much slower than the others.
+        This runs each module once in every worker before any task is dispatched.
+        The pools which are created later by kss, e.g. with a different `num_workers`, are warmed up as well.
+        Call `warmup([])` to stop it.
+    """
+    global _warmup_modules, _pool_pinned
+    from kss import Kss
+
+    if isinstance(modules, str):
+        modules = [modules]
+    for module in modules:
+        Kss(module)  # raise an error for unknown modules here, not in the workers.
+    num_workers = _check_pool_num_workers(num_workers)
+
+    pinned = _pool_pinned and _pool_pid == os.getpid()
+    close_pool()
+    _warmup_modules = tuple(modules)
+    if len(_warmup_modules) == 0:
+        return {}
+
+    queue = mp.Queue()
+    _create_pool(num_workers, queue)
+    _pool_pinned = pinned
+
+    timings = {}
+    while len(timings) < _pool._processes:
+        pid, timing = queue.get()
+        if isinstance(timing, str):
+            close_pool()
+            _warmup_modules = ()
+            raise RuntimeError(f"Oops! Failed to warm up the workers. {timing}")
+        timings[pid] = timing
+    return timings
+
+
+atexit.register(close_pool)
 
 
 def _run_job(
     func: Callable,
     inputs: Any,
     num_workers: Optional[Union[int, bool]] = None,
+    executor: str = "process",
 ) -> Union[Any, List[Any]]:
     """
     Run job with or without multiprocessing.
@@ -18,19 +349,494 @@ def _run_job(
         func (Callable): function to run
         inputs (Any): input data
         num_workers (Optional[Union[int, bool]]): the number of multiprocessing workers.
+            `None` means that it will be chosen by `_run_auto_job`.
+        executor (str): one of 'process', 'thread' and 'serial'
 
     Returns:
         Union[Any, List[Any]]: output of the job.
     """
-    if num_workers is False:
+    if num_workers is False or executor == "serial":
         if isinstance(inputs, str):
             output = func(inputs)
         else:
             output = [func(i) for i in inputs]
         return output
+    elif executor == "thread":
+        return list(_get_thread_pool(num_workers).map(func, inputs))
+    elif num_workers is None and not isinstance(inputs, str):
+        return _run_auto_job(func, inputs)
+    else:
+        return _pool_map(_get_pool(num_workers), func, inputs)
+
+
+def _run_batch_job(
+    batch_func: Callable,
+    inputs: Any,
+    num_workers: Optional[Union[int, bool]] = None,
+    executor: str = "process",
+) -> Union[Any, List[Any]]:
+    """
+    Run job whose function takes a batch of inputs and returns a list of outputs.
+
+    Args:
+        batch_func (Callable): function which takes a list of inputs
+        inputs (Any): input data
+        num_workers (Optional[Union[int, bool]]): the number of multiprocessing workers.
+        executor (str): one of 'process', 'thread' and 'serial'
+
+    Returns:
+        Union[Any, List[Any]]: output of the job.
+
+    Notes:
+        Inputs are split into batches of at most `_MAX_BATCH_SIZE`,
+        but there are enough batches to keep all workers busy.
+    """
+    if isinstance(inputs, str):
+        return batch_func([inputs])[0]
+
+    if num_workers is False or executor == "serial":
+        batch_size = _MAX_BATCH_SIZE
+    else:
+        num_batches = 4 * _pool_size(num_workers if isinstance(num_workers, int) else None)
+        batch_size = min(max(math.ceil(len(inputs) / num_batches), 1), _MAX_BATCH_SIZE)
+
+    batches = [list(inputs[i: i + batch_size]) for i in range(0, len(inputs), batch_size)]
+    outputs = _run_job(batch_func, batches, num_workers, executor)
+    return [output for batch in outputs for output in batch]
+
+
+def _pool_map(pool: Pool, func: Callable, inputs: Any, chunksize: Optional[int] = None) -> List[Any]:
+    """
+    Map inputs with the worker pool, using shared memory for large batches of texts on POSIX.
+
+    Args:
+        pool (Pool): worker pool
+        func (Callable): function to run
+        inputs (Any): input data
+        chunksize (Optional[int]): the number of inputs sent to a worker at once
+
+    Returns:
+        List[Any]: output of the job.
+    """
+    if (
+        _SHARED_MEMORY_SUPPORTED
+        and isinstance(inputs, (list, tuple))
+        and len(inputs) > 1
+        and all(isinstance(i, str) for i in inputs)
+        and sum(len(i) for i in inputs) >= _SHARED_MEMORY_MIN_CHARS
+    ):
+        return _shared_memory_map(pool, func, inputs, chunksize)
+    return pool.map(func, inputs, chunksize)
+
+
+def _pack_texts(texts: List[str]) -> SharedMemory:
+    """
+    Pack texts into a shared memory segment.
+
+    Args:
+        texts (List[str]): list of texts
+
+    Returns:
+        SharedMemory: segment which has the number of texts, `len(texts) + 1` byte offsets and UTF-8 bytes of texts
+    """
+    encoded = [text.encode("utf-8") for text in texts]
+    offsets = array("q", [0])
+    for e in encoded:
+        offsets.append(offsets[-1] + len(e))
+
+    header = array("q", [len(texts)]).tobytes() + offsets.tobytes()
+    segment = SharedMemory(create=True, size=len(header) + offsets[-1])
+    segment.buf[: len(header)] = header
+
+    position = len(header)
+    for e in encoded:
+        segment.buf[position: position + len(e)] = e
+        position += len(e)
+    return segment
+
+
+def _unpack_texts(segment: SharedMemory, start: int, end: int) -> List[str]:
+    """
+    Slice texts out of a segment made by `_pack_texts`.
+
+    Args:
+        segment (SharedMemory): shared memory segment
+        start (int): index of the first text
+        end (int): index after the last text
+
+    Returns:
+        List[str]: texts[start:end]
+    """
+    num_texts = array("q", bytes(segment.buf[:8]))[0]
+    base = 8 * (num_texts + 2)
+    offsets = segment.buf[8:base].cast("q")
+    try:
+        return [str(segment.buf[base + offsets[i]: base + offsets[i + 1]], "utf-8") for i in range(start, end)]
+    finally:
+        # views must be released before the segment is closed.
+        offsets.release()
+
+
+def _run_shared_chunk(bounds: Tuple[int, int], func: Callable, name: str) -> Tuple[str, int]:
+    """
+    Run job on the texts of a shared memory segment in a worker.
+
+    Args:
+        bounds (Tuple[int, int]): start and end index of the texts
+        func (Callable): function to run
+        name (str): name of the segment made by `_pack_texts`
+
+    Returns:
+        Tuple[str, int]: name and size of the segment which has the pickled outputs
+    """
+    # on POSIX, workers share the resource tracker of the parent process,
+    # so the segments created or attached here are unregistered by `unlink()` in the parent.
+    segment = SharedMemory(name=name)
+    try:
+        texts = _unpack_texts(segment, *bounds)
+    finally:
+        segment.close()
+
+    outputs = pickle.dumps([func(text) for text in texts], protocol=pickle.HIGHEST_PROTOCOL)
+    result = SharedMemory(create=True, size=len(outputs))
+    result.buf[: len(outputs)] = outputs
+    result.close()
+    return result.name, len(outputs)
+
+
+def _shared_memory_map(pool: Pool, func: Callable, texts: List[str], chunksize: Optional[int] = None) -> List[Any]:
+    """
+    Map texts with the worker pool through shared memory.
+
+    Args:
+        pool (Pool): worker pool
+        func (Callable): function to run
+        texts (List[str]): list of texts
+        chunksize (Optional[int]): the number of texts processed by a task
+
+    Returns:
+        List[Any]: output of the job.
+
+    Notes:
+        Texts are packed into one segment, and only the segment name and index ranges are sent to workers.
+        Each task sends its outputs back in a new segment which is unlinked after it is read.
+    """
+    if chunksize is None:
+        chunksize = math.ceil(len(texts) / (pool._processes * 4))
+
+    segment = _pack_texts(texts)
+    outputs, error = [], None
+    try:
+        results = pool.imap(
+            partial(_run_shared_chunk, func=func, name=segment.name),
+            [(i, min(i + chunksize, len(texts))) for i in range(0, len(texts), chunksize)],
+            chunksize=1,
+        )
+        # the tasks after a failed one are still waited for, so that all the segments made by them are unlinked.
+        while True:
+            try:
+                name, size = next(results)
+            except StopIteration:
+                break
+            except Exception as e:
+                error = error or e
+                continue
+
+            try:
+                outputs.extend(_read_shared_outputs(name, size))
+            except Exception as e:
+                error = error or e
+    finally:
+        segment.close()
+        segment.unlink()
+
+    if error is not None:
+        raise error
+    return outputs
+
+
+def _read_shared_outputs(name: str, size: int) -> List[Any]:
+    """
+    Read the outputs which were made by `_run_shared_chunk` and unlink the segment.
+
+    Args:
+        name (str): name of the segment
+        size (int): size of the pickled outputs
+
+    Returns:
+        List[Any]: outputs of the texts
+    """
+    result = SharedMemory(name=name)
+    view = result.buf[:size]
+    try:
+        return pickle.loads(view)
+    finally:
+        view.release()
+        result.close()
+        result.unlink()
+
+
+def _cost_key(func: Callable) -> tuple:
+    """
+    Make the key of the measured cost of a job.
+
+    Args:
+        func (Callable): function to run
+
+    Returns:
+        tuple: function name and its simple arguments. analyzers are represented by their backend,
+            and lists like the stages of `Pipeline` are represented by the keys of their items.
+    """
+    keywords = {}
+    while isinstance(func, partial):
+        keywords = {**func.keywords, **keywords}
+        func = func.func
+
+    key = [_function_key(func)]
+    for name, value in sorted(keywords.items()):
+        value_key = _cost_value(value)
+        if value is None or value_key is not None:
+            key.append((name, value_key))
+    return tuple(key)
+
+
+def _function_key(func: Callable) -> tuple:
+    return getattr(func, "__module__", None), getattr(func, "__qualname__", type(func).__qualname__)
+
+
+def _cost_value(value: Any) -> Any:
+    """
+    Make the key of an argument of a job.
+
+    Args:
+        value (Any): value of the argument
+
+    Returns:
+        Any: hashable key of the value or `None` if it doesn't change the cost of the job.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    elif hasattr(value, "_backend"):
+        return value._backend
+    elif isinstance(value, (list, tuple)):
+        return tuple(_cost_value(item) for item in value)
+    elif isinstance(value, dict):
+        return tuple(sorted((str(k), _cost_value(v)) for k, v in value.items()))
+    elif callable(value):
+        return _function_key(value)
+    return None
+
+
+def _num_chars(inputs: Iterable) -> int:
+    # +1 for each input because every input has a fixed cost even if it is empty.
+    # batches made by `_run_batch_job` are counted by their texts.
+    return sum(len(i) + 1 if isinstance(i, str) else _num_chars(i) if isinstance(i, list) else 1 for i in inputs)
+
+
+def _calibrate(func: Callable, inputs: Any, key: tuple) -> List[Any]:
+    """
+    Run the first inputs without multiprocessing and measure the cost per character.
+
+    Args:
+        func (Callable): function to run
+        inputs (Any): input data
+        key (tuple): key of the measured cost
+
+    Returns:
+        List[Any]: outputs of the inputs which were used for the calibration
+    """
+    outputs = []
+    start = time.perf_counter()
+    for i in inputs[:_CALIBRATION_MAX_INPUTS]:
+        outputs.append(func(i))
+        if time.perf_counter() - start >= _CALIBRATION_SECONDS:
+            break
+
+    _costs[key] = (time.perf_counter() - start) / _num_chars(inputs[: len(outputs)])
+    return outputs
+
+
+def _plan_job(cost: float, inputs: Any) -> Optional[Tuple[Pool, int]]:
+    """
+    Choose the way to run a job.
+
+    Args:
+        cost (float): the measured cost per character
+        inputs (Any): input data
+
+    Returns:
+        Optional[Tuple[Pool, int]]: pool and chunksize to use, or `None` if multiprocessing doesn't pay off.
+    """
+    alive = _pool is not None and _pool_pid == os.getpid()
+    pool_size = _pool._processes if alive else _pool_size(None)
+
+    serial_seconds = cost * _num_chars(inputs)
+    num_workers = min(pool_size, len(inputs), int(serial_seconds / _MIN_SECONDS_PER_WORKER))
+    if num_workers < 2:
+        return None
+
+    # enough chunks to balance the load, but each chunk should be large enough to amortize the transfer.
+    chunksize = min(
+        math.ceil(len(inputs) / (num_workers * 4)),
+        math.ceil(_SECONDS_PER_CHUNK * len(inputs) / max(serial_seconds, 1e-9)),
+    )
+    if num_workers < pool_size:
+        # the shared pool is not resized, using fewer chunks keeps the other workers idle.
+        chunksize = math.ceil(len(inputs) / num_workers)
+    chunksize = max(chunksize, 1)
+
+    parallel_seconds = (
+        serial_seconds / num_workers
+        + math.ceil(len(inputs) / chunksize) * _SECONDS_PER_TASK
+        + (0.0 if alive else _pool_startup_seconds)
+    )
+    if parallel_seconds >= serial_seconds:
+        return None
+
+    return (_pool if alive else _get_pool(None)), chunksize
+
+
+def _run_auto_job(func: Callable, inputs: Any) -> List[Any]:
+    """
+    Run job choosing between serial and parallel execution, the number of workers and chunksize.
+
+    Args:
+        func (Callable): function to run
+        inputs (Any): list or tuple of input data
+
+    Returns:
+        List[Any]: output of the job.
+
+    Notes:
+        The decision depends on the total number of characters, the measured cost per character
+        of the function with its arguments and the number of cores.
+        The shared pool is reused as is. If fewer workers are better, the inputs are split into fewer chunks.
+    """
+    key = _cost_key(func)
+    outputs = []
+    if key not in _costs:
+        outputs = _calibrate(func, inputs, key)
+
+    inputs = inputs[len(outputs):]
+    if len(inputs) == 0:
+        return outputs
+
+    plan = _plan_job(_costs[key], inputs)
+    if plan is None:
+        outputs.extend(func(i) for i in inputs)
     else:
-        with mp.Pool(num_workers) as pool:
-            output = pool.map(func, inputs)
-            pool.close()
-            pool.join()
-            return output
+        pool, chunksize = plan
+        outputs.extend(_pool_map(pool, func, inputs, chunksize))
+    return outputs
+
+
+def _run_module(
+    chunk: List[str],
+    module: Callable,
+    kwargs: Dict[str, Any],
+    num_workers: Union[int, str] = 1,
+) -> List[Any]:
+    """
+    Run a kss module on a chunk of texts.
+
+    Args:
+        chunk (List[str]): list of texts
+        module (Callable): kss module
+        kwargs (Dict[str, Any]): arguments of the module
+        num_workers (Union[int, str]): the number of multiprocessing workers.
+            it is 1 by default because the chunk is usually processed in a worker already.
+
+    Returns:
+        List[Any]: one output per text
+    """
+    outputs = module(chunk, num_workers=num_workers, **kwargs)
+    # kss modules unwrap a list which has only one text.
+    return [outputs] if len(chunk) == 1 else list(outputs)
+
+
+def _chunk_iterable(inputs: Iterable, chunksize: int) -> Iterator[List[Any]]:
+    iterator = iter(inputs)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def _stream_job(
+    chunk_func: Callable,
+    inputs: Iterable,
+    num_workers: Optional[Union[int, bool]] = None,
+    chunksize: int = 64,
+    max_in_flight: Optional[int] = None,
+    ordered: bool = True,
+) -> Iterator[Any]:
+    """
+    Run job lazily and yield outputs in input order.
+
+    Args:
+        chunk_func (Callable): function which maps a list of inputs to a list of outputs
+        inputs (Iterable): input data, consumed lazily
+        num_workers (Optional[Union[int, bool]]): the number of multiprocessing workers.
+        chunksize (int): the number of inputs sent to a worker at once
+        max_in_flight (Optional[int]): the maximum number of chunks submitted but not yielded yet.
+            `None` means twice the number of workers.
+        ordered (bool): whether to yield outputs in input order or as soon as each chunk is finished.
+
+    Returns:
+        Iterator[Any]: outputs of the job.
+
+    Notes:
+        Unlike `Pool.imap`, the inputs are not read ahead of the consumer.
+        At most `max_in_flight` chunks are held in memory, so memory usage doesn't depend on the size of inputs.
+    """
+    chunks = _chunk_iterable(inputs, chunksize)
+
+    if num_workers is False:
+        for chunk in chunks:
+            yield from chunk_func(chunk)
+        return
+
+    pool = _get_pool(num_workers)
+    if max_in_flight is None:
+        max_in_flight = pool._processes * 2
+
+    if not ordered:
+        yield from _stream_job_unordered(pool, chunk_func, chunks, max_in_flight)
+        return
+
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.apply_async(chunk_func, (chunk,)))
+        if len(pending) >= max_in_flight:
+            yield from pending.popleft().get()
+
+    while len(pending) != 0:
+        yield from pending.popleft().get()
+
+
+def _stream_job_unordered(
+    pool: Pool,
+    chunk_func: Callable,
+    chunks: Iterator[List[Any]],
+    max_in_flight: int,
+) -> Iterator[Any]:
+    finished = Queue()
+    in_flight = 0
+
+    def _next_outputs():
+        outputs = finished.get()
+        if isinstance(outputs, BaseException):
+            raise outputs
+        return outputs
+
+    for chunk in chunks:
+        pool.apply_async(chunk_func, (chunk,), callback=finished.put, error_callback=finished.put)
+        in_flight += 1
+        if in_flight >= max_in_flight:
+            yield from _next_outputs()
+            in_flight -= 1
+
+    while in_flight != 0:
+        yield from _next_outputs()
+        in_flight -= 1
@@ -0,0 +1,216 @@
+# Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
+# All rights reserved.
+
+import time
+from functools import partial
+from inspect import signature
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from kss._utils.multiprocessing import _run_job, _run_module, _stream_job
+from kss._utils.sanity_checks import _check_executor, _check_num_workers, _check_text, _check_type
+
+_kinds = ["map", "split", "filter"]
+
+# the kind of modules which are not 'map'.
+_default_kinds = {
+    "split_sentences": "split",
+    "summarize_sentences": "split",
+    "is_unsafe": "filter",
+    "filter_out": "filter",
+}
+
+
+def _first_of_tuple(output: Any) -> Any:
+    return output[0] if isinstance(output, tuple) else output
+
+
+# the adapters which take the output of modules returning it with metadata.
+# `preprocess` returns (text or None if filtered out, metadata) and `filter_out` returns (is_filtered_out, metadata).
+_output_adapters = {
+    "preprocess": _first_of_tuple,
+    "filter_out": _first_of_tuple,
+}
+
+Stage = Tuple[str, Callable, Dict[str, Any], str]
+
+
+class Pipeline(object):
+    """
+    Pipeline which applies several modules to each document in one worker pass.
+
+    Args:
+        stages (List[Union[str, Tuple[str, Dict[str, Any]], Tuple[str, Dict[str, Any], str]]]):
+            list of module names, (module name, arguments) or (module name, arguments, kind).
+            kind is one of the followings and it is inferred from the module by default.
+            - 'map': replace the text with the output. `None` output drops the text.
+            - 'split': replace the text with the list of output texts. the following stages are applied to each of them.
+            - 'filter': drop the text if the output is true. e.g. `is_unsafe`, `filter_out`.
+
+    Examples:
+        >>> import kss
+        >>> pipeline = kss.Pipeline([
+        ...     "clean_news",
+        ...     ("split_sentences", {"backend": "mecab"}),
+        ...     "is_unsafe",
+        ...     "correct_spacing",
+        ... ])
+        >>> pipeline(["문서 1", "문서 2"])
+        [['문장 1', '문장 2'], ['문장 3']]
+        >>> pipeline.timings
+        {'clean_news': 0.01, 'split_sentences': 0.12, 'is_unsafe': 0.01, 'correct_spacing': 0.35}
+
+    Notes:
+        Each document is sent to a worker once, and all stages are applied to it there.
+        So the analyzers of the worker are shared by the stages, and the analysis of the same text is reused.
+        A document which was dropped by a stage skips the remaining stages, and its output is `None`.
+    """
+
+    def __init__(self, stages: List[Union[str, Tuple]]):
+        from kss import Kss
+
+        stages = _check_type(stages, "stages", list)
+        self.stages: List[Stage] = []
+        self.timings: Dict[str, float] = {}
+
+        for stage in stages:
+            if isinstance(stage, str):
+                stage = (stage,)
+            if not isinstance(stage, tuple) or not 1 <= len(stage) <= 3:
+                raise TypeError(
+                    f"Oops! '{stage}' is not supported value for a stage.\n"
+                    "Currently kss only supports [str, Tuple[str, Dict], Tuple[str, Dict, str]] for this.\n"
+                    "Please check `stages` parameter again ;)"
+                )
+
+            module = Kss(stage[0]).module
+            if list(signature(module).parameters)[0] != "text":
+                raise ValueError(
+                    f"Oops! '{module.__name__}' module can't be a stage of pipeline.\n"
+                    "Pipeline only supports modules which take `text` as the first argument.\n"
+                )
+
+            kwargs = _check_type(stage[1], "arguments of stage", dict) if len(stage) > 1 else {}
+            kind = stage[2] if len(stage) > 2 else _default_kinds.get(module.__name__, "map")
+            if kind not in _kinds:
+                raise ValueError(
+                    f"Oops! '{kind}' is not supported kind of stage.\n"
+                    f"Currently kss only supports {_kinds} for this.\n"
+                    "Please check `stages` parameter again ;)"
+                )
+
+            name = module.__name__
+            while name in self.timings:
+                name += "_"
+            self.timings[name] = 0.0
+            self.stages.append((name, module, kwargs, kind))
+
+    def __call__(
+        self,
+        text: Union[str, List[str], Tuple[str]],
+        num_workers: Union[int, str] = "auto",
+        executor: str = "process",
+    ) -> Union[Any, List[Any]]:
+        """
+        Apply the pipeline to texts.
+
+        Args:
+            text (Union[str, List[str], Tuple[str]]): single text or list/tuple of texts
+            num_workers (Union[int, str]): the number of multiprocessing workers
+            executor (str): the way to run the job, one of ['process', 'thread', 'serial']
+
+        Returns:
+            Union[Any, List[Any]]: output of the pipeline for each text
+        """
+        text, finish = _check_text(text)
+        if finish:
+            return text
+
+        results = _run_job(
+            func=partial(_run_pipeline, stages=self.stages),
+            inputs=text,
+            num_workers=_check_num_workers(text, num_workers),
+            executor=_check_executor(executor),
+        )
+
+        if isinstance(text, str):
+            self._add_timings(results[1])
+            return results[0]
+
+        for _, timings in results:
+            self._add_timings(timings)
+        return [output for output, _ in results]
+
+    def stream(
+        self,
+        inputs: Iterable[str],
+        num_workers: Union[int, str] = "auto",
+        chunksize: int = 64,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Apply the pipeline lazily over an iterable of texts. Refer to `kss.stream()` for details.
+        """
+        outputs = _stream_job(
+            chunk_func=partial(_run_pipeline_chunk, stages=self.stages),
+            inputs=inputs,
+            num_workers=_check_num_workers(inputs, num_workers),
+            chunksize=chunksize,
+            max_in_flight=max_in_flight,
+        )
+
+        for output, timings in outputs:
+            self._add_timings(timings)
+            yield output
+
+    def _add_timings(self, timings: List[float]):
+        for (name, _, _, _), seconds in zip(self.stages, timings):
+            self.timings[name] += seconds
+
+    def __repr__(self):
+        return f"Pipeline({[(name, kwargs, kind) for name, _, kwargs, kind in self.stages]})"
+
+
+def _run_pipeline(text: str, stages: List[Stage]) -> Tuple[Any, List[float]]:
+    """
+    Apply all stages to a document.
+
+    Args:
+        text (str): document
+        stages (List[Stage]): stages of pipeline
+
+    Returns:
+        Tuple[Any, List[float]]: output and seconds spent in each stage
+    """
+    output, is_list = text, False
+    timings = [0.0] * len(stages)
+
+    for i, (name, module, kwargs, kind) in enumerate(stages):
+        if output is None or (is_list and len(output) == 0):
+            break
+
+        start = time.perf_counter()
+        inputs = output if is_list else [output]
+        results = _run_module(inputs, module, kwargs)
+        adapter = _output_adapters.get(module.__name__)
+        if adapter is not None:
+            results = [adapter(r) for r in results]
+
+        if kind == "map":
+            kept = [r for r in results if r is not None]
+        elif kind == "split":
+            kept = [r for result in results for r in result]
+            is_list = True
+        else:
+            kept = [t for t, r in zip(inputs, results) if not r]
+
+        if is_list:
+            output = kept
+        else:
+            output = kept[0] if len(kept) != 0 else None
+        timings[i] = time.perf_counter() - start
+
+    return output, timings
+
+
+def _run_pipeline_chunk(chunk: List[str], stages: List[Stage]) -> List[Tuple[Any, List[float]]]:
+    return [_run_pipeline(text, stages) for text in chunk]
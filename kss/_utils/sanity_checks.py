@@ -2,6 +2,7 @@
 # All rights reserved.
 
 import numbers
+import os
 import platform
 import unicodedata
 from typing import Union, Tuple, List, Any, Optional, Type, Callable, Iterable
@@ -28,6 +29,9 @@ _mecab_info_windows = "https://cleancode-ws.tistory.com/97"
 _konlpy_info_windows = "https://uwgdqo.tistory.com/363"
 _pecab_info = "https://github.com/hyunwoongko/pecab"
 
+# analyzers are shared by all modules, so the analysis of a text can be reused by the other modules.
+_analyzers = (MecabAnalyzer(), PecabAnalyzer(), CharacterAnalyzer(), FastAnalyzer())
+
 
 def _message_by_user_os(linux_macos: str, windows: str) -> str:
     user_os = platform.uname().system.lower()
@@ -212,8 +216,7 @@ def _check_analyzer_backend_mecab_pecab_only(backend: str) -> Analyzer:
             f"Please check `backend` parameter again ;)\n"
         )
 
-    mecab_backend = MecabAnalyzer()
-    pecab_backend = PecabAnalyzer()
+    mecab_backend, pecab_backend = _analyzers[:2]
 
     if backend == "mecab":
         if mecab_backend._backend is not None:
@@ -320,10 +323,7 @@ def _check_analyzer_backend(backend: str) -> Analyzer:
             f"Please check `backend` parameter again ;)\n"
         )
 
-    mecab_backend = MecabAnalyzer()
-    pecab_backend = PecabAnalyzer()
-    punct_backend = CharacterAnalyzer()
-    fast_backed = FastAnalyzer()
+    mecab_backend, pecab_backend, punct_backend, fast_backed = _analyzers
 
     if backend == "fast":
         return fast_backed
@@ -428,7 +428,7 @@ def _check_num_workers(
 
     Returns:
         Optional[Union[int, bool]]: the number of multiprocessing workers.
-            `None` means maximum number of workers which can be used for now.
+            `None` means that the number of workers and chunksize will be chosen automatically.
             `False` means that it will not use multiprocessing.
     """
 
@@ -467,3 +467,58 @@ def _check_num_workers(
         # maximum multiprocessing workers
 
     return num_workers
+
+
+def _check_executor(executor: str) -> str:
+    """
+    Check the executor of multiprocessing jobs.
+
+    Args:
+        executor (str): one of 'process', 'thread' and 'serial'
+
+    Returns:
+        str: executor
+    """
+    executor = _check_type(executor, "executor", str).lower()
+
+    if executor not in ["process", "thread", "serial"]:
+        raise ValueError(
+            f"Oops! '{executor}' is not supported value for `executor`.\n"
+            f"Currently kss only supports ['process', 'thread', 'serial'] for this.\n"
+            f"Please check `executor` parameter again ;)"
+        )
+
+    return executor
+
+
+def _check_rules(rules: Any) -> Any:
+    """
+    Check the spacing rules.
+
+    Args:
+        rules (Any): 'default', path of a saved rule pack, list of rule names or rule pack
+
+    Returns:
+        Any: 'default', path of a saved rule pack, tuple of rule names or rule pack
+    """
+    from kss._modules.spacing.rule_pack import RulePack, _check_rule_names
+
+    if isinstance(rules, RulePack) or rules == "default":
+        return rules
+
+    if isinstance(rules, str):
+        if not os.path.isfile(rules):
+            raise ValueError(
+                f"Oops! '{rules}' is not 'default' or a file of rule pack.\n"
+                "Please check `rules` parameter again ;)"
+            )
+        return os.path.abspath(rules)
+
+    if isinstance(rules, (list, tuple)):
+        return _check_rule_names(rules)
+
+    raise TypeError(
+        f"Oops! '{type(rules)}' is not supported type for `rules`.\n"
+        f"Currently kss only supports [str, List[str], RulePack] for this.\n"
+        f"Please check `rules` parameter again ;)\n"
+    )
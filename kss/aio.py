@@ -0,0 +1,217 @@
+# Copyright (C) 2021 Hyunwoong Ko <kevin.brain@kakaobrain.com> and Sang Park <sang.park@dnotitia.com>
+# All rights reserved.
+
+"""
+Coroutine versions of kss modules.
+
+Examples:
+    >>> import kss
+    >>> async def handler(text):
+    ...     return await kss.aio.split_sentences(text)
+"""
+
+import asyncio
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from inspect import signature
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from kss import supported_modules
+from kss._utils.multiprocessing import _run_module
+from kss._utils.sanity_checks import _check_type
+
+# Modules run on a thread pool so that the event loop is never blocked.
+# The threads are mostly waiting for the shared worker pool of `kss._utils.multiprocessing`.
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_max_workers: Optional[int] = None
+
+# Concurrent requests with a single text are coalesced into one batched job.
+_max_latency: float = 0.002
+_max_batch_size: int = 64
+_batches: Dict[Tuple[Any, ...], "_Batch"] = {}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor, _executor_pid
+
+    if _executor is None or _executor_pid != os.getpid():
+        _executor = ThreadPoolExecutor(_max_workers, thread_name_prefix="kss")
+        _executor_pid = os.getpid()
+    return _executor
+
+
+def set_executor(max_workers: Optional[int] = None) -> None:
+    """
+    Set the thread pool which runs kss modules for coroutines.
+
+    Args:
+        max_workers (Optional[int]): the number of threads.
+            `None` means the default of `concurrent.futures.ThreadPoolExecutor`.
+    """
+    global _max_workers
+
+    if max_workers is not None:
+        max_workers = _check_type(max_workers, "max_workers", int)
+        if max_workers < 1:
+            raise ValueError(
+                f"Oops! `max_workers` must be same or greater than 1, but you input {max_workers}.\n"
+                "Please check `max_workers` parameter again ;)"
+            )
+
+    close_executor()
+    _max_workers = max_workers
+
+
+def close_executor() -> None:
+    """
+    Shut down the thread pool which runs kss modules for coroutines.
+    It will be created again lazily when a coroutine is awaited.
+    """
+    global _executor, _executor_pid
+
+    if _executor is not None and _executor_pid == os.getpid():
+        _executor.shutdown(wait=False)
+    _executor, _executor_pid = None, None
+
+
+def set_batching(max_latency: float = 0.002, max_batch_size: int = 64) -> None:
+    """
+    Set how concurrent requests are coalesced into batches.
+
+    Args:
+        max_latency (float): the maximum seconds a request waits for other requests
+        max_batch_size (int): the maximum number of texts in a batch.
+            The batch is dispatched immediately when it is full.
+
+    Examples:
+        >>> import kss
+        >>> kss.aio.set_batching(max_latency=0, max_batch_size=1)  # disable batching
+    """
+    global _max_latency, _max_batch_size
+
+    max_latency = _check_type(max_latency, "max_latency", float)
+    max_batch_size = _check_type(max_batch_size, "max_batch_size", int)
+
+    if max_latency < 0:
+        raise ValueError(
+            f"Oops! `max_latency` must be same or greater than 0, but you input {max_latency}.\n"
+            "Please check `max_latency` parameter again ;)"
+        )
+
+    if max_batch_size < 1:
+        raise ValueError(
+            f"Oops! `max_batch_size` must be same or greater than 1, but you input {max_batch_size}.\n"
+            "Please check `max_batch_size` parameter again ;)"
+        )
+
+    _max_latency, _max_batch_size = max_latency, max_batch_size
+
+
+atexit.register(close_executor)
+
+
+class _Batch(object):
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        key: Tuple[Any, ...],
+        module: Callable,
+        kwargs: Dict[str, Any],
+        num_workers: Any,
+    ):
+        self.loop = loop
+        self.key = key
+        self.module = module
+        self.kwargs = kwargs
+        self.num_workers = num_workers
+        self.texts: List[str] = []
+        self.futures: List[asyncio.Future] = []
+        self.handle = loop.call_later(_max_latency, self.flush)
+
+    def add(self, text: str) -> asyncio.Future:
+        future = self.loop.create_future()
+        self.texts.append(text)
+        self.futures.append(future)
+
+        if len(self.texts) >= _max_batch_size:
+            self.flush()
+        return future
+
+    def flush(self):
+        self.handle.cancel()
+        if _batches.get(self.key) is self:
+            del _batches[self.key]
+
+        # requests cancelled while waiting for the batch are dropped.
+        requests = [(t, f) for t, f in zip(self.texts, self.futures) if not f.cancelled()]
+        if len(requests) == 0:
+            return
+
+        texts = [t for t, _ in requests]
+        futures = [f for _, f in requests]
+        job = self.loop.run_in_executor(
+            _get_executor(),
+            partial(_run_module, texts, self.module, self.kwargs, self.num_workers),
+        )
+        job.add_done_callback(partial(_set_results, futures))
+
+        for future in futures:
+            future.add_done_callback(partial(_cancel_job, job, futures))
+
+
+def _set_results(futures: List[asyncio.Future], job: asyncio.Future):
+    if job.cancelled():
+        return
+
+    exception = job.exception()
+    outputs = [None] * len(futures) if exception is not None else job.result()
+    for future, output in zip(futures, outputs):
+        if future.done():
+            continue
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(output)
+
+
+def _cancel_job(job: asyncio.Future, futures: List[asyncio.Future], _):
+    # the job is cancelled only if nobody is waiting for it and it didn't start yet.
+    if all(f.cancelled() for f in futures):
+        job.cancel()
+
+
+def _coroutine(name: str, module: Callable) -> Callable:
+    batchable = list(signature(module).parameters)[:1] == ["text"]
+
+    async def coroutine(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+
+        if batchable and len(args) == 0 and "text" in kwargs:
+            args = (kwargs.pop("text"),)
+
+        if batchable and len(args) == 1 and isinstance(args[0], str) and len(args[0]) != 0:
+            num_workers = kwargs.pop("num_workers", "auto")
+            key = (loop, name, repr(num_workers), repr(sorted(kwargs.items())))
+            batch = _batches.get(key)
+            if batch is None:
+                batch = _batches[key] = _Batch(loop, key, module, kwargs, num_workers)
+            return await batch.add(args[0])
+
+        return await loop.run_in_executor(_get_executor(), partial(module, *args, **kwargs))
+
+    coroutine.__name__ = coroutine.__qualname__ = name
+    coroutine.__doc__ = (
+        f"Coroutine version of `kss.{name}()`. It runs on a thread pool and doesn't block the event loop.\n"
+        f"Concurrent calls with a single text and the same arguments are processed as one batch.\n\n"
+        f"{(module.__doc__ or '').strip()}"
+    )
+    return coroutine
+
+
+for _name, _module in supported_modules.items():
+    globals()[_name] = _coroutine(_name, _module)
+
+__all__ = list(supported_modules.keys()) + ["set_executor", "close_executor", "set_batching"]
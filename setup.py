@@ -34,8 +34,9 @@ class PreInstall(install):
 
 def get_extra_compile_args():
     if platform.system() == "Linux":
-        extra_compile_args = ["-std=c++11"]
-        extra_link_args = []
+        # `splitSentencesBatch` uses std::thread.
+        extra_compile_args = ["-std=c++11", "-pthread"]
+        extra_link_args = ["-pthread"]
     elif platform.system() == "Darwin":
         extra_compile_args = ["-std=c++11", "-stdlib=libc++"]
         extra_link_args = ["-stdlib=libc++"]
@@ -163,6 +164,7 @@ setup(
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
     ],
+    entry_points={"console_scripts": ["kss=kss.__main__:main"]},
     cmdclass={"install": PreInstall},
     ext_modules=cythonize_if_possible(),
 )
@@ -0,0 +1,40 @@
+import asyncio
+
+import kss
+from kss import Kss
+
+
+def test_aio():
+    texts = ["안녕하세요. 반갑습니다.", "오늘은 날씨가 좋네요. 산책 가요.", "밥 먹었어요? 저는 먹었어요."]
+    expected = Kss("split_sentences")(texts, num_workers=1)
+
+    async def main():
+        return await asyncio.gather(*[kss.aio.split_sentences(t, num_workers=1) for t in texts])
+
+    assert asyncio.run(main()) == expected
+
+
+def test_aio_batching_and_cancellation(monkeypatch):
+    texts = ["안녕하세요", "안녕하세요. 씨발", "반갑습니다"]
+    batches = []
+    run_module = kss.aio._run_module
+
+    def _run_module(chunk, *args):
+        batches.append(list(chunk))
+        return run_module(chunk, *args)
+
+    monkeypatch.setattr(kss.aio, "_run_module", _run_module)
+
+    async def main():
+        tasks = [asyncio.ensure_future(kss.aio.is_unsafe(t, num_workers=1)) for t in texts]
+        await asyncio.sleep(0)
+        tasks[2].cancel()
+        outputs = await asyncio.gather(*tasks, return_exceptions=True)
+        return outputs[:2], tasks[2].cancelled()
+
+    kss.aio.set_batching(max_latency=0.05, max_batch_size=8)
+    try:
+        assert asyncio.run(main()) == ([False, True], True)
+    finally:
+        kss.aio.set_batching()
+    assert batches == [texts[:2]]
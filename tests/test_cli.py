@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+from kss.__main__ import main
+
+
+def test_cli(tmp_path):
+    texts = ["안녕하세요. 반갑습니다.", "오늘은 날씨가 좋네요. 산책 가요.", "밥 먹었어요? 저는 먹었어요."]
+    source, target = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    source.write_text("".join(json.dumps({"text": t}, ensure_ascii=False) + "\n" for t in texts), encoding="utf-8")
+
+    main(["run", "split_sentences", "--in", str(source), "--out", str(target), "--workers", "1", "--chunksize", "1"])
+    outputs = [json.loads(line)["split_sentences"] for line in target.read_text(encoding="utf-8").splitlines()]
+    assert outputs == [["안녕하세요.", "반갑습니다."], ["오늘은 날씨가 좋네요.", "산책 가요."], ["밥 먹었어요?", "저는 먹었어요."]]
+
+    # simulate a crash after the first line: the second line was written but not checkpointed.
+    lines = target.read_text(encoding="utf-8").splitlines(keepends=True)
+    target.write_text(lines[0] + lines[1][:10], encoding="utf-8")
+    (tmp_path / "out.jsonl.ckpt").write_text(json.dumps({"lines": 1, "bytes": len(lines[0].encode("utf-8"))}))
+
+    main(["run", "split_sentences", "--in", str(source), "--out", str(target), "--workers", "1", "--resume"])
+    assert target.read_text(encoding="utf-8").splitlines(keepends=True) == lines
+
+    with pytest.raises(ValueError):
+        main(["run", "split_sentences", "--in", str(source), "--out", str(target), "--unordered", "--resume"])
@@ -1,3 +1,4 @@
+import kss
 from kss import Kss
 
 
@@ -8,5 +9,71 @@ def test_morphemes():
     assert output == [('아버지', 'NNG'), ('가', 'JKS'), ('방', 'NNG'), ('에', 'JKB'), ('들어오', 'VV'), ('시', 'EP'), ('다', 'EF'), ('.', 'SF')]
 
 
+def test_analysis_cache():
+    split_morphemes = Kss("split_morphemes")
+    text = "회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요"
+
+    kss.clear_analysis_cache()
+    with_space = split_morphemes(text, drop_space=False)
+    without_space = split_morphemes(text, drop_space=True)
+    assert without_space == [token for token in with_space if token[0] != " "]
+
+    info = kss.analysis_cache_info()
+    assert (info["hits"], info["misses"], info["entries"]) == (1, 1, 1)
+
+    try:
+        kss.set_analysis_cache(max_entries=1)
+        split_morphemes("아버지가방에들어오시다.")
+        assert kss.analysis_cache_info()["entries"] == 1
+        assert split_morphemes(text, drop_space=False) == with_space
+        assert kss.analysis_cache_info()["misses"] == 3
+    finally:
+        kss.set_analysis_cache()
+
+
+def test_pos_batch():
+    from kss._utils.sanity_checks import _check_analyzer_backend_mecab_pecab_only
+
+    texts = ["회사 동료 분들과 다녀왔는데", "아버지가방에들어오시다.", "회사 동료 분들과 다녀왔는데", "", "맛있어요!!", "주차 가능해요"]
+
+    # every text is analyzed like a single text, including the last morpheme of it.
+    for backend in ["mecab", "pecab"]:
+        try:
+            analyzer = _check_analyzer_backend_mecab_pecab_only(backend)
+        except ImportError:
+            continue
+
+        for drop_space in [False, True]:
+            kss.clear_analysis_cache()
+            expected = [analyzer.pos(text, drop_space=drop_space) for text in texts]
+            kss.clear_analysis_cache()
+            assert analyzer.pos_batch(texts, drop_space=drop_space) == expected
+
+    analyzer = _check_analyzer_backend_mecab_pecab_only("auto")
+    kss.clear_analysis_cache()
+    assert Kss("split_morphemes")(texts, num_workers=1) == [analyzer.pos(text, drop_space=True) for text in texts]
+
+
+def test_disk_cache(tmp_path):
+    split_morphemes = Kss("split_morphemes")
+    texts = ["회사 동료 분들과 다녀왔는데", "분위기도 좋고 음식도 맛있었어요"]
+
+    kss.enable_disk_cache(str(tmp_path / "analyses.db"))
+    try:
+        kss.clear_analysis_cache()
+        expected = split_morphemes(texts, num_workers=1)
+        assert kss.disk_cache_info()["entries"] == 2
+
+        kss.clear_analysis_cache()
+        assert split_morphemes(texts, num_workers=1) == expected
+        assert kss.disk_cache_info()["hits"] == 2
+
+        kss.enable_disk_cache(str(tmp_path / "analyses.db"), max_bytes=1)
+        split_morphemes("아버지가방에들어오시다.")
+        assert kss.disk_cache_info()["entries"] == 0
+    finally:
+        kss.disable_disk_cache()
+
+
 if __name__ == '__main__':
     test_morphemes()
@@ -0,0 +1,160 @@
+import pytest
+
+import kss
+from kss import Kss
+from kss._utils import multiprocessing
+
+
+def test_shared_pool_is_reused():
+    split_sentences = Kss("split_sentences")
+    texts = ["안녕하세요. 반갑습니다.", "오늘은 날씨가 좋네요. 산책 가요."]
+    expected = split_sentences(texts, num_workers=1)
+
+    assert split_sentences(texts, num_workers=2) == expected
+    first_pool = multiprocessing._pool
+    assert split_sentences(texts, num_workers=2) == expected
+    assert multiprocessing._pool is first_pool
+
+    kss.close_pool()
+    assert multiprocessing._pool is None
+
+
+def test_set_pool():
+    is_unsafe = Kss("is_unsafe")
+    texts = ["안녕하세요", "안녕하세요. 씨발"]
+
+    with kss.pool(2) as pool:
+        assert is_unsafe(texts, num_workers=4) == [False, True]
+        assert multiprocessing._pool is pool
+    assert multiprocessing._pool is None
+
+
+def test_stream():
+    texts = ["안녕하세요. 반갑습니다.", "오늘은 날씨가 좋네요. 산책 가요.", "밥 먹었어요? 저는 먹었어요."] * 5
+    expected = Kss("split_sentences")(texts, num_workers=1)
+
+    outputs = kss.stream("split_sentences", iter(texts), num_workers=2, chunksize=4, max_in_flight=2)
+    assert list(outputs) == expected
+
+    outputs = Kss("split_sentences").stream((t for t in texts), num_workers=1, chunksize=1)
+    assert list(outputs) == expected
+    kss.close_pool()
+
+
+def test_autotune():
+    split_sentences = Kss("split_sentences")
+    texts = ["안녕하세요. 반갑습니다.", "오늘은 날씨가 좋네요. 산책 가요."]
+    expected = split_sentences(texts, num_workers=1)
+
+    # short inputs are processed without starting workers.
+    kss.close_pool()
+    multiprocessing._costs.clear()
+    assert split_sentences(texts) == expected
+    assert multiprocessing._pool is None
+    assert len(multiprocessing._costs) == 1
+
+    # expensive inputs are distributed to the shared pool.
+    with kss.pool(2) as pool:
+        key = next(iter(multiprocessing._costs))
+        multiprocessing._costs[key] = 1.0
+        assert multiprocessing._plan_job(1.0, texts * 4) == (pool, 1)
+        assert split_sentences(texts * 4) == expected * 4
+    multiprocessing._costs.clear()
+
+
+def test_executor():
+    split_sentences = Kss("split_sentences")
+    texts = ["안녕하세요. 반갑습니다.", "오늘은 날씨가 좋네요. 산책 가요.", "밥 먹었어요? 저는 먹었어요."]
+    expected = split_sentences(texts, num_workers=1)
+
+    for executor in ["thread", "process", "serial"]:
+        assert split_sentences(texts, num_workers=2, executor=executor) == expected
+    assert Kss("combine_josa")(["철수", "영희"], "은", num_workers=2, executor="thread") == ["철수는", "영희는"]
+
+    with pytest.raises(ValueError):
+        split_sentences(texts, executor="greenlet")
+    kss.close_pool()
+
+
+def test_warmup():
+    timings = kss.warmup(["split_sentences", "josa", "is_hanja"], num_workers=2)
+    assert len(timings) == 2
+    for timing in timings.values():
+        assert list(timing.keys()) == ["split_sentences", "josa", "is_hanja"]
+
+    assert kss.split_sentences(["안녕하세요. 반갑습니다.", "안녕히 가세요."], num_workers=2) == [
+        ["안녕하세요.", "반갑습니다."], ["안녕히 가세요."]
+    ]
+    assert kss.warmup([]) == {}
+
+    with pytest.raises(ValueError):
+        kss.warmup(["split_sentence_typo"])
+
+    # every name which `Kss` accepts can be warmed up.
+    names = list(kss.supported_modules) + list(kss.alias)
+    timings = kss.warmup(names, num_workers=1)
+    assert [list(timing.keys()) for timing in timings.values()] == [names]
+    kss.warmup([])
+    kss.close_pool()
+
+
+def _fail_on_marker(text):
+    if text == "marker":
+        raise ValueError(text)
+    return text * 2
+
+
+def test_shared_memory_is_unlinked_on_error():
+    import os
+
+    def segments():
+        return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+    if not os.path.isdir("/dev/shm"):
+        pytest.skip("shared memory segments are not listed in /dev/shm")
+
+    pool = multiprocessing._get_pool(2)
+    before = segments()
+    texts = ["가", "나", "marker", "다", "라", "마"]
+    with pytest.raises(ValueError):
+        multiprocessing._shared_memory_map(pool, _fail_on_marker, texts, chunksize=1)
+    assert segments() == before
+
+    del texts[2]
+    assert multiprocessing._shared_memory_map(pool, _fail_on_marker, texts, chunksize=1) == [t * 2 for t in texts]
+    assert segments() == before
+    kss.close_pool()
+
+
+def test_shared_memory(monkeypatch):
+    monkeypatch.setattr(multiprocessing, "_SHARED_MEMORY_MIN_CHARS", 0)
+    texts = ["안녕하세요. 만나서 정말 반갑습니다.", "오늘은 날씨가 좋네요. 산책 가요.", "이 사람 진짜 왜 이래. 씨발"] * 3
+
+    for module in ["split_sentences", "is_unsafe", "preprocess"]:
+        assert Kss(module)(texts, num_workers=2) == Kss(module)(texts, num_workers=1)
+    assert Kss("is_unsafe")(texts + [""], num_workers=2) == Kss("is_unsafe")(texts + [""], num_workers=1)
+    kss.close_pool()
+
+
+def test_shared_memory_path(monkeypatch):
+    import os
+
+    calls = []
+    shared_memory_map = multiprocessing._shared_memory_map
+
+    def _spy(*args, **kwargs):
+        calls.append(args[2])
+        return shared_memory_map(*args, **kwargs)
+
+    monkeypatch.setattr(multiprocessing, "_SHARED_MEMORY_MIN_CHARS", 1)
+    monkeypatch.setattr(multiprocessing, "_shared_memory_map", _spy)
+    pool = multiprocessing._get_pool(2)
+    texts = ["가", "나", "다", "라"]
+
+    # the outputs of the workers are read through shared memory only on POSIX.
+    for supported in [True, False] if os.name == "posix" else [False]:
+        monkeypatch.setattr(multiprocessing, "_SHARED_MEMORY_SUPPORTED", supported)
+        calls.clear()
+        assert multiprocessing._pool_map(pool, _fail_on_marker, texts) == [t * 2 for t in texts]
+        assert calls == ([texts] if supported else [])
+    kss.close_pool()
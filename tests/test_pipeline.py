@@ -0,0 +1,46 @@
+from kss import Kss, Pipeline
+
+
+def test_pipeline():
+    texts = ["안녕하세요반갑습니다. 오늘 날씨가 좋네요.", "씨발 존나 짜증나네 진짜. 안녕하세요."]
+    pipeline = Pipeline(["normalize", ("split_sentences", {"backend": "punct"}), "is_unsafe", "correct_spacing"])
+
+    expected = []
+    for text in texts:
+        sentences = Kss("split_sentences")(Kss("normalize")(text), backend="punct")
+        expected.append([Kss("correct_spacing")(s) for s in sentences if not Kss("is_unsafe")(s)])
+
+    assert pipeline(texts, num_workers=1) == expected
+    assert list(pipeline.stream(texts, num_workers=1)) == expected
+    assert list(pipeline.timings) == ["normalize", "split_sentences", "is_unsafe", "correct_spacing"]
+
+
+def test_pipeline_filter():
+    texts = ["안녕하세요 반갑습니다", "씨발 존나 짜증나네 진짜"]
+    pipeline = Pipeline(["is_unsafe", "normalize", "normalize"])
+    assert pipeline(texts, num_workers=1) == [texts[0], None]
+    assert list(pipeline.timings) == ["is_unsafe", "normalize", "normalize_"]
+
+
+def test_pipeline_output_adapters():
+    texts = ["오늘은 날씨가 정말  좋네요. 우리 같이 산책 가요.", "오늘은 날씨가 좋네요. 산책 가요."]
+    pipeline = Pipeline([("preprocess", {"allow_doubled_spaces": False}), ("filter_out", {"min_length": 25})])
+    assert pipeline(texts, num_workers=1) == [Kss("preprocess")(texts[0], allow_doubled_spaces=False)[0], None]
+
+    # a filter stage of a module which returns a tuple is not dropped by the tuple itself.
+    pipeline = Pipeline([("filter_out", {"min_length": 1})])
+    assert pipeline(texts, num_workers=1) == texts
+
+
+def test_pipeline_cost_key():
+    from functools import partial
+
+    from kss._utils.multiprocessing import _cost_key
+    from kss._utils.pipeline import _run_pipeline
+
+    def key(stages):
+        return _cost_key(partial(_run_pipeline, stages=Pipeline(stages).stages))
+
+    assert key(["normalize", "is_unsafe"]) == key(["normalize", "is_unsafe"])
+    assert key(["normalize", "is_unsafe"]) != key(["normalize", "correct_spacing"])
+    assert key([("split_sentences", {"backend": "punct"})]) != key([("split_sentences", {"backend": "fast"})])
@@ -1,6 +1,27 @@
 from kss import Kss
 
 
+def test_is_unsafe_dict():
+    from kss._modules.safety.check_safety import _is_unsafe_dict
+    from kss._modules.safety.utils import bad_words, exceptions
+
+    def brute_force(text):
+        return [
+            word for word in bad_words
+            if word in text and not any(exception in text for exception in exceptions.get(word, ()))
+        ]
+
+    texts = ["안녕하세요", "안녕하세요. 씨발", "탄핵소추안이 발의됐다", "소추 씨발 개새끼", "도시바 시바견", "SEXUAL SEX"]
+    for text in texts:
+        expected = brute_force(text)
+        assert _is_unsafe_dict(text, return_matches=True) == expected
+        assert _is_unsafe_dict(text) == (len(expected) != 0)
+
+    is_unsafe = Kss("is_unsafe")
+    assert is_unsafe(["안녕하세요", "안녕하세요. 씨발"]) == [False, True]
+    assert is_unsafe("탄핵소추안이 발의됐다") is False
+
+
 def test_is_unsafe():
     is_unsafe = Kss("is_unsafe")
     text = "안녕하세요"
@@ -1,4 +1,4 @@
-from kss import Kss
+from kss import Kss, SentenceStream
 
 
 def test_split_sentences():
@@ -8,3 +8,155 @@ def test_split_sentences():
     assert output == ['회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요',
                       '다만, 강남 토끼정이 강남 쉑쉑버거 골목길로 쭉 올라가야 하는데 다들 쉑쉑버거의 유혹에 넘어갈 뻔 했답니다',
                       '강남역 맛집 토끼정의 외부 모습.']
+
+
+def test_split_sentences_spans():
+    split_sentences = Kss("split_sentences")
+    texts = ["안녕하세요. 반갑습니다. 안녕하세요.", "  오늘은 날씨가 좋네요.  산책 가요. "]
+
+    for backend in ["pecab", "punct", "fast"]:
+        for strip in [True, False]:
+            outputs = split_sentences(texts, backend=backend, strip=strip, return_spans=True, num_workers=1)
+            for text, (sentences, spans) in zip(texts, outputs):
+                assert sentences == split_sentences(text, backend=backend, strip=strip)
+                assert [text[start:end] for start, end in spans] == sentences
+                assert all(spans[i][1] <= spans[i + 1][0] for i in range(len(spans) - 1))
+
+    # sentences which start with a space that `strip` keeps.
+    for text in ["했다... \xa0했다...   ", "했다... \u3000했다. \u3000 \xa0했다."]:
+        sentences, spans = split_sentences(text, backend="punct", return_spans=True)
+        assert any(sentence[0] in "\xa0\u3000" for sentence in sentences)
+        assert [text[start:end] for start, end in spans] == sentences
+
+
+def test_sentence_stream():
+    split_sentences = Kss("split_sentences")
+    text = "회사 동료 분들과 다녀왔는데 분위기도 좋고 음식도 맛있었어요 다만, 강남 토끼정이 강남 쉑쉑버거 골목길로 쭉 올라가야 하는데 다들 쉑쉑버거의 유혹에 넘어갈 뻔 했답니다 강남역 맛집 토끼정의 외부 모습. " * 5
+
+    for backend in ["punct", "fast"]:
+        stream = SentenceStream(backend=backend, min_chars=16)
+        outputs = []
+        for i in range(0, len(text), 7):
+            outputs += stream.feed(text[i: i + 7])
+            assert len(stream.buffer) < 16 + 7 + 2 * len(text) // 5
+        outputs += stream.flush()
+        assert outputs == split_sentences(text, backend=backend)
+
+
+def test_split_sentences_backup():
+    from kss._modules.sentences.sentence_processor import SentenceProcessor
+
+    split_sentences = Kss("split_sentences")
+    num_backups = len(SentenceProcessor._normal_backup)
+
+    for i in range(3):
+        text = f"자세한 내용은 https://example{i}.com/a.b 를 보세요. 메일은 kss{i}@example.com 으로 주세요. I'm fine :)"
+        output = split_sentences(text, backend="punct")
+        assert "".join(output).replace(" ", "") == text.replace(" ", "")
+
+    output = split_sentences("그렇다. 정말 그렇다.", backend="punct", ignores=["다."])
+    assert output == ["그렇다. 정말 그렇다."]
+    output = split_sentences("그렇다. 정말 그렇다.", backend="punct")
+    assert output == ["그렇다.", "정말 그렇다."]
+    assert len(SentenceProcessor._normal_backup) == num_backups
+
+
+def test_backup_trie():
+    import random
+    from kss._elements.trie import Trie
+    from kss._utils.const import backup_normal
+
+    def replace_leftmost_longest(words, text):
+        outputs, i = [], 0
+        while i < len(text):
+            matches = [w for w in words if len(w) != 0 and text.startswith(w, i)]
+            if len(matches) != 0:
+                word = max(matches, key=len)
+                outputs.append(f"<{word}>")
+                i += len(word)
+            else:
+                outputs.append(text[i])
+                i += 1
+        return "".join(outputs)
+
+    random.seed(42)
+    for _ in range(300):
+        words = ["".join(random.choices("ab.( ", k=random.randint(0, 4))) for _ in range(random.randint(0, 8))]
+        text = "".join(random.choices("ab.( c", k=random.randint(0, 40)))
+        assert Trie(words).sub(lambda m: f"<{m.group()}>", text) == replace_leftmost_longest(words, text)
+
+    # ">:(" and "3:)" are not broken by ":(" and ":)".
+    text = "George D. Beauchamp 씨는 :) 웃었다 >:( 3:) 라요 바예카노 알림 차단 'N' n' 몽키 D. 루피"
+    output = Trie(backup_normal).sub(lambda m: f"<{m.group()}>", text)
+    assert output == replace_leftmost_longest(backup_normal, text)
+    assert "<>:(> <3:)>" in output
+
+
+def test_split_sentences_fast_batch():
+    import pytest
+
+    kss_cython = pytest.importorskip("kss_cython")
+    texts = ["안녕하세요. 반갑습니다. 오늘 날씨가 좋네요ㅋㅋ 그렇죠?", "", "했다고 하더라구요 갔다", "😀다. 요!"] * 8
+
+    expected = [kss_cython.split_sentences_fast(text) for text in texts]
+    for num_threads in [1, 4]:
+        assert kss_cython.split_sentences_fast_batch(texts, num_threads=num_threads) == expected
+    assert kss_cython.split_sentences_fast_batch([]) == []
+
+    # `split_sentences` passes each batch to the GIL-free batch function.
+    from kss._modules.sentences import sentence_splitter_fast
+
+    assert sentence_splitter_fast._split_sentences_native_batch is kss_cython.split_sentences_fast_batch
+    split_sentences = Kss("split_sentences")
+    assert split_sentences(texts, backend="fast", executor="thread", num_workers=4) == expected
+
+
+def test_split_sentences_fast_parity():
+    import random
+
+    import pytest
+
+    kss_cython = pytest.importorskip("kss_cython")
+    from kss._modules.sentences.sentence_splitter_fast import Table, _split_sentences_fast
+
+    # differential fuzzing of the C++ rules and the Python rules with the characters of the rules.
+    chars = sorted({char for table in Table.values() for char in table} - {""})
+    chars += list("가나 ㅋㅎ😀👍 .!?~…\"'’”)」] \n\t살")
+    ignores = ["다.", "요", "ㅋㅋ", "!?", "😀"]
+    rng = random.Random(42)
+
+    for _ in range(500):
+        text = "".join(rng.choices(chars, k=rng.randint(0, 40)))
+        strip = rng.random() < 0.5
+        ignore = rng.sample(ignores, rng.randint(0, 2))
+        native = kss_cython.split_sentences_fast(text, strip=strip, ignores=ignore)
+        assert native == _split_sentences_fast(text, strip=strip, ignores=tuple(ignore)), (text, strip, ignore)
+
+
+def test_split_sentences_fast_options():
+    split_sentences = Kss("split_sentences")
+    text = "  안녕하세요.  반갑습니다 그랬다. 오늘은 좋죠 "
+
+    assert split_sentences(text, backend="fast") == ["안녕하세요.", "반갑습니다", "그랬다.", "오늘은 좋죠"]
+    assert "".join(split_sentences(text, backend="fast", strip=False)) == text
+    assert split_sentences(text, backend="fast", ignores=["그랬다."]) == ["안녕하세요.", "반갑습니다", "그랬다. 오늘은 좋죠"]
+
+    sentences, morphemes = split_sentences("안녕하세요. 반갑습니다.", backend="fast", return_morphemes=True)
+    assert sentences == ["안녕하세요.", "반갑습니다."]
+    assert len(morphemes) != 0
+
+
+def test_backup_morphemes():
+    from kss._modules.sentences.sentence_processor import SentenceProcessor
+
+    processor = SentenceProcessor()
+    text = "메일은 kss@kss.com 으로 주세요 :) I'm fine"
+    morphemes = [(w, "X") for w in ["메일", "은", " ", "kss", "@", "kss", ".", "com", " ", "으로", " ", "주세요",
+                                    " ", ":)", " ", "I", "'", "m", " ", "fine"]]
+    output = processor.backup_morphemes(text, morphemes)
+
+    assert "".join(w for w, _ in output) == processor.backup(text)
+    assert [w for w, p in output if p == "SN"] == [
+        processor.backup(x) for x in ["kss@kss.com", ":)", "I'm"]
+    ]
+    assert processor.backup_morphemes("안녕", [("안녕", "NNG")]) == [("안녕", "NNG")]
@@ -1,3 +1,5 @@
+import pytest
+
 from kss import Kss
 
 
@@ -6,3 +8,138 @@ def test_correct_spacing():
     text = "아버지가방에들어가시다"
     output = correct_spacing(text)
     assert output == '아버지가 방에 들어가시다'
+
+
+def test_aho_corasick():
+    import random
+
+    from kss._elements.trie import AhoCorasick
+
+    rng = random.Random(0)
+    for _ in range(100):
+        words = ["".join(rng.choices("abc", k=rng.randint(1, 4))) for _ in range(rng.randint(0, 10))]
+        text = "".join(rng.choices("abcd", k=rng.randint(0, 30)))
+        expected = [(i, w) for i in range(len(text)) for w in set(words) if text.startswith(w, i)]
+        output = list(AhoCorasick(words).finditer(text))
+        assert sorted(output) == sorted(expected)
+        assert [i + len(w) for i, w in output] == sorted(i + len(w) for i, w in output)
+        assert AhoCorasick(words).findall(text) == {w for _, w in expected}
+
+
+def test_spacing_rule_index():
+    import random
+
+    from kss import RulePack
+    from kss._modules.spacing.utils import is_regex, sre_constants as c, sre_parse
+
+    def sample(parsed, rng):
+        # a string which is likely to be matched by the parsed pattern.
+        output = ""
+        for op, av in parsed:
+            if op is c.LITERAL:
+                output += chr(av)
+            elif op is c.SUBPATTERN:
+                output += sample(av[-1], rng)
+            elif op is c.BRANCH:
+                output += sample(rng.choice(av[1]), rng)
+            elif op in (c.MAX_REPEAT, c.MIN_REPEAT):
+                output += "".join(sample(av[2], rng) for _ in range(rng.randint(av[0], min(av[1], av[0] + 2))))
+            elif op is c.IN:
+                items = [(_op, _av) for _op, _av in av if _op in (c.LITERAL, c.RANGE)]
+                if len(items) == len(av):
+                    _op, _av = rng.choice(items)
+                    output += chr(_av) if _op is c.LITERAL else chr(rng.randint(*_av))
+                else:
+                    output += "1" if (c.CATEGORY, c.CATEGORY_DIGIT) in av else "가"
+            elif op is c.ANY:
+                output += "가"
+        return output
+
+    # the cases which match a text must be the candidates of it.
+    pack = RulePack()
+    rng = random.Random(0)
+    num_matches = 0
+    for rule_idx, rule in enumerate(pack.table):
+        for cs_idx, case in enumerate(rule):
+            if is_regex(case[3]):
+                text = "이 " + sample(sre_parse.parse(case[3]), rng) + " 다"
+                if pack._pattern(case[3]).search(text):
+                    num_matches += 1
+                    assert (rule_idx, cs_idx) in pack.candidate_cases(text), case[3]
+                    if num_matches % 20 == 0:
+                        assert pack.postprocess(text, []) == pack.postprocess(text, [], use_index=False)
+
+    assert num_matches > 1000
+
+
+def test_rule_pack(tmp_path):
+    import pickle
+
+    from kss import RulePack
+
+    correct_spacing = Kss("correct_spacing")
+    text = "아버지가방에들어가시다"
+    names = RulePack().names[:3]
+
+    pack = RulePack(names)
+    assert pack.names == names and len(pack) == 3
+    assert len(pickle.loads(pickle.dumps(pack)).table) == len(pack.table)
+
+    path = str(tmp_path / "rules.pkl")
+    pack.save(path)
+    loaded = RulePack.load(path)
+    assert loaded.names == names and loaded.requirements == pack.requirements
+
+    expected = correct_spacing(text, rules=names)
+    assert correct_spacing(text, rules=path) == expected
+    assert correct_spacing(text, rules=pack) == expected
+    assert correct_spacing([text, text], rules=path, num_workers=2) == [expected, expected]
+
+    with pytest.raises(ValueError):
+        correct_spacing(text, rules=["not a rule"])
+    with pytest.raises(ValueError):
+        correct_spacing(text, rules=str(tmp_path / "not_exists.pkl"))
+
+
+def test_correct_spacing_analyzes_once():
+    from kss._modules.morphemes.cache import clear_analysis_cache, analysis_cache_info
+
+    correct_spacing = Kss("correct_spacing")
+    text = "아버지가방에들어가시다.https://github.com/hyunwoongko/kss 에서봤어요"
+
+    clear_analysis_cache()
+    output, morphemes = correct_spacing(text, return_morphemes=True)
+    assert analysis_cache_info()["misses"] == 1
+    assert output.startswith("아버지가 방에 들어가시다. ") and output.endswith("에서 봤어요")
+    assert "".join(w for w, _ in morphemes) == output
+
+    # pre-split sentences are not split again.
+    assert correct_spacing(" 아버지가방에들어가시다 ", split_sentences=False) == "아버지가 방에 들어가시다"
+
+
+def test_spacing_profile():
+    import kss
+    import pytest
+
+    kss.clear_spacing_profile()
+    kss.correct_spacing("아버지가방에들어가시다", num_workers=1)
+    assert all(stats["evaluations"] == 0 for stats in kss.spacing_profile().values())
+
+    kss.enable_spacing_profile()
+    try:
+        kss.correct_spacing(["이 책 은 우리 나라 에서 만들었다", "사과,배,1,000원"], num_workers=1)
+    finally:
+        kss.disable_spacing_profile()
+
+    profile = kss.spacing_profile(sort_by="matches")
+    assert list(profile["heuristic_comma"].keys()) == ["evaluations", "matches", "skips", "time"]
+    assert profile["heuristic_comma"]["evaluations"] == 2 and profile["heuristic_comma"]["matches"] == 1
+    assert sum(stats["matches"] for stats in profile.values()) > 1
+    assert any(stats["evaluations"] == 0 for stats in profile.values())
+    assert len(kss.spacing_profile(top=3)) == 3
+
+    kss.clear_spacing_profile()
+    assert all(stats["time"] == 0 for stats in kss.spacing_profile().values())
+
+    with pytest.raises(ValueError):
+        kss.spacing_profile(sort_by="name")